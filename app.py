@@ -1,148 +1,269 @@
 import streamlit as st
 import pandas as pd
-import hashlib
-import os
-import io
-import requests
-import base64
+import numpy as np
+from github_client import GitHubClient, GitHubError
+from github_cache import GitHubCSVCache
+from write_queue import GitHubWriteQueue
+from ratings_log import GitHubRatingsLog
+from search_index import SearchIndex
+from posters import PosterService
+from recommender import Recommender
+from storage import RATING_COLUMNS, CSVStorage, migrate_csv_to_sqlite
+from profiling import Profiler
+from catalog import Catalog, typed_frame
+from rating_stats import top_k
+from startup import StartupLoader
+from user_directory import UserDirectory
+from shared_ratings import SharedRatings
+import uuid
+import render
 
 st.set_page_config(page_title="영화 추천 시스템", layout="wide")
 GITHUB_TOKEN = st.secrets["GITHUB_TOKEN"]
+GITHUB_API_URL = st.secrets.get("GITHUB_API_URL", "https://api.github.com/repos/Duke011223/streamlit-movie/contents")
+GITHUB_CACHE_TTL = float(st.secrets.get("GITHUB_CACHE_TTL", 30))  # 초 단위, 이 시간 동안은 재요청하지 않음
+GITHUB_WRITE_WINDOW = float(st.secrets.get("GITHUB_WRITE_WINDOW", 2))  # 초 단위, 이 시간 동안의 변경을 한 커밋으로 묶음
+RATINGS_COMPACT_EVERY = int(st.secrets.get("RATINGS_COMPACT_EVERY", 50))  # 평점 로그 세그먼트가 이만큼 쌓이면 스냅샷으로 압축
+POSTER_FOLDER = 'poster_url'
+STORAGE_BACKEND = st.secrets.get("STORAGE_BACKEND", "sqlite")  # "sqlite" 또는 "csv"
+PROFILE_TRACE_PATH = st.secrets.get("PROFILE_TRACE_PATH")  # 설정하면 rerun마다 단계별 시간을 JSON lines로 기록
+STARTUP_WORKERS = int(st.secrets.get("STARTUP_WORKERS", 4))  # 시작 시 동시 로드 스레드 수, 0이면 순차 로드
+RATINGS_REFRESH_INTERVAL = float(st.secrets.get("RATINGS_REFRESH_INTERVAL", GITHUB_CACHE_TTL))  # 초 단위, 공유 평점을 백그라운드에서 다시 확인하는 간격
 st.write("GitHub Token:", GITHUB_TOKEN)
 
-# GitHub에서 movie_users.csv 읽기
-def fetch_user_csv_from_github():
-    url = f"https://api.github.com/repos/Duke011223/streamlit-movie/contents/movie_users.csv"
-    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
-    response = requests.get(url, headers=headers)
-
-    if response.status_code == 200:
-        content = base64.b64decode(response.json()["content"]).decode("utf-8")
-        sha = response.json()["sha"]
-        return pd.read_csv(io.StringIO(content), encoding="utf-8"), sha
-    else:
-        st.error(f"GitHub에서 데이터를 가져올 수 없습니다. 상태 코드: {response.status_code}")
+# 단계별 실행 시간 측정 (프로세스 전체 공유)
+@st.cache_resource
+def get_profiler():
+    return Profiler(trace_path=PROFILE_TRACE_PATH)
+
+# GitHub 호출마다 시간 기록
+def record_github_call(method, path, status_code, seconds):
+    if "/" in path:
+        path = path.rsplit("/", 1)[0] + "/*"  # 평점 로그 세그먼트는 디렉터리 단위로 묶음
+    get_profiler().record(f"github {method} {path}", seconds)
+
+# 모든 GitHub 호출이 공유하는 클라이언트 (커넥션 풀, 타임아웃, 재시도)
+@st.cache_resource
+def get_github_client():
+    return GitHubClient(GITHUB_API_URL, GITHUB_TOKEN, on_request=record_github_call)
+
+# 세션 간에 공유되는 GitHub CSV 캐시
+@st.cache_resource
+def get_github_cache():
+    return GitHubCSVCache(get_github_client(), ttl=GITHUB_CACHE_TTL)
+
+# GitHub CSV 로드 결과 받기 (오류는 메시지 출력 후 빈 DataFrame)
+def fetch_csv_from_github(future, error_message):
+    try:
+        return future.result()
+    except GitHubError as e:
+        st.error(f"{error_message} {e.detail}")
         return pd.DataFrame(), None
 
-# GitHub에 movie_users.csv 저장
-def update_user_csv_to_github(df, sha):
-    url = f"https://api.github.com/repos/Duke011223/streamlit-movie/contents/movie_users.csv"
-    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
-    content = df.to_csv(index=False, encoding="utf-8")
-    data = {
-        "message": "Update movie_users.csv",
-        "content": base64.b64encode(content.encode("utf-8")).decode("utf-8"),
-        "sha": sha,
-    }
-    response = requests.put(url, json=data, headers=headers)
-    if response.status_code == 200:
-        st.success("GitHub에 사용자 정보가 성공적으로 업데이트되었습니다.")
-    else:
-        st.error(f"GitHub 업데이트 실패. 상태 코드: {response.status_code}")
-        
-# GitHub에서 movie_ratings.csv 읽기
-def fetch_rating_csv_from_github():
-    url = f"https://api.github.com/repos/Duke011223/streamlit-movie/contents/movie_ratings.csv"
-    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
-    response = requests.get(url, headers=headers)
-
-    if response.status_code == 200:
-        content = base64.b64decode(response.json()["content"]).decode("utf-8")
-        sha = response.json()["sha"]
-        return pd.read_csv(io.StringIO(content), encoding="utf-8"), sha
-    else:
-        st.error(f"GitHub에서 movie_ratings.csv를 가져올 수 없습니다. 상태 코드: {response.status_code}")
-        return pd.DataFrame(), None
+# 평점 변경 로그 (스냅샷 ratings_snapshot/ 조각, 처음 압축 전에는 movie_ratings.csv + ratings_log/ 세그먼트)
+@st.cache_resource
+def get_ratings_log():
+    return GitHubRatingsLog(
+        get_github_client(), get_github_cache(), ttl=GITHUB_CACHE_TTL, compact_every=RATINGS_COMPACT_EVERY
+    )
+
+# GitHub 쓰기 큐 (변경을 모아 백그라운드에서 한 번에 커밋)
+@st.cache_resource
+def get_write_queue():
+    return GitHubWriteQueue(
+        get_github_client(), get_github_cache(), window=GITHUB_WRITE_WINDOW,
+        logs={"movie_ratings.csv": get_ratings_log()},
+    )
 
-# GitHub에 movie_ratings.csv 저장
-def update_rating_csv_to_github(df, sha):
-    url = f"https://api.github.com/repos/Duke011223/streamlit-movie/contents/movie_ratings.csv"
-    headers = {"Authorization": f"token {GITHUB_TOKEN}"}
-    content = df.to_csv(index=False, encoding="utf-8")
-    data = {
-        "message": "Update movie_ratings.csv",
-        "content": base64.b64encode(content.encode("utf-8")).decode("utf-8"),
-        "sha": sha,
-    }
-    response = requests.put(url, json=data, headers=headers)
-    if response.status_code == 200:
-        st.success("GitHub에 movie_ratings.csv가 성공적으로 업데이트되었습니다.")
-    else:
-        st.error(f"GitHub 업데이트 실패. 상태 코드: {response.status_code}")
+# GitHub에서 movie_users.csv 읽기
+def fetch_user_csv_from_github(future):
+    return fetch_csv_from_github(future, "GitHub에서 데이터를 가져올 수 없습니다.")
 
-# CSV 파일 로드
-@st.cache_data
-def load_data():
+# movie_users.csv 사용자 추가/수정 접수
+def queue_user_update(user):
+    get_write_queue().submit("movie_users.csv", "upsert", user)
+
+# GitHub에서 평점 읽기 결과 받기 (스냅샷 + 로그 세그먼트 병합, 오류는 메시지 출력 후 다음 rerun에서 다시 시도)
+# future가 None이면 이번 rerun에서는 다시 읽지 않음 (백그라운드 갱신)
+def fetch_ratings_from_github(shared, future):
+    try:
+        if future is not None:
+            future.result()
+    except GitHubError as e:
+        st.error(f"GitHub에서 movie_ratings.csv를 가져올 수 없습니다. {e.detail}")
+        if shared.version is None:
+            # 처음 한 번은 로컬 저장소의 평점으로 구성 (GitHub을 다시 읽을 수 있게 되면 백그라운드 갱신에서 교체)
+            shared.refresh(lambda: (pd.DataFrame(load_ratings(), columns=RATING_COLUMNS), "local"))
+    return shared
+
+# 평점 추가/수정/삭제 접수 (로그 세그먼트로 기록), 변경 번호 반환
+def queue_rating_change(op, rating):
+    return get_write_queue().submit("movie_ratings.csv", op, rating)
+
+# 영화 목록 로드 (타입이 정리된 읽기 전용 구조, 복사 없이 모든 세션이 공유)
+@st.cache_resource
+def load_catalog():
     try:
         df = pd.read_csv("movie_data.csv", encoding='utf-8')  # 'cp949'를 'utf-8'로 변경
-        df.columns = df.columns.str.strip().str.lower()
-        return df
+        return Catalog(typed_frame(df))
     except Exception as e:
         st.error(f"데이터 로드 오류: {e}")
-        return pd.DataFrame()
-
-def save_users(users):
-    pd.DataFrame(users).to_csv("movie_users.csv", index=False, encoding='cp949')
+        return Catalog(pd.DataFrame())
+
+# 제목/장르/감독/배우 검색 인덱스 (영화 데이터 로드 시 한 번만 생성)
+@st.cache_resource
+def load_search_index():
+    return SearchIndex(load_catalog())
+
+# 포스터 썸네일 서비스 (폴더 스캔 1회, 디스크/메모리 썸네일 캐시)
+@st.cache_resource
+def get_poster_service():
+    return PosterService(POSTER_FOLDER, width=200)
+
+# 포스터 썸네일 출력
+def show_poster(poster_url):
+    with get_profiler().phase("poster"):
+        thumbnail = get_poster_service().thumbnail(poster_url)
+    if thumbnail is not None:
+        st.image(thumbnail, width=200)  # 이미지 표시
+    else:
+        st.write("포스터 이미지가 없습니다.")  # 이미지가 없을 경우 메시지 출력
+
+# 영화 리뷰 목록 (최신순/평점순, 처음 page_size개만 그리고 "리뷰 더 보기"로 늘림)
+def show_reviews(reviews, title, key, line, page_size=5):
+    total = reviews.movie_count(title)
+    order = "recent"
+    if total > 1:
+        orders = {"최신순": "recent", "평점순": "rating"}
+        order = orders[st.radio("리뷰 정렬", list(orders), horizontal=True, key=f"{key}-order")]
+    shown = st.session_state.get(f"{key}-shown", page_size)
+    st.markdown(render.review_list([line(r) for r in reviews.movie_reviews(title, order, 0, shown)]))
+    if total > shown:
+        st.button(
+            f"리뷰 더 보기 ({shown}/{total})", key=f"{key}-more",
+            on_click=st.session_state.__setitem__, args=(f"{key}-shown", shown + page_size),
+        )
+
+# 로컬 사용자/평점 저장소 (기본은 SQLite, 처음 실행 시 기존 CSV에서 가져옴)
+@st.cache_resource
+def get_storage():
+    if STORAGE_BACKEND == "csv":
+        return CSVStorage("movie_users.csv", "movie_ratings.csv")
+    return migrate_csv_to_sqlite("movie.db", "movie_users.csv", "movie_ratings.csv")
 
 def load_users():
-    path = "movie_users.csv"
-    if os.path.exists(path):
-        return pd.read_csv(path, encoding='cp949').to_dict('records')
-    return []
+    return get_storage().load_users()
 
-def save_ratings(ratings):
-    pd.DataFrame(ratings).to_csv("movie_ratings.csv", index=False, encoding="utf-8")
+def save_user(user):
+    get_storage().upsert_user(user)
 
 def load_ratings():
-    path = "movie_ratings.csv"
-    if os.path.exists(path):
-        return pd.read_csv(path, encoding="utf-8").to_dict("records")
-    return []
+    return get_storage().load_ratings()
+
+def save_rating(rating):
+    get_storage().upsert_rating(rating)
 
-def hash_password(password):
-    return hashlib.sha256(password.encode()).hexdigest()
+def delete_rating(rating):
+    get_storage().delete_rating(rating['username'], rating['movie'])
+
+# 평점 변경을 로컬 저장소와 GitHub에 함께 반영, 쓰기 큐의 변경 번호 반환
+def sync_rating(op, rating):
+    if op == "delete":
+        delete_rating(rating)
+    else:
+        save_rating(rating)
+    return queue_rating_change(op, rating)
+
+# 세션 간에 공유되는 평점 저장소와 영화별 통계 (GitHub 버전이 바뀌면 백그라운드에서 교체)
+@st.cache_resource
+def get_shared_ratings():
+    shared = SharedRatings(
+        get_ratings_log().load, load_catalog, on_change=sync_rating,
+        committed=get_write_queue().committed, interval=RATINGS_REFRESH_INTERVAL,
+        recommender=Recommender,  # 협업 필터링 추천 엔진 (평점 버전이 바뀌면 갱신 스레드에서 재학습해 교체)
+    )
+    shared.start()
+    return shared
+
+# 사용자 변경을 로컬 저장소와 GitHub에 함께 반영
+def sync_user(user):
+    save_user(user)
+    queue_user_update(user)
+
+# 사용자명으로 찾는 사용자 디렉터리 (프로세스 전체 공유)
+@st.cache_resource
+def get_user_directory():
+    return UserDirectory(on_change=sync_user)
+
+# GitHub 사용자 목록이 바뀌었으면 디렉터리에 반영 (GitHub을 읽지 못하면 처음 한 번은 로컬 저장소 사용)
+def refresh_user_directory(directory, future):
+    user_df, user_sha = fetch_user_csv_from_github(future)
+    if user_df.empty:
+        if directory.version is None:
+            directory.refresh(load_users(), version="local")
+    elif user_sha != directory.version:
+        directory.refresh(user_df.to_dict('records'), version=user_sha)
+
+# 시작 시 GitHub 읽기용 스레드 풀 (프로세스 전체 공유)
+@st.cache_resource
+def get_startup_loader():
+    return StartupLoader(STARTUP_WORKERS)
+
+# GitHub 읽기(사용자 목록, 공유 평점은 처음이거나 새로고침할 때만)를 스레드 풀에서 시작
+# 영화 목록/검색 인덱스/포스터처럼 프로세스 캐시에 있는 값은 스크립트 스레드에서 바로 읽음
+def start_loading(refresh_ratings=False):
+    loader = get_startup_loader()
+    users = loader.submit(get_github_cache().fetch, "movie_users.csv")
+    shared = get_shared_ratings()  # 처음이면 영화 목록 로드 (사용자 목록 요청과 겹침)
+    return {
+        "users": users,
+        "shared": shared,
+        "ratings": loader.submit(shared.refresh) if refresh_ratings or shared.version is None else None,
+    }
 
 def main():
     # 전역 변수 설정
     global ratings_sha
+    profiler = get_profiler()
     
     # 앱 제목
     st.title("🎬 영화 추천 및 검색 시스템")
     
-    # GitHub에서 사용자 정보 및 평점 정보 로드
-    user_df, user_sha = fetch_user_csv_from_github()
-    if user_df.empty:
-        user_df = pd.DataFrame(columns=["username", "password", "role"])
-    
-    # GitHub에서 평점 정보 로드
-    ratings_df, ratings_sha = fetch_rating_csv_from_github()
-    if ratings_df.empty:
-        ratings_df = pd.DataFrame(columns=["username", "movie", "rating", "review"])
-        ratings = []  # 평점 정보 초기화
-    else:
-        ratings = ratings_df.to_dict('records')  # 데이터 변환
-    
-    # 새로고침 버튼: 캐시 무효화 및 데이터 새로 고침
-    if st.button("새로고침"):
-        st.cache_data.clear()  # 캐시를 삭제
-        df = load_data()  # 최신 데이터 로드
-        st.success("데이터가 새로 고침되었습니다.")
-    else:
-        df = load_data()  # 캐시된 데이터 사용
-
-    # 사용자 및 평점 로컬 데이터 로드
-    users = load_users()
+    # 새로고침 버튼: 캐시 무효화 (로드를 시작하기 전에 처리)
+    refreshed = st.button("새로고침")
+    if refreshed:
+        load_catalog.clear()  # 캐시를 삭제
+        load_search_index.clear()
+        get_poster_service().rescan()
+        get_github_cache().invalidate()
+        get_ratings_log().invalidate()  # 공유 평점은 아래 로드에서 다시 확인
+
+    # GitHub 사용자/평점 읽기를 먼저 시작 (평점은 영화 목록을 먼저 그린 뒤 기다림)
+    with profiler.phase("start_loading"):
+        loading = start_loading(refresh_ratings=refreshed)
+
+    with profiler.phase("load_data"):
+        catalog = load_catalog()  # 최신 데이터 로드
+        df = catalog.frame
+        if refreshed:
+            st.success("데이터가 새로 고침되었습니다.")
+    with profiler.phase("search_index"):
+        search_index = load_search_index()
+
+    # 사용자 디렉터리 (처음 한 번만 GitHub 사용자 목록을 기다려 구성)
+    with profiler.phase("load_users"):
+        users = get_user_directory()
+        users_refreshed = users.version is None
+        if users_refreshed:
+            refresh_user_directory(users, loading["users"])
     
     # 세션 상태 초기화
     if 'user' not in st.session_state:
         st.session_state.user = None
         st.session_state.role = None
 
-    # 포스터 경로 설정
-    poster_folder = 'poster_url'
-
     # 사이드바: 사용자 인증 처리
-    with st.sidebar:
+    with st.sidebar, profiler.phase("sidebar"):
         st.header("👤 사용자 인증")
         if st.session_state.user:
             st.write(f"환영합니다, **{st.session_state.user}님!**")
@@ -156,7 +277,7 @@ def main():
                 username = st.text_input("사용자명")
                 password = st.text_input("비밀번호", type="password")
                 if st.button("로그인"):
-                    user = next((u for u in users if u['username'] == username and u['password'] == hash_password(password)), None)
+                    user = users.authenticate(username, password)
                     if user:
                         st.session_state.user = username
                         st.session_state.role = user['role']
@@ -167,18 +288,9 @@ def main():
                 new_username = st.text_input("새 사용자명")
                 new_password = st.text_input("새 비밀번호", type="password")
                 if st.button("회원가입"):
-                    if any(u['username'] == new_username for u in users):
+                    if new_username in users or users.add(new_username, users.hash_password(new_password)) is None:
                         st.error("이미 존재하는 사용자명입니다.")
                     else:
-                        new_user = {
-                            "username": new_username,
-                            "password": hash_password(new_password),
-                            "role": "user",
-                        }
-                        users.append(new_user)
-                        user_df = pd.concat([user_df, pd.DataFrame([new_user])], ignore_index=True)
-                        update_user_csv_to_github(user_df, user_sha)
-                        save_users(users)
                         st.success("회원가입 성공! 이제 로그인할 수 있습니다.")
         st.markdown("---")
     
@@ -186,105 +298,103 @@ def main():
     tab1, tab2, tab3, tab4, tab5 = st.tabs(["📚 영화 검색", "⭐ 추천 영화", "📈 나의 활동", "🔧 사용자 계정 관리", "👑 관리자 보기"])
 
     # 영화 검색
-    with tab1:
+    with tab1, profiler.phase("tab_search"):
         st.header("🎥 영화 검색")
-        search_term = st.text_input("🔍 검색", placeholder="영화 제목을 입력하세요...")
-        genre_filter = st.selectbox("🎭 장르 필터", options=["모든 장르"] + df['genre'].unique().tolist())
-
-        # 필터링 및 페이지네이션
-        filtered_df = df[df['title'].str.contains(search_term, case=False)]
-        if genre_filter != "모든 장르":
-            filtered_df = filtered_df[filtered_df['genre'] == genre_filter]
+        search_field = st.radio("검색 기준", ["제목", "감독", "배우"], horizontal=True)
+        search_term = st.text_input("🔍 검색", placeholder="영화 제목을 입력하세요... (초성 검색 가능)")
+        genre_filter = st.selectbox("🎭 장르 필터", options=["모든 장르"] + search_index.genre_options())
+
+        # 필터링 및 페이지네이션 (검색 인덱스의 집합 교집합으로 조회)
+        search_args = {"제목": "title", "감독": "director", "배우": "actor"}
+        matched_rows = search_index.search(
+            genre=genre_filter if genre_filter != "모든 장르" else None,
+            **{search_args[search_field]: search_term},
+        )
+        filtered_df = df.iloc[matched_rows]
+        rating_slots = []
 
         total_movies = len(filtered_df)
         if total_movies == 0:
             st.warning("검색 결과가 없습니다.")
         else:
-            page_size = 5
-            total_pages = (total_movies // page_size) + (1 if total_movies % page_size != 0 else 0)
-            page = st.number_input("페이지 번호", min_value=1, max_value=total_pages, value=1)
-
-            start_idx = (page - 1) * page_size
-            end_idx = min(page * page_size, total_movies)
+            # 현재 페이지의 영화만 레코드로 만들어 렌더링
+            start_idx, end_idx = render.paginate(total_movies, page_size=5, key="movie-page")
 
-            for _, movie in filtered_df.iloc[start_idx:end_idx].iterrows():
+            for movie in render.page_records(filtered_df, start_idx, end_idx):
                 st.subheader(movie['title'])
-
-                # 영화 데이터에서 포스터 파일 경로 추출
-                poster_path = os.path.join(poster_folder, movie.get('poster_url', ''))
-                if os.path.exists(poster_path) and pd.notna(movie.get('poster_url')):
-                    st.image(poster_path, width=200)  # 이미지 표시
-                else:
-                    st.write("포스터 이미지가 없습니다.")  # 이미지가 없을 경우 메시지 출력
-
-                # 영화 정보 출력
-                st.write(f"**영화 ID**: {movie['movie_id']}")
-                st.write(f"**제작사**: {movie['distributor']}")
-                st.write(f"**감독**: {movie['director']}")
-                st.write(f"**배우**: {movie['actor']}")
-                st.write(f"**장르**: {movie['genre']}")
-                st.write(f"**개봉일**: {movie['release_date']}")
-
-                running_time = movie.get('running_time', '정보 없음')
-                if running_time != '정보 없음':
-                    try:
-                        running_time = int(running_time)
-                        st.write(f"**상영 시간**: {running_time}분")
-                    except ValueError:
-                        st.write("**상영 시간**: 정보 없음")
-                else:
-                    st.write(f"**상영 시간**: {running_time}분")
-
-                st.write(f"**영화 평점**: {movie['rating']}")
-                st.write(f"**현재 상태**: {movie['running_state']}")
+                poster_col, info_col = st.columns([1, 3])
+
+                # 영화 데이터의 포스터 파일명으로 썸네일 출력
+                with poster_col:
+                    show_poster(movie.get('poster_url'))
+
+                # 영화 정보 출력 (하나의 마크다운 블록)
+                with info_col:
+                    st.markdown(render.movie_card([
+                        ("영화 ID", movie['movie_id']),
+                        ("제작사", movie['distributor']),
+                        ("감독", movie['director']),
+                        ("배우", movie['actor']),
+                        ("장르", movie['genre']),
+                        ("개봉일", movie['release_date']),
+                        ("상영 시간", render.format_running_time(movie.get('running_time'))),
+                        ("영화 평점", movie['rating']),
+                        ("현재 상태", movie['running_state']),
+                    ]))
+
+                # 평점/리뷰 자리 (평점 데이터가 도착하면 채움)
+                rating_slot = st.empty()
+                rating_slot.caption("⏳ 평점과 리뷰를 불러오는 중...")
+                rating_slots.append((rating_slot, movie))
                 st.markdown("---")
-
-                # 영화에 대한 평점 표시
-                movie_ratings = [r['rating'] for r in ratings if r['movie'] == movie['title']]
-                if movie_ratings:
-                    avg_rating = round(sum(movie_ratings) / len(movie_ratings), 2)
-                    st.write(f"사이트 평점: {'⭐' * int(avg_rating)} ({avg_rating}/10)")
-                else:
-                    st.write("아직 평점이 없습니다.")
-
-                movie_reviews = [r['review'] for r in ratings if r['movie'] == movie['title'] and r.get('review') is not None]
-                if movie_reviews:
-                    st.write("리뷰:")
-                    for review in movie_reviews:
-                        st.write(f"- {review}")
-                else:
-                    st.write("아직 리뷰가 없습니다.")
+    profiler.mark("first_render")
+
+    # GitHub에서 사용자 정보 로드 (영화 목록을 그리는 동안 받아 둔 결과)
+    with profiler.phase("fetch_users"):
+        if not users_refreshed:
+            refresh_user_directory(users, loading["users"])
+
+    # 공유 평점 저장소 (세션마다 평점을 받거나 인덱스를 만들지 않고, 이번 rerun 동안 같은 저장소를 사용)
+    with profiler.phase("fetch_ratings"):
+        shared_ratings = fetch_ratings_from_github(loading["shared"], loading["ratings"])
+    store = shared_ratings.store
+    rating_stats = store.stats
+    ratings_sha = shared_ratings.version
+    recommender = shared_ratings.recommender
+
+    # 영화 검색 결과의 평점 및 리뷰 채우기
+    with tab1, profiler.phase("tab_search_ratings"):
+        for rating_slot, movie in rating_slots:
+            with rating_slot.container():
+                # 영화에 대한 평점 및 리뷰 표시
+                st.markdown(render.star_rating(store.movie_average(movie['title'])))
+                show_reviews(store.reviews, movie['title'], f"reviews-{movie['movie_id']}", lambda r: r['review'])
 
                 if st.session_state.user:
-                    if any(r['username'] == st.session_state.user and r['movie'] == movie['title'] for r in ratings):
+                    if store.has_rated(st.session_state.user, movie['title']):
                         st.info("이미 이 영화에 평점과 리뷰를 남겼습니다.")
-                    else:
-                        # 개별 평점 입력
-                        rating = st.number_input(
-                            f"평점을 선택하세요 ({movie['title']})", 
-                            min_value=0.0, max_value=10.0, step=0.1, format="%.2f"
-                        )
-                        # 리뷰 입력
-                        review = st.text_area(
-                            f"리뷰를 작성하세요 ({movie['title']})", 
-                            placeholder="영화를 보고 느낀 점을 적어보세요..."
-                        )
-
-                        # 평점 및 리뷰 저장 버튼
-                        if st.button(f"'{movie['title']}' 평점 및 리뷰 남기기", key=f"rate-review-{movie['title']}"):
-                            ratings.append({
-                                'username': st.session_state.user, 
-                                'movie': movie['title'], 
-                                'rating': round(rating, 2),
-                                'review': review if review else None
-                            })
-                            ratings_df = pd.DataFrame(ratings)
-                            update_rating_csv_to_github(ratings_df, ratings_sha)
-                            st.success("평점과 리뷰가 저장되었습니다.")
-
+                    # 평점 입력 위젯은 사용자가 열었을 때만 생성
+                    elif st.toggle("평점 남기기", key=f"rate-open-{movie['movie_id']}"):
+                        with st.form(key=f"rate-form-{movie['movie_id']}"):
+                            # 개별 평점 입력
+                            rating = st.number_input(
+                                f"평점을 선택하세요 ({movie['title']})", 
+                                min_value=0.0, max_value=10.0, step=0.1, format="%.2f"
+                            )
+                            # 리뷰 입력
+                            review = st.text_area(
+                                f"리뷰를 작성하세요 ({movie['title']})", 
+                                placeholder="영화를 보고 느낀 점을 적어보세요..."
+                            )
+
+                            # 평점 및 리뷰 저장 버튼
+                            if st.form_submit_button(f"'{movie['title']}' 평점 및 리뷰 남기기"):
+                                # 공유 저장소에 추가 (추천 모델 반영, 로컬 저장 + GitHub 쓰기 큐 접수 포함)
+                                shared_ratings.append(st.session_state.user, movie['title'], round(rating, 2), review)
+                                st.success("평점과 리뷰가 저장되었습니다.")
 
     # 추천 영화
-    with tab2:
+    with tab2, profiler.phase("tab_recommend"):
         st.header("⭐ 추천 영화")
 
         if not st.session_state.user:
@@ -293,112 +403,138 @@ def main():
             # 추천 기준 선택
             recommendation_type = st.selectbox(
                 "추천 기준을 선택하세요",
-                ["가장 많은 리뷰 수", "가장 높은 평점", "사용자 별 점 평균 순"]
+                ["나를 위한 추천", "가장 많은 리뷰 수", "가장 높은 평점", "사용자 별 점 평균 순"]
             )
 
-            # 영화별 리뷰 및 평점 데이터 처리
-            movie_review_counts = {}
-            movie_rating_sums = {}
-            movie_rated_users = {}
-
-            for r in ratings:
-                movie = r['movie']
-                movie_review_counts[movie] = movie_review_counts.get(movie, 0) + (1 if r.get('review') else 0)
-                movie_rating_sums[movie] = movie_rating_sums.get(movie, 0) + r['rating']
-                movie_rated_users[movie] = movie_rated_users.get(movie, 0) + 1
-
-            # 영화 데이터와 리뷰 데이터 병합
-            df['review_count'] = df['title'].map(movie_review_counts).fillna(0).astype(int)
-            df['total_rating'] = df['title'].map(movie_rating_sums).fillna(0.0)
-            df['user_count'] = df['title'].map(movie_rated_users).fillna(0).astype(int)
-            df['avg_star_rating'] = (df['total_rating'] / df['user_count']).fillna(0.0)
-
-            # 추천 정렬 기준에 따라 정렬
-            if recommendation_type == "가장 많은 리뷰 수":
-                recommended_movies = df.sort_values(by='review_count', ascending=False)
+            top_n = 5  # 추천 영화 개수
+
+            # 추천 기준별 상위 영화 (영화별 통계 테이블에서 부분 정렬)
+            if recommendation_type == "나를 위한 추천":
+                # 내 평점과 비슷하게 평가된 영화 (평점이 적으면 장르/감독/배우 유사도 함께 사용)
+                recommended_rows = recommender.recommend(st.session_state.user, n=top_n)
+            elif recommendation_type == "가장 많은 리뷰 수":
+                recommended_rows = rating_stats.top_k("review_count", top_n)
             elif recommendation_type == "가장 높은 평점":
-                recommended_movies = df.sort_values(by='rating', ascending=False)
+                recommended_rows = top_k(df['rating'].to_numpy(dtype=float, na_value=np.nan), top_n)
             elif recommendation_type == "사용자 별 점 평균 순":
-                recommended_movies = df.sort_values(by='avg_star_rating', ascending=False)
+                # 평점 수가 적은 영화가 앞서지 않도록 베이지안 평균 사용
+                recommended_rows = rating_stats.top_k("bayesian_mean", top_n)
+            recommended_movies = df.iloc[recommended_rows]
 
             # 추천 영화 출력
-            top_n = 1  # 추천 영화 개수
-            for _, movie in recommended_movies.head(top_n).iterrows():
+            for movie in render.page_records(recommended_movies, 0, top_n):
                 st.subheader(movie['title'])
+                poster_col, info_col = st.columns([1, 3])
 
                 # 포스터 출력
-                poster_path = os.path.join(poster_folder, movie.get('poster_url', ''))
-                if os.path.exists(poster_path) and pd.notna(movie.get('poster_url')):
-                    st.image(poster_path, width=200)
-                else:
-                    st.write("포스터 이미지가 없습니다.")
+                with poster_col:
+                    show_poster(movie.get('poster_url'))
 
                 # 영화 정보 출력
-                st.write(f"**평점**: {movie['rating']}")
-                st.write(f"**장르**: {movie['genre']}")
-                st.write(f"**상영 시간**: {movie.get('running_time', '정보 없음')}")
-                st.write(f"**개봉일**: {movie['release_date']}")
-                st.write(f"**리뷰 수**: {movie['review_count']}개")
-                st.write(f"**사용자 평균 별 점수**: {round(movie['avg_star_rating'], 2)}")
+                with info_col:
+                    st.markdown(render.movie_card([
+                        ("평점", movie['rating']),
+                        ("장르", movie['genre']),
+                        ("상영 시간", render.format_running_time(movie.get('running_time'))),
+                        ("개봉일", movie['release_date']),
+                        ("리뷰 수", f"{store.movie_review_count(movie['title'])}개"),
+                        ("사용자 평균 별 점수", round(store.movie_average(movie['title']) or 0.0, 2)),
+                    ]))
 
                 # 사용자 리뷰 출력
-                movie_reviews = [
-                    (r['username'], r['review']) for r in ratings 
-                    if r['movie'] == movie['title'] and r.get('review') is not None
-                ]
-                if movie_reviews:
-                    st.write("리뷰:")
-                    for username, review in movie_reviews:
-                        st.write(f"- **{username}**: {review}")
-                else:
-                    st.write("아직 리뷰가 없습니다.")
+                show_reviews(
+                    store.reviews, movie['title'], f"recommend-reviews-{movie['movie_id']}",
+                    lambda r: f"**{r['username']}**: {r['review']}",
+                )
                 st.markdown("---")
 
 
     # 나의 활동
-    with tab3:
+    with tab3, profiler.phase("tab_activity"):
         st.header("📈 나의 활동")
         if st.session_state.user:
-            user_reviews = [r for r in ratings if r['username'] == st.session_state.user]
+            user_reviews = store.user_ratings(st.session_state.user)
             if user_reviews:
                 st.write("내가 남긴 리뷰:")
                 for review in user_reviews:
-                    st.write(f"- **영화**: {review['movie']}, **평점**: {review['rating']}, **리뷰**: {review.get('review', '없음')}")
+                    st.write(f"- **영화**: {review['movie']}, **평점**: {review['rating']}, **리뷰**: {review['review'] or '없음'}")
             else:
                 st.write("아직 리뷰를 작성하지 않았습니다.")
         else:
             st.warning("로그인 후 활동을 확인할 수 있습니다.")
     # 사용자 계정 관리
-    with tab4:
+    with tab4, profiler.phase("tab_account"):
         st.header("🔧 사용자 계정 관리")
         if st.session_state.user:
-            user = next(u for u in users if u['username'] == st.session_state.user)
             new_password = st.text_input("새 비밀번호", type="password")
             if st.button("비밀번호 변경"):
-                user['password'] = hash_password(new_password)
-                save_users(users)
+                users.set_password(st.session_state.user, users.hash_password(new_password))
                 st.success("비밀번호가 변경되었습니다.")
         else:
             st.warning("로그인 후 계정 관리가 가능합니다.")
 
     # 관리자 보기
-    with tab5:
+    with tab5, profiler.phase("tab_admin"):
         st.header("👑 관리자 보기")
         if st.session_state.role == 'admin':
             
+            # 단계별 실행 시간
+            st.subheader("⏱️ 실행 시간 (rerun 단계별)")
+            st.dataframe(pd.DataFrame(profiler.summary()))
+            client = get_github_client()
+            st.caption(
+                f"GitHub 요청 {client.stats['requests']}회 (재시도 {client.stats['retries']}회), "
+                f"rate limit 남은 횟수: {client.rate_limit['remaining']}"
+            )
+            if st.button("측정값 초기화"):
+                profiler.reset()
+
+            st.markdown("---")
+            # 영화별 평점 통계
+            st.subheader("📊 영화별 평점 통계 (평점 수 상위 20개)")
+            st.dataframe(rating_stats.table(20))
+
+            st.markdown("---")
             # 회원 정보
             st.subheader("📋 회원 정보")
-            user_info = pd.DataFrame(users)
+            user_info = pd.DataFrame(users.records())
             st.dataframe(user_info)
 
             st.markdown("---")
             st.subheader("📝 사용자 리뷰 관리")
+            write_queue = get_write_queue()
+            st.caption(f"GitHub 반영 대기 중인 변경: {write_queue.pending_count()}건, 실패: {len(write_queue.failed)}건")
+            ratings_log = get_ratings_log()
+            st.caption(f"평점 로그 세그먼트: {ratings_log.segment_count()}개 (압축 {ratings_log.stats['compactions']}회)")
+            st.caption(
+                f"공유 평점: {len(store)}건, 버전 {(ratings_sha or '-')[:8]}, "
+                f"백그라운드 확인 {shared_ratings.stats['refreshes']}회 (교체 {shared_ratings.stats['rebuilds']}회)"
+            )
+            if st.button("평점 로그 압축"):
+                try:
+                    folded = ratings_log.compact()
+                    st.success(f"세그먼트 {folded}개를 평점 스냅샷에 합쳤습니다.")
+                except GitHubError as e:
+                    st.error(f"평점 로그 압축 실패: {e.detail}")
 
             # 사용자 리뷰 데이터를 테이블 형태로 출력
-            admin_ratings = load_ratings()
-            if admin_ratings:
+            # 평점 저장소의 레코드 id(rid)로 리뷰를 식별, 검색어가 있으면 리뷰 색인에서 조회 (최신순)
+            review_query = st.text_input("🔍 리뷰 검색", placeholder="리뷰 내용으로 검색 (여러 단어는 모두 포함)").strip()
+            if review_query:
+                review_matches = store.reviews.search(review_query)
+                total_reviews = len(review_matches)
+            else:
+                total_reviews = len(store)
+            if total_reviews:
+                # 현재 페이지의 리뷰만 표시
+                start_idx, end_idx = render.paginate(total_reviews, page_size=20, key="review-page")
+                if review_query:
+                    page_items = store.reviews.page(review_matches, start_idx, end_idx - start_idx)
+                else:
+                    page_items = store.items(start_idx, end_idx - start_idx)
+
                 # 사용자 리뷰를 DataFrame으로 변환
-                reviews_df = pd.DataFrame(admin_ratings)
+                reviews_df = pd.DataFrame([row for _, row in page_items])
                 reviews_df = reviews_df[['username', 'movie', 'rating', 'review']]  # 필요한 열만 선택
 
                 reviews_df = reviews_df.rename(columns={
@@ -415,58 +551,64 @@ def main():
                 st.markdown("---")
                 # 개별 리뷰 수정
                 st.subheader("🔧 리뷰 수정 및 삭제")
-                for idx, r in reviews_df.iterrows():
-                    with st.expander(f"{r['사용자명']} - {r['영화 제목']}"):
+                for rid, r in page_items:
+                    with st.expander(f"{r['username']} - {r['movie']}"):
                         # 수정할 데이터 표시
-                        st.write(f"**영화 제목**: {r['영화 제목']}")
-                        st.write(f"**현재 평점**: {r['평점']}")
-                        st.write(f"**현재 리뷰**: {r['리뷰'] if r['리뷰'] else '없음'}")
-
-                        # 평점 및 리뷰 수정 입력
-                        new_rating = st.number_input(
-                            f"새 평점 ({r['영화 제목']})", 
-                            min_value=0.0, 
-                            max_value=10.0, 
-                            step=0.01, 
-                            value=float(admin_ratings[idx]['rating'])
-                        )
-                        new_review = st.text_area(
-                            f"새 리뷰 ({r['영화 제목']})", 
-                            value=admin_ratings[idx]['review'] if admin_ratings[idx].get('review') else ""
-                        )
-
-                         # 수정 저장 버튼
-                        if st.button(f"리뷰 수정 저장 ({r['영화 제목']})", key=f"save-edit-{idx}"):
-                            # 데이터 수정
-                            admin_ratings[idx]['rating'] = new_rating
-                            admin_ratings[idx]['review'] = new_review if new_review else None
-            
-                            # 로컬 파일에 저장
-                            save_ratings(admin_ratings)
-            
-                            # GitHub에 저장
-                            ratings_df = pd.DataFrame(admin_ratings)
-                            update_rating_csv_to_github(ratings_df, ratings_sha)
+                        st.markdown(render.movie_card([
+                            ("영화 제목", r['movie']),
+                            ("현재 평점", r['rating']),
+                            ("현재 리뷰", r['review'] or '없음'),
+                        ]))
+
+                        # 수정 입력 위젯은 열었을 때만 생성
+                        if not st.toggle("수정/삭제", key=f"edit-open-{rid}"):
+                            continue
+                        with st.form(key=f"edit-form-{rid}"):
+                            # 평점 및 리뷰 수정 입력
+                            new_rating = st.number_input(
+                                f"새 평점 ({r['movie']})", 
+                                min_value=0.0, 
+                                max_value=10.0, 
+                                step=0.01, 
+                                value=float(r['rating'])
+                            )
+                            new_review = st.text_area(
+                                f"새 리뷰 ({r['movie']})", 
+                                value=r['review'] or ""
+                            )
+                            save_clicked = st.form_submit_button("리뷰 수정 저장")
+                            delete_clicked = st.form_submit_button("리뷰 삭제")
+
+                        # 수정 저장 버튼
+                        if save_clicked:
+                            # 데이터 수정 (인덱스/집계/추천 모델 갱신, 로컬 저장, GitHub 쓰기 큐 접수 포함)
+                            shared_ratings.edit(r['username'], r['movie'], new_rating, new_review)
             
                             st.success("리뷰가 성공적으로 수정되었습니다.")
 
                         # 삭제 버튼
-                        if st.button(f"리뷰 삭제 ({r['영화 제목']})", key=f"delete-review-{idx}"):
-                            # 데이터 삭제
-                            admin_ratings.pop(idx)
-            
-                            # 로컬 파일에 저장
-                            save_ratings(admin_ratings)
+                        if delete_clicked:
+                            # 데이터 삭제 (추천 모델, 로컬 저장소, GitHub 쓰기 큐 포함)
+                            shared_ratings.delete(r['username'], r['movie'])
             
-                            # GitHub에 저장
-                            ratings_df = pd.DataFrame(admin_ratings)
-                            update_rating_csv_to_github(ratings_df, ratings_sha)
-            
-                            st.warning(f"{r['사용자명']}의 리뷰가 삭제되었습니다.")
+                            st.warning(f"{r['username']}의 리뷰가 삭제되었습니다.")
+            elif review_query:
+                st.write("검색 결과가 없습니다.")
             else:
                 st.write("현재 등록된 리뷰가 없습니다.")
         else:
             st.warning("관리자만 볼 수 있는 페이지입니다.")
 
+# rerun 한 번을 측정하며 실행
+def run():
+    if 'session_id' not in st.session_state:
+        st.session_state.session_id = uuid.uuid4().hex[:8]
+    profiler = get_profiler()
+    profiler.begin_run(st.session_state.session_id)
+    try:
+        main()
+    finally:
+        profiler.end_run()
+
 if __name__ == "__main__":
-    main()
+    run()
@@ -0,0 +1,64 @@
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import read_catalog
+
+GENRES = ["액션", "드라마", "판타지", "코미디", "스릴러", "로맨스", "애니메이션", "공포"]
+
+
+def synthetic_catalog(n):
+    return pd.DataFrame({
+        "movie_id": range(20000000, 20000000 + n),
+        "distributor": [f"배급사{i % 200}" for i in range(n)],
+        "title": [f"영화 {i}" for i in range(n)],
+        "director": [f"감독{i % 5000}" for i in range(n)],
+        "actor": [", ".join(f"배우{(i * 7 + k) % 20000}" for k in range(4)) for i in range(n)],
+        "genre": [", ".join(GENRES[(i + k) % len(GENRES)] for k in range(1 + i % 3)) for i in range(n)],
+        "release_date": [f"20{10 + i % 15}-{1 + i % 12:02d}-{1 + i % 28:02d}" for i in range(n)],
+        "running_time": [float(80 + i % 90) for i in range(n)],
+        "rating": [(i % 100) / 10 for i in range(n)],
+        "running_state": ["Y" if i % 5 else "N" for i in range(n)],
+        "poster_url": [f"영화 {i}.webp" for i in range(n)],
+    })
+
+
+def main(sizes=(10_000, 100_000, 1_000_000)):
+    results = {}
+    for n in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "movie_data.csv")
+            synthetic_catalog(n).to_csv(path, index=False, encoding="utf-8")
+
+            start = time.perf_counter()
+            raw = pd.read_csv(path, encoding="utf-8")
+            raw_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            catalog = read_catalog(path)
+            typed_seconds = time.perf_counter() - start
+
+            # st.cache_data는 rerun마다 pickle 사본을 돌려줌 (cache_resource는 같은 객체)
+            start = time.perf_counter()
+            pickle.loads(pickle.dumps(raw))
+            copy_seconds = time.perf_counter() - start
+
+            results[n] = {
+                "raw_load_ms": round(raw_seconds * 1000, 1),
+                "catalog_load_ms": round(typed_seconds * 1000, 1),
+                "raw_rerun_copy_ms": round(copy_seconds * 1000, 1),
+                "raw_mb": round(raw.memory_usage(deep=True).sum() / 2**20, 1),
+                "catalog_mb": round(catalog.frame.memory_usage(deep=True).sum() / 2**20, 1),
+            }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from fake_github import FakeGitHub
+from github_cache import GitHubCSVCache
+from github_client import GitHubClient
+
+
+# 캐시 없는 fetch (기존 app.py 방식): 매번 요청 + base64 디코딩 + CSV 파싱
+def uncached_fetch(api_url, path, stats):
+    import base64
+    import io
+    import pandas as pd
+
+    response = requests.get(f"{api_url}/{path}", headers={"Authorization": "token x"})
+    stats["requests"] += 1
+    content = base64.b64decode(response.json()["content"]).decode("utf-8")
+    stats["parses"] += 1
+    return pd.read_csv(io.StringIO(content)), response.json()["sha"]
+
+
+def main(reruns=200, rows=20000, ttl=0.05):
+    csv = "username,movie,rating,review\n" + "".join(
+        f"user{i % 500},movie{i % 3000},{i % 10}.5,review {i}\n" for i in range(rows)
+    )
+    results = {}
+    with FakeGitHub({"movie_ratings.csv": csv}) as server:
+        stats = {"requests": 0, "parses": 0}
+        start = time.perf_counter()
+        for _ in range(reruns):
+            uncached_fetch(server.api_url, "movie_ratings.csv", stats)
+        results["uncached"] = dict(stats, seconds=round(time.perf_counter() - start, 4))
+
+        cache = GitHubCSVCache(GitHubClient(server.api_url, "x"), ttl=ttl)
+        start = time.perf_counter()
+        for i in range(reruns):
+            cache.fetch("movie_ratings.csv")
+            if i == reruns // 2:
+                # 직접 쓴 뒤의 무효화 흉내
+                cache.invalidate("movie_ratings.csv")
+        results["cached"] = dict(cache.stats, seconds=round(time.perf_counter() - start, 4))
+        results["server_counts"] = dict(server.counts)
+
+    assert results["cached"]["requests"] < results["uncached"]["requests"]
+    assert results["cached"]["parses"] < results["uncached"]["parses"]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
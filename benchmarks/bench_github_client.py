@@ -0,0 +1,43 @@
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from fake_github import FakeGitHub
+from github_client import GitHubClient
+
+
+def main(calls=300):
+    results = {}
+    with FakeGitHub({"movie_users.csv": "username,password,role\n"}) as server:
+        # 기존 방식: 호출마다 새 연결
+        start = time.perf_counter()
+        for _ in range(calls):
+            requests.get(f"{server.api_url}/movie_users.csv", headers={"Authorization": "token x"})
+        results["module_requests_get_seconds"] = round(time.perf_counter() - start, 4)
+
+        # 공용 클라이언트: 커넥션 풀 재사용
+        client = GitHubClient(server.api_url, "x", backoff=0.01)
+        start = time.perf_counter()
+        for _ in range(calls):
+            client.get_contents("movie_users.csv")
+        results["pooled_client_seconds"] = round(time.perf_counter() - start, 4)
+        results["pooled_latency"] = client.latency_summary()
+
+        # 502 두 번 뒤 성공하는지 (재시도)
+        server.fail_next = 2
+        response = client.get_contents("movie_users.csv")
+        assert response.status_code == 200
+        results["client_stats"] = dict(client.stats)
+        results["server_counts"] = dict(server.counts)
+
+    assert results["client_stats"]["retries"] == 2
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from posters import PosterService
+
+
+def main(reruns=20):
+    source = os.path.join(ROOT, "poster_url")
+    names = sorted(n for n in os.listdir(source) if not n.startswith("."))
+    results = {"posters": len(names), "reruns": reruns}
+
+    # 기존 방식: 렌더마다 stat + 원본 전체 읽기
+    start = time.perf_counter()
+    sent = 0
+    for _ in range(reruns):
+        for name in names:
+            path = os.path.join(source, name)
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    sent += len(f.read())
+    results["original"] = {"seconds": round(time.perf_counter() - start, 4), "bytes_per_rerun": sent // reruns}
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        service = PosterService(source, cache_dir)
+        start = time.perf_counter()
+        service.warm_up(scales=(1,))
+        results["warm_up_seconds"] = round(time.perf_counter() - start, 4)
+
+        start = time.perf_counter()
+        sent = 0
+        for _ in range(reruns):
+            for name in names:
+                data = service.thumbnail(name)
+                sent += len(data or b"")
+        results["thumbnails"] = {
+            "seconds": round(time.perf_counter() - start, 4),
+            "bytes_per_rerun": sent // reruns,
+            "stats": dict(service.stats),
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+import json
+import os
+import random
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import Catalog
+from rating_stats import RatingStats, top_k
+from ratings_store import RatingsStore
+
+
+def synthetic(n_movies, n_ratings, seed=0):
+    rng = random.Random(seed)
+    catalog = Catalog(pd.DataFrame({"title": [f"movie{i}" for i in range(n_movies)]}))
+    records = [
+        {
+            "username": f"user{i}",
+            "movie": f"movie{int(rng.paretovariate(1.2)) % n_movies}",
+            "rating": round(rng.uniform(0, 10), 2),
+            "review": f"review {i}" if i % 3 else None,
+        }
+        for i in range(n_ratings)
+    ]
+    return catalog, records
+
+
+# 기존 방식: 매 rerun 전체 평점 순회 + Series.map + 전체 정렬
+def full_rerun(df, records, top_n):
+    review_counts, sums, users = {}, {}, {}
+    for r in records:
+        if r["review"] is not None:
+            review_counts[r["movie"]] = review_counts.get(r["movie"], 0) + 1
+        sums[r["movie"]] = sums.get(r["movie"], 0.0) + r["rating"]
+        users[r["movie"]] = users.get(r["movie"], 0) + 1
+    df = df.copy()
+    df["review_count"] = df["title"].map(review_counts).fillna(0).astype(int)
+    df["total_rating"] = df["title"].map(sums).fillna(0.0)
+    df["user_count"] = df["title"].map(users).fillna(0).astype(int)
+    df["avg_star_rating"] = (df["total_rating"] / df["user_count"]).fillna(0.0)
+    return df.sort_values(by="review_count", ascending=False).head(top_n)
+
+
+def main(n_movies=50_000, sizes=(10_000, 100_000, 1_000_000), edits=10_000, top_n=5):
+    results = {}
+    for n in sizes:
+        catalog, records = synthetic(n_movies, n)
+        store = RatingsStore(records, stats=RatingStats(catalog))
+        stats = store.stats
+
+        start = time.perf_counter()
+        expected = full_rerun(catalog.frame, store.to_records(), top_n)
+        full_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        rows = stats.top_k("review_count", top_n)
+        top_k_ms = (time.perf_counter() - start) * 1000
+        same_top = list(catalog.frame["title"].iloc[rows]) == list(expected["title"])
+
+        # 추가/수정/삭제 델타 반영 후 처음부터 다시 계산한 값과 비교
+        rng = random.Random(1)
+        rids = [rid for rid, _ in store.items()]
+        start = time.perf_counter()
+        for i in range(edits):
+            op = rng.random()
+            if op < 0.4:
+                rids.append(store.append(f"new{i}", f"movie{rng.randrange(n_movies)}", rng.uniform(0, 10), "리뷰" if i % 2 else None))
+            elif op < 0.7:
+                store.edit(rng.choice(rids), rng.uniform(0, 10), None if i % 5 else "수정")
+            else:
+                k = rng.randrange(len(rids))
+                rids[k], rids[-1] = rids[-1], rids[k]
+                store.delete(rids.pop())
+        delta_us = (time.perf_counter() - start) / edits * 1e6
+        recomputed = RatingStats.from_records(catalog, store.to_records())
+
+        results[n] = {
+            "full_rerun_ms": round(full_ms, 2),
+            "top_k_ms": round(top_k_ms, 3),
+            "same_top": same_top,
+            "delta_update_us": round(delta_us, 1),
+            "matches_recompute": stats.matches(recomputed),
+            "same_bayesian_top": np.array_equal(stats.top_k("bayesian_mean", top_n), top_k(
+                np.where(recomputed.count > 0, recomputed.bayesian_mean(), -np.inf), top_n
+            )),
+        }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
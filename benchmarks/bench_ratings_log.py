@@ -0,0 +1,121 @@
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from fake_github import FakeGitHub
+from github_cache import GitHubCSVCache
+from github_client import GitHubClient
+from ratings_log import GitHubRatingsLog
+from write_queue import GitHubWriteQueue, KEY_COLUMNS, apply_mutations
+
+PATH = "movie_ratings.csv"
+
+
+def seed_csv(rows):
+    return "username,movie,rating,review\n" + "".join(
+        f"seed{i % 3000},movie{i % 2000},{i % 10}.5,review {i}\n" for i in range(rows)
+    )
+
+
+def mutation(i):
+    if i % 5 == 4:
+        return "delete", {"username": f"seed{i % 3000}", "movie": f"movie{i % 2000}"}
+    return "upsert", {"username": f"user{i}", "movie": f"movie{i % 50}", "rating": 7.5, "review": f"리뷰 {i}"}
+
+
+def canonical(df):
+    df = df[["username", "movie", "rating", "review"]].copy()
+    df["rating"] = df["rating"].astype(float)
+    return df.sort_values(["username", "movie"]).reset_index(drop=True)
+
+
+# 서버에 있는 스냅샷 조각을 이어 붙인 DataFrame
+def read_shards(server):
+    return pd.concat(
+        [pd.read_csv(io.BytesIO(server.files[f"ratings_snapshot/{item['name']}"])) for item in server.listing("ratings_snapshot")],
+        ignore_index=True,
+    )
+
+
+# 리뷰 하나씩 writes번 기록 (쓰기마다 flush)
+def write_each(server, queue, writes):
+    start = time.perf_counter()
+    for i in range(writes):
+        op, row = mutation(i)
+        queue.submit(PATH, op, row)
+        assert queue.flush(timeout=60)
+    return {
+        "ms_per_write": round((time.perf_counter() - start) / writes * 1000, 2),
+        "bytes_per_write": server.bytes_received // writes,
+    }
+
+
+def main(seed_rows=100_000, writes=40):
+    seed = seed_csv(seed_rows)
+    expected = apply_mutations(pd.read_csv(io.StringIO(seed)), KEY_COLUMNS[PATH], [mutation(i) for i in range(writes)])
+    results = {}
+
+    # 기존 방식: 쓰기마다 파일 전체 커밋
+    with FakeGitHub({PATH: seed}) as server:
+        client = GitHubClient(server.api_url, "x")
+        queue = GitHubWriteQueue(client, GitHubCSVCache(client, ttl=0), window=0)
+        results["full_file"] = write_each(server, queue, writes)
+
+    # 변경 로그: 쓰기마다 세그먼트 하나, 읽기는 스냅샷 + 세그먼트 병합
+    with FakeGitHub({PATH: seed}) as server:
+        client = GitHubClient(server.api_url, "x")
+        cache = GitHubCSVCache(client, ttl=0)
+        log = GitHubRatingsLog(client, cache, ttl=0, compact_every=0)
+        queue = GitHubWriteQueue(client, cache, window=0, logs={PATH: log})
+        summary = write_each(server, queue, writes)
+
+        # 다른 프로세스의 reader
+        reader_client = GitHubClient(server.api_url, "x")
+        reader = GitHubRatingsLog(reader_client, GitHubCSVCache(reader_client, ttl=0), ttl=0)
+        start = time.perf_counter()
+        merged, version = reader.load()
+        summary["reader_load_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        summary["reader_matches"] = canonical(merged).equals(canonical(expected))
+
+        # reader가 세그먼트 목록만 받아 둔 상태에서 압축이 일어나도 결과가 같아야 함
+        stale_reader = GitHubRatingsLog(reader_client, GitHubCSVCache(reader_client, ttl=3600), ttl=3600)
+        stale_reader.cache.fetch(PATH)
+        stale_reader.list_segments()
+
+        # 첫 압축은 movie_ratings.csv(1MB 초과, blob으로 읽음)를 조각으로 나눔
+        start = time.perf_counter()
+        summary["compacted_segments"] = log.compact()
+        summary["compact_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        summary["segments_left"] = len(server.listing("ratings_log"))
+        summary["snapshot_matches"] = canonical(read_shards(server)).equals(canonical(expected))
+        summary["stale_reader_matches"] = canonical(stale_reader.load()[0]).equals(canonical(expected))
+        summary["version_changed"] = reader.load()[1] != version
+        summary["blob_reads"] = server.counts["BLOB"]
+
+        # 그 뒤의 압축은 변경된 조각만 다시 올림
+        more = [mutation(i) for i in range(writes, writes + 5)]
+        for op, row in more:
+            queue.submit(PATH, op, row)
+        assert queue.flush(timeout=60)
+        before = server.bytes_received
+        start = time.perf_counter()
+        log.compact()
+        summary["next_compact_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        summary["next_compact_bytes"] = server.bytes_received - before
+        summary["snapshot_bytes"] = len(seed.encode("utf-8"))
+        expected = apply_mutations(expected, KEY_COLUMNS[PATH], more)
+        summary["next_snapshot_matches"] = canonical(read_shards(server)).equals(canonical(expected))
+        results["ratings_log"] = summary
+
+    assert all(v for k, v in results["ratings_log"].items() if k.endswith("matches")), results
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pandas as pd
+
+from catalog import Catalog, typed_frame
+from recommender import Recommender
+
+GENRES = ["액션", "드라마", "판타지", "범죄", "코미디", "스릴러", "공포", "미스터리", "재난", "오컬트"]
+
+
+def synthetic_catalog(n_movies, rng):
+    people = [f"person{i}" for i in range(max(50, n_movies // 4))]
+    return pd.DataFrame({
+        "title": [f"movie{i}" for i in range(n_movies)],
+        "genre": [", ".join(rng.choice(GENRES, 2, replace=False)) for _ in range(n_movies)],
+        "director": rng.choice(people, n_movies),
+        "actor": [", ".join(rng.choice(people, 3, replace=False)) for _ in range(n_movies)],
+    })
+
+
+# 인기 편중(Zipf)을 흉내 낸 합성 평점
+def synthetic_ratings(n_ratings, n_users, n_movies, rng):
+    users = rng.integers(0, n_users, n_ratings)
+    movies = np.minimum(rng.zipf(1.3, n_ratings) - 1, n_movies - 1)
+    ratings = np.round(rng.uniform(0, 10, n_ratings), 2)
+    return [
+        {"username": f"user{u}", "movie": f"movie{m}", "rating": r}
+        for u, m, r in zip(users.tolist(), movies.tolist(), ratings.tolist())
+    ]
+
+
+def percentile(samples, q):
+    samples = sorted(samples)
+    return round(samples[min(len(samples) - 1, int(len(samples) * q))] * 1000, 3)
+
+
+def main(n_ratings=1_000_000, n_users=50_000, n_movies=20_000, queries=200, seed=0):
+    rng = np.random.default_rng(seed)
+    catalog = Catalog(typed_frame(synthetic_catalog(n_movies, rng)))
+    records = synthetic_ratings(n_ratings, n_users, n_movies, rng)
+    results = {"ratings": n_ratings, "users": n_users, "movies": n_movies}
+
+    start = time.perf_counter()
+    rec = Recommender(catalog)
+    results["content_build_seconds"] = round(time.perf_counter() - start, 3)
+
+    start = time.perf_counter()
+    rec.fit(records)
+    results["fit_seconds"] = round(time.perf_counter() - start, 3)
+
+    def query_latency(usernames):
+        samples = []
+        for username in usernames:
+            start = time.perf_counter()
+            rec.recommend(username, n=5)
+            samples.append(time.perf_counter() - start)
+        return {"p50_ms": percentile(samples, 0.5), "p95_ms": percentile(samples, 0.95)}
+
+    users = [f"user{u}" for u in rng.integers(0, n_users, queries).tolist()]
+    results["warm_query"] = query_latency(users)
+    results["cold_start_query"] = query_latency([f"new{i}" for i in range(queries)])
+
+    # 증분 갱신: 새 평점 1000개 반영 후 질의
+    start = time.perf_counter()
+    for r in synthetic_ratings(1000, n_users, n_movies, rng):
+        rec.set_rating(r["username"], r["movie"], r["rating"])
+    results["incremental_1k_seconds"] = round(time.perf_counter() - start, 3)
+    results["query_with_delta"] = query_latency(users)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+import argparse
+import gc
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import ratings_frame, sizes
+from review_index import ReviewIndex, normalize_text, tokenize
+
+WORDS = [
+    "재밌어요", "최고", "배우", "연기", "좋아요", "지루했다", "감동", "결말", "스토리", "연출", "ost", "다시",
+    "보고싶은", "별로", "시간가는줄", "몰랐다", "아쉬웠다", "몰입감", "대박", "추천합니다", "가족과", "함께",
+    "웃겨요", "눈물", "반전", "평범", "기대이하", "기대이상", "영상미", "음악",
+]
+QUERIES = ["재밌", "반전", "시간가는줄", "배우 연기", "감", "인생영화", "없는말"]
+
+
+# 단어 3~8개 리뷰 (인기 단어 편중, 가끔 띄어쓰기 없이 붙임, 0.1%는 드문 단어 포함)
+def review_text(rng, i):
+    words = [WORDS[min(int(rng.paretovariate(0.8)) - 1, len(WORDS) - 1)] for _ in range(rng.randint(3, 8))]
+    text = "".join(f"{w}{'' if rng.random() < 0.2 else ' '}" for w in words).strip()
+    return text + " 인생영화" if i % 1000 == 0 else text
+
+
+def timed(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return result, round(statistics.median(times), 3)
+
+
+# 기존 방식: 전체 리뷰를 순회하며 부분 문자열 확인
+def scan(rows, query):
+    tokens = tokenize(query)
+    return sorted(
+        (rid for rid, row in rows.items() if all(t in normalize_text(row["review"]) for t in tokens)),
+        reverse=True,
+    )
+
+
+def snapshot(index, movies):
+    return {
+        "search": {q: [rid for rid, _ in index.page(index.search(q))] for q in QUERIES},
+        "recent": {m: [id(r) for r in index.movie_reviews(m, "recent", 0, 50)] for m in movies},
+        "rating": {m: [id(r) for r in index.movie_reviews(m, "rating", 0, 50)] for m in movies},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="리뷰 색인 구축/질의/증분 갱신")
+    parser.add_argument("--scale", type=int, default=1_000_000, help="리뷰 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--edits", type=int, default=20_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    n = sizes(args.scale)
+    titles = [f"movie{i}" for i in range(n["movies"])]
+    ratings = ratings_frame(n["ratings"], titles, [f"user{i}" for i in range(n["users"])])
+    rows = {
+        rid: {"username": r["username"], "movie": r["movie"], "rating": r["rating"], "review": review_text(rng, rid)}
+        for rid, r in enumerate(ratings.to_dict("records"))
+    }
+    del ratings
+
+    index = ReviewIndex()
+    start = time.perf_counter()
+    for rid, row in rows.items():
+        index.add(rid, row)
+    build_s = time.perf_counter() - start
+
+    counts = {}
+    for row in rows.values():
+        counts[row["movie"]] = counts.get(row["movie"], 0) + 1
+    top_movie = max(counts, key=counts.get)
+
+    results = {"reviews": len(rows), "build_s": round(build_s, 2), "queries": {}, "movie_pages": {}}
+    # 관리자 검색: 일치하는 리뷰 수 + 첫 페이지(20개)
+    for q in QUERIES:
+        hits, ms = timed(lambda: index.search(q), args.repeat)
+        _, page_ms = timed(lambda: index.page(index.search(q), 0, 20), args.repeat)
+        expected, scan_ms = timed(lambda: scan(rows, q), 1)
+        results["queries"][q] = {
+            "hits": len(hits), "search_ms": ms, "search_and_page_ms": page_ms, "scan_ms": round(scan_ms, 1),
+            "same": [rid for rid, _ in index.page(hits)] == expected
+            and [rid for rid, _ in index.page(hits, 20, 20)] == expected[20:40],
+        }
+
+    # 영화별 리뷰 페이지 (리뷰가 가장 많은 영화)
+    pages = {
+        "recent_first_page": lambda: index.movie_reviews(top_movie, "recent", 0, 5),
+        "recent_middle_page": lambda: index.movie_reviews(top_movie, "recent", counts[top_movie] // 2, 5),
+        "rating_first_page": lambda: index.movie_reviews(top_movie, "rating", 0, 5),
+        "filter_and_sort_scan": lambda: sorted(
+            (row for row in rows.values() if row["movie"] == top_movie), key=lambda r: -r["rating"]
+        )[:5],
+    }
+    results["movie_pages"]["reviews"] = counts[top_movie]
+    for name, fn in pages.items():
+        results["movie_pages"][name + "_ms"] = timed(fn, args.repeat)[1]
+
+    # 추가/수정/삭제 증분 반영 후 새로 만든 색인과 비교
+    rids = list(rows)
+    next_rid = len(rows)
+    movies = [top_movie] + rng.sample(titles, 20)
+    start = time.perf_counter()
+    for i in range(args.edits):
+        op = rng.random()
+        if op < 0.4:
+            row = {"username": f"new{i}", "movie": rng.choice(movies), "rating": round(rng.uniform(0, 10), 2),
+                   "review": review_text(rng, i)}
+            rows[next_rid] = row
+            index.add(next_rid, row)
+            rids.append(next_rid)
+            next_rid += 1
+        elif op < 0.7:
+            rid = rng.choice(rids)
+            index.remove(rid, rows[rid])
+            rows[rid] = dict(rows[rid], rating=round(rng.uniform(0, 10), 2), review=review_text(rng, i))
+            index.add(rid, rows[rid])
+        else:
+            k = rng.randrange(len(rids))
+            rids[k], rids[-1] = rids[-1], rids[k]
+            rid = rids.pop()
+            index.remove(rid, rows.pop(rid))
+    results["update_us"] = round((time.perf_counter() - start) / args.edits * 1e6, 1)
+
+    incremental = snapshot(index, movies)
+    del index
+    gc.collect()
+    fresh = ReviewIndex()
+    for rid, row in rows.items():
+        fresh.add(rid, row)
+    results["matches_rebuild"] = incremental == snapshot(fresh, movies)
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
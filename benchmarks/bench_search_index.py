@@ -0,0 +1,67 @@
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from catalog import Catalog, typed_frame
+from search_index import SearchIndex
+
+SYLLABLES = "가나다라마바사아자차카타파하외계인세기말사랑시민덕희소풍파묘범죄도시설계자원더랜드"
+GENRES = ["액션", "드라마", "판타지", "범죄", "코미디", "스릴러", "공포", "미스터리", "재난", "오컬트"]
+
+
+# movie_data.csv 스키마의 합성 영화 목록
+def synthetic_catalog(n, seed=0):
+    rng = random.Random(seed)
+    word = lambda k: "".join(rng.choice(SYLLABLES) for _ in range(k))
+    people = [word(3) for _ in range(max(100, n // 5))]
+    return pd.DataFrame({
+        "movie_id": range(n),
+        "title": [f"{word(rng.randint(2, 4))} {word(rng.randint(1, 3))}" for _ in range(n)],
+        "director": [rng.choice(people) for _ in range(n)],
+        "actor": [", ".join(rng.sample(people, 4)) for _ in range(n)],
+        "genre": [", ".join(rng.sample(GENRES, rng.randint(1, 3))) for _ in range(n)],
+    })
+
+
+def timed(fn, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat * 1000, result
+
+
+def main(n=100_000, repeat=20):
+    df = synthetic_catalog(n)
+    catalog = Catalog(typed_frame(df.copy()))
+    start = time.perf_counter()
+    index = SearchIndex(catalog)
+    results = {"movies": n, "build_seconds": round(time.perf_counter() - start, 3), "queries": {}}
+
+    queries = [("외계", "액션"), ("세기말", None), ("ㅅㄹ", None), ("가나다", "드라마"), ("사", "범죄")]
+    for term, genre in queries:
+        def scan():
+            filtered = df[df["title"].str.contains(term, case=False, regex=False)]
+            if genre:
+                filtered = filtered[filtered["genre"].str.split(", ").apply(lambda g: genre in g)]
+            return len(filtered)
+
+        scan_ms, scan_count = timed(scan, repeat)
+        index_ms, rows = timed(lambda: index.search(title=term, genre=genre), repeat)
+        # 인덱스는 공백을 무시하고 마지막 글자를 입력 중으로 보므로 일치 수가 더 많을 수 있음
+        results["queries"][f"{term}|{genre}"] = {
+            "scan_ms": round(scan_ms, 3),
+            "index_ms": round(index_ms, 3),
+            "scan_matches": scan_count,
+            "index_matches": len(rows),
+        }
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
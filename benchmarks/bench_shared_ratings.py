@@ -0,0 +1,185 @@
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import dataset
+from catalog import Catalog, typed_frame
+from rating_stats import RatingStats
+from ratings_store import RatingsStore, normalize_review
+from review_index import ReviewIndex
+from shared_ratings import SharedRatings
+from write_queue import apply_mutations
+
+KEYS = ("username", "movie")
+
+
+# GitHub 평점 흉내: 쓰기는 큐에 쌓였다가 flush() 때 반영, fetch()는 (DataFrame, 버전)
+class FakeRatingsSource:
+    def __init__(self, df):
+        self.df = df
+        self.version = 0
+        self.fetches = 0
+        self._queue = []
+        self._seq = 0
+        self._flushed = 0  # 이 번호까지 커밋됨
+        self._lock = threading.Lock()
+
+    def fetch(self):
+        with self._lock:
+            self.fetches += 1
+            return self.df, str(self.version)
+
+    def submit(self, op, row):
+        with self._lock:
+            self._seq += 1
+            self._queue.append((op, row))
+            return self._seq
+
+    def committed(self, seq):
+        with self._lock:
+            return seq <= self._flushed
+
+    def flush(self):
+        with self._lock:
+            if self._queue:
+                self.df = apply_mutations(self.df, KEYS, self._queue)
+                self.version += 1
+                self._queue = []
+                self._flushed = self._seq
+
+    # 다른 프로세스가 기록한 변경
+    def external(self, op, row):
+        with self._lock:
+            self.df = apply_mutations(self.df, KEYS, [(op, row)])
+            self.version += 1
+
+
+def read_session(store, titles, rng):
+    for title in rng.sample(titles, 5):
+        store.movie_average(title)
+        store.reviews.movie_reviews(title, "recent", 0, 5)
+    store.stats.top_k("bayesian_mean", 5)
+
+
+def measure(fn):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, {"peak_mb": round(peak / 2 ** 20, 1), "seconds": round(seconds, 2)}
+
+
+# 기존 방식: 세션마다 평점을 받아 저장소/통계를 따로 구성해 session_state에 보관
+def per_session(source, catalog, sessions):
+    def run():
+        kept = []
+        rng = random.Random(0)
+        for _ in range(sessions):
+            df, _ = source.fetch()
+            store = RatingsStore(df.to_dict("records"), stats=RatingStats(catalog), reviews=ReviewIndex())
+            read_session(store, catalog.titles, rng)
+            kept.append(store)
+        return kept
+    return measure(run)
+
+
+# 공유 방식: 세션은 공유 저장소를 읽고, 쓰기/외부 변경/백그라운드 교체가 동시에 일어남
+def shared(source, catalog, sessions, workers, writes, interval):
+    ratings = SharedRatings(source.fetch, lambda: catalog, on_change=source.submit,
+                            committed=source.committed, interval=interval)
+    users = [f"bench{i}" for i in range(50)]
+
+    def session(i):
+        rng = random.Random(i)
+        store = ratings.store
+        read_session(store, catalog.titles, rng)
+        for _ in range(writes):
+            user, title = rng.choice(users), rng.choice(catalog.titles)
+            op = rng.random()
+            if op < 0.6:
+                if ratings.edit(user, title, round(rng.uniform(0, 10), 2), "수정") is None:
+                    ratings.append(user, title, round(rng.uniform(0, 10), 2), f"리뷰 {i}")
+            else:
+                ratings.delete(user, title)
+            if i % 20 == 0:
+                source.external("upsert", {"username": f"other{i}", "movie": title, "rating": 5.0, "review": None})
+        return store
+
+    def run():
+        ratings.refresh()
+        ratings.start()
+        done = threading.Event()
+
+        def flusher():  # 쓰기 큐가 주기적으로 GitHub에 반영
+            while not done.wait(interval / 2):
+                source.flush()
+
+        thread = threading.Thread(target=flusher, daemon=True)
+        thread.start()
+        with ThreadPoolExecutor(workers) as pool:
+            kept = list(pool.map(session, range(sessions)))
+        time.sleep(interval * 2)
+        done.set()
+        thread.join()
+        ratings.stop()
+        return kept
+
+    kept, summary = measure(run)
+    # 남은 쓰기를 반영하고 다시 읽은 결과가 GitHub 내용과 같은지 확인
+    source.flush()
+    ratings.refresh()
+    expected = {(r["username"], r["movie"]): (float(r["rating"]), normalize_review(r["review"])) for r in source.df.to_dict("records")}
+    actual = {(r["username"], r["movie"]): (r["rating"], r["review"]) for r in ratings.store.to_records()}
+    summary.update({
+        "distinct_stores_held": len({id(store) for store in kept}),
+        "rebuilds": ratings.stats["rebuilds"],
+        "background_refreshes": ratings.stats["refreshes"],
+        "refresh_errors": ratings.stats["errors"],
+        "matches_github": expected == actual,
+        "local_changes_left": len(ratings._local),
+        "stats_match_recompute": ratings.store.stats.matches(RatingStats.from_records(catalog, ratings.store.to_records())),
+    })
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세션별 평점 저장소 vs 공유 평점 저장소 (최대 메모리)")
+    parser.add_argument("--scale", type=int, default=10_000, help="평점 수")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=16, help="동시에 rerun하는 세션 스레드 수")
+    parser.add_argument("--writes", type=int, default=5, help="세션당 평점 변경 수")
+    parser.add_argument("--interval", type=float, default=0.05, help="백그라운드 갱신 간격 (초)")
+    args = parser.parse_args()
+
+    catalog_df, _, ratings_df = dataset(args.scale)
+    catalog = Catalog(typed_frame(catalog_df))
+    ratings_df = ratings_df.astype(object).where(ratings_df.notna(), None)
+
+    source = FakeRatingsSource(ratings_df)
+    _, before = per_session(source, catalog, args.sessions)
+    before["fetches"] = source.fetches
+
+    source = FakeRatingsSource(ratings_df)
+    after = shared(source, catalog, args.sessions, args.workers, args.writes, args.interval)
+    after["fetches"] = source.fetches
+
+    print(json.dumps({
+        "ratings": len(ratings_df), "sessions": args.sessions,
+        "per_session": before, "shared": after,
+    }, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import json
+import os
+import sys
+import tempfile
+import time
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.fake_github import FakeGitHub
+
+
+def read(name, encoding="utf-8"):
+    with open(os.path.join(ROOT, name), encoding=encoding) as f:
+        return f.read()
+
+
+# 캐시가 비어 있는 새 세션의 첫 실행 (첫 화면 출력 시점과 전체 실행 시간)
+def cold_start(api_url, workers, trace_path):
+    st.cache_resource.clear()
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=120)
+    at.secrets["GITHUB_TOKEN"] = "bench"
+    at.secrets["GITHUB_API_URL"] = api_url
+    at.secrets["STARTUP_WORKERS"] = workers
+    at.secrets["STORAGE_BACKEND"] = "csv"
+    at.secrets["PROFILE_TRACE_PATH"] = trace_path
+    start = time.perf_counter()
+    at.run()
+    wall = time.perf_counter() - start
+    assert not at.exception, at.exception
+    with open(trace_path, encoding="utf-8") as f:
+        trace = json.loads(f.readlines()[-1])
+    return {
+        "first_render_ms": trace["phases"]["first_render"],
+        "run_ms": trace["total_ms"],
+        "wall_ms": round(wall * 1000, 1),
+    }
+
+
+def main(latencies=(0.1, 0.3), repeat=3):
+    os.chdir(ROOT)  # movie_data.csv, poster_url 상대 경로
+    files = {
+        "movie_users.csv": read("movie_users.csv", "cp949"),
+        "movie_ratings.csv": read("movie_ratings.csv"),
+    }
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for latency in latencies:
+            with FakeGitHub(files, latency=latency) as fake:
+                for workers in (0, 4):
+                    runs = [cold_start(fake.api_url, workers, os.path.join(tmp, "trace.jsonl")) for _ in range(repeat)]
+                    results[f"latency={latency}s workers={workers}"] = {
+                        key: round(min(run[key] for run in runs), 1) for key in runs[0]
+                    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from storage import CSVStorage, SQLiteStorage
+
+
+def synthetic_ratings(n):
+    return [
+        {"username": f"user{i % 5000}", "movie": f"movie{i // 5000}-{i % 997}", "rating": (i % 100) / 10, "review": f"review {i}"}
+        for i in range(n)
+    ]
+
+
+def per_write_ms(storage, writes):
+    start = time.perf_counter()
+    for i in range(writes):
+        storage.upsert_rating({"username": f"bench{i}", "movie": "movie0-0", "rating": 7.5, "review": "좋아요"})
+    for i in range(writes):
+        storage.delete_rating(f"bench{i}", "movie0-0")
+    return round((time.perf_counter() - start) / (writes * 2) * 1000, 3)
+
+
+def main(sizes=(1_000, 10_000, 100_000), writes=20):
+    results = {}
+    for n in sizes:
+        ratings = synthetic_ratings(n)
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_storage = CSVStorage(os.path.join(tmp, "users.csv"), os.path.join(tmp, "ratings.csv"))
+            csv_storage.save_ratings(ratings)
+            sqlite_storage = SQLiteStorage(os.path.join(tmp, "movie.db"))
+            sqlite_storage.save_ratings(ratings)
+            results[n] = {
+                "csv_rewrite_ms_per_write": per_write_ms(csv_storage, writes),
+                "sqlite_upsert_ms_per_write": per_write_ms(sqlite_storage, writes),
+            }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+import io
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from fake_github import FakeGitHub
+from github_cache import GitHubCSVCache
+from github_client import GitHubClient
+from write_queue import GitHubWriteQueue, KEY_COLUMNS, apply_mutations
+
+PATH = "movie_ratings.csv"
+
+
+def seed_csv(rows):
+    return "username,movie,rating,review\n" + "".join(
+        f"seed{i % 300},movie{i % 2000},{i % 10}.5,review {i}\n" for i in range(rows)
+    )
+
+
+def rating(i):
+    return {"username": f"burst{i}", "movie": f"movie{i % 50}", "rating": 7.5, "review": f"burst {i}"}
+
+
+# 동시에 여러 사용자가 제출하는 상황 흉내
+def burst(submit, submits, threads):
+    ack_times = []
+    lock = threading.Lock()
+
+    def worker(offset):
+        for i in range(offset, submits, threads):
+            start = time.perf_counter()
+            submit(rating(i))
+            with lock:
+                ack_times.append(time.perf_counter() - start)
+
+    workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    ack_times.sort()
+    return {
+        "ack_p50_ms": round(ack_times[len(ack_times) // 2] * 1000, 3),
+        "ack_max_ms": round(ack_times[-1] * 1000, 3),
+    }
+
+
+def stored_rows(server):
+    return pd.read_csv(io.BytesIO(server.files[PATH]))
+
+
+def main(submits=120, threads=8, seed_rows=5000, latency=0.02):
+    results = {}
+
+    # 기존 방식: 제출마다 전체 파일 커밋 (sha 충돌 시 다시 시도)
+    with FakeGitHub({PATH: seed_csv(seed_rows)}, latency=latency) as server:
+        client = GitHubClient(server.api_url, "x")
+        cache = GitHubCSVCache(client, ttl=0)
+        lock = threading.Lock()  # 충돌 재시도 없이는 데이터가 유실되므로 직렬화
+
+        def sync_submit(row):
+            with lock:
+                base, sha = cache.fetch(PATH)
+                df = apply_mutations(base, KEY_COLUMNS[PATH], [("upsert", row)])
+                client.put_contents(PATH, df.to_csv(index=False), sha, "Update")
+
+        start = time.perf_counter()
+        summary = burst(sync_submit, submits, threads)
+        summary["durable_seconds"] = round(time.perf_counter() - start, 3)
+        summary["puts"] = server.counts["PUT"]
+        summary["rows"] = len(stored_rows(server))
+        results["sync_full_file"] = summary
+
+    # 쓰기 큐: 두 개의 독립된 큐(프로세스 2개 흉내)가 같은 파일에 씀
+    with FakeGitHub({PATH: seed_csv(seed_rows)}, latency=latency) as server:
+        queues = []
+        for _ in range(2):
+            client = GitHubClient(server.api_url, "x")
+            queues.append(GitHubWriteQueue(client, GitHubCSVCache(client, ttl=0), window=0.05))
+        counter = iter(range(submits * 2))
+        counter_lock = threading.Lock()
+
+        def queued_submit(row):
+            with counter_lock:
+                queue = queues[next(counter) % 2]
+            queue.submit(PATH, "upsert", row)
+
+        start = time.perf_counter()
+        summary = burst(queued_submit, submits, threads)
+        for queue in queues:
+            assert queue.flush(timeout=60)
+        summary["durable_seconds"] = round(time.perf_counter() - start, 3)
+        summary["puts"] = server.counts["PUT"]
+        summary["conflicts"] = sum(q.stats["conflicts"] for q in queues)
+        summary["commits"] = sum(q.stats["commits"] for q in queues)
+        summary["rows"] = len(stored_rows(server))
+        results["write_queue"] = summary
+
+    # 두 방식 모두 모든 제출이 반영되어야 함
+    assert results["sync_full_file"]["rows"] == results["write_queue"]["rows"] == seed_rows + submits
+    assert results["write_queue"]["puts"] < results["sync_full_file"]["puts"]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
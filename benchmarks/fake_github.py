@@ -0,0 +1,178 @@
+import base64
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CONTENT_LIMIT = 1024 * 1024  # contents API가 JSON으로 내용을 주는 최대 파일 크기
+
+
+# 로컬에서 GitHub contents API 흉내를 내는 HTTP 서버 (벤치마크용)
+# GET은 ETag/If-None-Match를 지원하고, PUT/DELETE는 sha가 최신이 아니면 409를 반환
+# 디렉터리 경로를 GET하면 바로 아래 파일 목록을 반환
+# 1MB가 넘는 파일은 GitHub처럼 content 없이 encoding "none"을 주고, git/blobs/{sha}로 원본을 받아야 함
+# fail_next에 숫자를 넣으면 그 수만큼의 다음 요청에 502를 반환
+class FakeGitHub:
+    def __init__(self, files=None, latency=0.0):
+        self.files = {}  # 경로 -> bytes
+        self.latency = latency
+        self.fail_next = 0
+        self.counts = {"GET": 0, "PUT": 0, "DELETE": 0, "BLOB": 0, "304": 0, "409": 0, "502": 0}
+        self.bytes_received = 0  # PUT 요청 본문 크기 합계
+        self.lock = threading.Lock()
+        for path, data in (files or {}).items():
+            self.files[path] = data.encode("utf-8") if isinstance(data, str) else data
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def api_url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/repos/owner/repo/contents"
+
+    @staticmethod
+    def sha_of(data):
+        return hashlib.sha1(data).hexdigest()
+
+    # 디렉터리 바로 아래 파일 목록 (lock을 잡은 상태에서 호출)
+    def listing(self, directory):
+        prefix = directory.rstrip("/") + "/"
+        return [
+            {"name": path[len(prefix):], "path": path, "sha": self.sha_of(data), "size": len(data), "type": "file"}
+            for path, data in sorted(self.files.items())
+            if path.startswith(prefix) and "/" not in path[len(prefix):]
+        ]
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def _path(self):
+                return self.path.split("/contents/", 1)[-1].split("?", 1)[0]
+
+            def _send(self, status, body=None, headers=None, raw=None):
+                payload = raw if raw is not None else json.dumps(body).encode("utf-8") if body is not None else b""
+                self.send_response(status)
+                self.send_header("Content-Type", "application/octet-stream" if raw is not None else "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _inject_failure(self):
+                with fake.lock:
+                    if fake.fail_next <= 0:
+                        return False
+                    fake.fail_next -= 1
+                    fake.counts["502"] += 1
+                self._send(502, {"message": "Bad Gateway"})
+                return True
+
+            # sha로 파일 원본 조회 (Accept: application/vnd.github.raw)
+            def _get_blob(self, sha):
+                with fake.lock:
+                    fake.counts["BLOB"] += 1
+                    data = next((data for data in fake.files.values() if fake.sha_of(data) == sha), None)
+                if data is None:
+                    self._send(404, {"message": "Not Found"})
+                else:
+                    self._send(200, raw=data)
+
+            def do_GET(self):
+                if fake.latency:
+                    time.sleep(fake.latency)
+                if self._inject_failure():
+                    return
+                if "/git/blobs/" in self.path:
+                    self._get_blob(self.path.rsplit("/", 1)[-1])
+                    return
+                path = self._path()
+                with fake.lock:
+                    fake.counts["GET"] += 1
+                    data = fake.files.get(path)
+                    if data is None:
+                        listing = fake.listing(path)
+                        if not listing:
+                            self._send(404, {"message": "Not Found"})
+                            return
+                        sha = fake.sha_of(json.dumps(listing).encode("utf-8"))
+                        body = listing
+                    else:
+                        sha = fake.sha_of(data)
+                        body = {"path": path, "sha": sha, "size": len(data), "encoding": "base64",
+                                "content": base64.b64encode(data).decode("ascii")}
+                        if len(data) > CONTENT_LIMIT:
+                            body.update(encoding="none", content="")
+                    etag = f'"{sha}"'
+                    if self.headers.get("If-None-Match") == etag:
+                        fake.counts["304"] += 1
+                        self._send(304, headers={"ETag": etag})
+                        return
+                self._send(200, body, {"ETag": etag})
+
+            def do_PUT(self):
+                if fake.latency:
+                    time.sleep(fake.latency)
+                path = self._path()
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if self._inject_failure():
+                    return
+                with fake.lock:
+                    fake.counts["PUT"] += 1
+                    fake.bytes_received += length
+                    current = fake.files.get(path)
+                    if current is not None and body.get("sha") != fake.sha_of(current):
+                        fake.counts["409"] += 1
+                        self._send(409, {"message": "sha mismatch"})
+                        return
+                    data = base64.b64decode(body["content"])
+                    fake.files[path] = data
+                    sha = fake.sha_of(data)
+                self._send(201 if current is None else 200, {"content": {"path": path, "sha": sha}})
+
+            def do_DELETE(self):
+                if fake.latency:
+                    time.sleep(fake.latency)
+                path = self._path()
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if self._inject_failure():
+                    return
+                with fake.lock:
+                    fake.counts["DELETE"] += 1
+                    current = fake.files.get(path)
+                    if current is None:
+                        self._send(404, {"message": "Not Found"})
+                        return
+                    if body.get("sha") != fake.sha_of(current):
+                        fake.counts["409"] += 1
+                        self._send(409, {"message": "sha mismatch"})
+                        return
+                    del fake.files[path]
+                self._send(200, {"content": None})
+
+        return Handler
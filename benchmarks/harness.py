@@ -0,0 +1,214 @@
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+import pandas as pd
+
+import synthetic
+from catalog import Catalog, read_catalog, typed_frame
+from fake_github import FakeGitHub
+from rating_stats import RatingStats, top_k
+from ratings_store import RatingsStore
+from recommender import Recommender
+from search_index import SearchIndex
+from user_directory import UserDirectory
+
+
+def timed(fn, repeat=5):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return {"min_ms": round(samples[0] * 1000, 3), "p50_ms": round(samples[len(samples) // 2] * 1000, 3)}
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    pick = lambda q: round(samples[min(len(samples) - 1, int(len(samples) * q))] * 1000, 1)
+    return {"p50_ms": pick(0.5), "p95_ms": pick(0.95), "max_ms": round(samples[-1] * 1000, 1)}
+
+
+def meta():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    import streamlit
+    return {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "streamlit": streamlit.__version__,
+    }
+
+
+# app.py의 핵심 로직을 합성 데이터로 측정
+def core(scale, repeat):
+    catalog_df, users_df, ratings_df = synthetic.dataset(scale)
+    result = {"sizes": {"movies": len(catalog_df), "users": len(users_df), "ratings": len(ratings_df)}}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        synthetic.write_dataset(tmp, catalog_df, users_df, ratings_df)
+        ratings_path = os.path.join(tmp, "movie_ratings.csv")
+        result["csv"] = {
+            "load_catalog": timed(lambda: read_catalog(os.path.join(tmp, "movie_data.csv")), repeat),
+            "load_ratings": timed(lambda: pd.read_csv(ratings_path, encoding="utf-8"), repeat),
+            "load_users": timed(lambda: pd.read_csv(os.path.join(tmp, "movie_users.csv"), encoding="cp949"), repeat),
+            "save_ratings": timed(lambda: ratings_df.to_csv(ratings_path, index=False, encoding="utf-8"), repeat),
+        }
+
+    catalog = Catalog(typed_frame(catalog_df.copy()))
+    # app.py처럼 CSV를 거친 레코드 (빈 리뷰는 NaN)
+    records = pd.read_csv(io.StringIO(ratings_df.to_csv(index=False))).to_dict("records")
+
+    # 검색/필터
+    start = time.perf_counter()
+    index = SearchIndex(catalog)
+    search = {"build_ms": round((time.perf_counter() - start) * 1000, 1)}
+    title = catalog.titles[len(catalog) // 2].split()[0][:2]
+    queries = {
+        "title": {"title": title},
+        "choseong": {"title": "ㄱㄴ"},
+        "genre": {"genre": "드라마"},
+        "title_genre": {"title": title, "genre": "액션"},
+        "director": {"director": catalog.frame["director"].iloc[0]},
+    }
+    for name, query in queries.items():
+        search[name] = timed(lambda: index.search(**query), repeat)
+    result["search"] = search
+
+    # 영화별 평점 집계 (평점 저장소 + 통계 테이블)
+    def build_store():
+        return RatingsStore(records, stats=RatingStats(catalog))
+    store = build_store()
+    rid = store.append("bench", catalog.titles[0], 5.0, "리뷰")
+    result["aggregation"] = {
+        "build": timed(build_store, max(1, repeat // 2)),
+        "delta_update": timed(lambda: store.edit(rid, 7.0, "수정"), repeat),
+        "recompute": timed(lambda: RatingStats.from_records(catalog, records), repeat),
+    }
+
+    # 추천 탭 정렬
+    stats = store.stats
+    site_rating = catalog.frame["rating"].to_numpy(dtype=float, na_value=np.nan)
+    recommender = Recommender(catalog)
+    start = time.perf_counter()
+    recommender.fit(records)
+    some_user = records[0]["username"] if records else "user0"
+    result["recommend"] = {
+        "fit_ms": round((time.perf_counter() - start) * 1000, 1),
+        "review_count": timed(lambda: stats.top_k("review_count", 5), repeat),
+        "bayesian_mean": timed(lambda: stats.top_k("bayesian_mean", 5), repeat),
+        "site_rating": timed(lambda: top_k(site_rating, 5), repeat),
+        "personal": timed(lambda: recommender.recommend(some_user, n=5), repeat),
+        "cold_start": timed(lambda: recommender.recommend("nobody", n=5), repeat),
+    }
+
+    # 로그인 조회 (사용자 디렉터리: 사용자명 딕셔너리 조회 + scrypt 확인)
+    directory = UserDirectory(users_df.to_dict("records"))
+    last = users_df["username"].iloc[-1]
+    assert directory.authenticate(last, f"pw-{last}") is not None  # 예전 형식 해시를 새 형식으로 교체
+    result["login"] = {
+        "lookup": timed(lambda: directory.get(last), repeat),
+        "authenticate": timed(lambda: directory.authenticate(last, f"pw-{last}"), repeat),
+    }
+    return result
+
+
+# main() 전체를 AppTest로 실행 (로컬 GitHub 대역 서버 사용)
+def end_to_end(scale, reruns, latency):
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    catalog_df, users_df, ratings_df = synthetic.dataset(scale)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        synthetic.write_dataset(tmp, catalog_df, users_df, ratings_df)
+        files = {
+            "movie_users.csv": users_df.to_csv(index=False),
+            "movie_ratings.csv": ratings_df.to_csv(index=False),
+        }
+        trace_path = os.path.join(tmp, "trace.jsonl")
+        os.chdir(tmp)  # app.py는 현재 디렉터리의 movie_data.csv, poster_url을 읽음
+        try:
+            with FakeGitHub(files, latency=latency) as fake:
+                st.cache_resource.clear()
+                at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=600)
+                at.secrets["GITHUB_TOKEN"] = "bench"
+                at.secrets["GITHUB_API_URL"] = fake.api_url
+                at.secrets["STORAGE_BACKEND"] = "csv"
+                at.secrets["PROFILE_TRACE_PATH"] = trace_path
+
+                start = time.perf_counter()
+                at.run()
+                cold = time.perf_counter() - start
+                assert not at.exception, at.exception
+
+                # 관리자로 로그인한 상태에서 rerun 반복 (모든 탭 렌더링)
+                at.session_state["user"] = users_df["username"].iloc[0]
+                at.session_state["role"] = "admin"
+                samples = []
+                for _ in range(reruns):
+                    start = time.perf_counter()
+                    at.run()
+                    samples.append(time.perf_counter() - start)
+                    assert not at.exception, at.exception
+                requests = dict(fake.counts)
+        finally:
+            os.chdir(cwd)
+        with open(trace_path, encoding="utf-8") as f:
+            last = json.loads(f.readlines()[-1])
+    return {
+        "cold_ms": round(cold * 1000, 1),
+        "rerun": percentiles(samples),
+        "last_rerun_phases_ms": last["phases"],
+        "github_requests": requests,
+    }
+
+
+def parse_scales(text):
+    return [int(float(x)) for x in text.split(",") if x]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="영화 추천 앱 핵심 경로 벤치마크 (JSON 출력)")
+    parser.add_argument("--scales", default="1000,10000,100000,1000000", help="평점 수 규모 (쉼표 구분)")
+    parser.add_argument("--e2e-scales", default="1000,10000", help="AppTest 전체 실행 규모 (비우면 생략)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--reruns", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05, help="GitHub 대역 서버 응답 지연 (초)")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    results = {"meta": meta(), "core": {}, "e2e": {}}
+    for scale in parse_scales(args.scales):
+        results["core"][scale] = core(scale, args.repeat)
+    for scale in parse_scales(args.e2e_scales):
+        results["e2e"][scale] = end_to_end(scale, args.reruns, args.latency)
+
+    text = json.dumps(results, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
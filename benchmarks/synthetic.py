@@ -0,0 +1,88 @@
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+SYLLABLES = "가나다라마바사아자차카타파하외계인세기말사랑시민덕희소풍파묘범죄도시설계자원더랜드"
+GENRES = ["액션", "드라마", "판타지", "범죄", "코미디", "스릴러", "공포", "미스터리", "재난", "오컬트", "애니메이션", "로맨스"]
+DISTRIBUTORS = ["㈜CJ ENM", "㈜쇼박스", "㈜롯데 엔터테인먼트", "플렉스엠엔터테인먼트", "㈜엔케이컨텐츠", "㈜NEW"]
+
+
+# 규모(평점 수) 하나로 영화/사용자/평점 수를 정함
+def sizes(scale):
+    return {"movies": max(100, scale // 20), "users": max(20, scale // 50), "ratings": scale}
+
+
+def _words(rng, n, length):
+    chars = np.array(list(SYLLABLES))
+    picks = chars[rng.integers(0, len(chars), (n, length))]
+    return ["".join(row) for row in picks]
+
+
+# movie_data.csv 스키마의 합성 영화 목록 (제목은 고유)
+def catalog_frame(n, seed=0):
+    rng = np.random.default_rng(seed)
+    people = _words(rng, max(100, n // 5), 3)
+    person = lambda k: [people[i] for i in rng.integers(0, len(people), k)]
+    genre_sets = [", ".join(rng.choice(GENRES, rng.integers(1, 4), replace=False)) for _ in range(n)]
+    days = rng.integers(0, 365 * 15, n)
+    return pd.DataFrame({
+        "movie_id": 20100000 + np.arange(n),
+        "distributor": rng.choice(DISTRIBUTORS, n),
+        "title": [f"{word} {i}" for i, word in enumerate(_words(rng, n, 3))],
+        "director": person(n),
+        "actor": [", ".join(person(4)) for _ in range(n)],
+        "genre": genre_sets,
+        "release_date": (pd.Timestamp("2010-01-01") + pd.to_timedelta(days, unit="D")).strftime("%Y-%m-%d"),
+        "running_time": rng.integers(80, 180, n).astype(float),
+        "rating": np.round(rng.uniform(4, 10, n), 2),
+        "running_state": rng.choice(["Y", "N"], n, p=[0.2, 0.8]),
+        "poster_url": [f"movie{i}.webp" for i in range(n)],
+    })
+
+
+def hash_password(password):
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+# movie_users.csv 스키마의 합성 사용자 (비밀번호는 "pw-사용자명", 첫 사용자는 관리자)
+def users_frame(n):
+    usernames = [f"user{i}" for i in range(n)]
+    return pd.DataFrame({
+        "username": usernames,
+        "password": [hash_password(f"pw-{u}") for u in usernames],
+        "role": ["admin"] + ["user"] * (n - 1),
+    })
+
+
+# movie_ratings.csv 스키마의 합성 평점 (인기 편중, 사용자/영화 쌍은 고유하므로 n개보다 조금 적을 수 있음)
+def ratings_frame(n, titles, usernames, seed=0):
+    rng = np.random.default_rng(seed)
+    movies = np.minimum(rng.zipf(1.3, n * 4) - 1, len(titles) - 1)
+    users = rng.integers(0, len(usernames), n * 4)
+    pairs = pd.DataFrame({"u": users, "m": movies}).drop_duplicates().head(n)
+    k = len(pairs)
+    reviews = np.where(rng.random(k) < 0.6, [f"리뷰 {i}" for i in range(k)], None)
+    return pd.DataFrame({
+        "username": np.asarray(usernames, dtype=object)[pairs["u"].to_numpy()],
+        "movie": np.asarray(titles, dtype=object)[pairs["m"].to_numpy()],
+        "rating": np.round(rng.uniform(0, 10, k), 2),
+        "review": reviews,
+    })
+
+
+def dataset(scale, seed=0):
+    n = sizes(scale)
+    catalog = catalog_frame(n["movies"], seed)
+    users = users_frame(n["users"])
+    ratings = ratings_frame(n["ratings"], catalog["title"].tolist(), users["username"].tolist(), seed)
+    return catalog, users, ratings
+
+
+# 앱이 읽는 파일 구성으로 저장 (movie_data.csv, movie_users.csv, movie_ratings.csv, poster_url/)
+def write_dataset(directory, catalog, users, ratings):
+    catalog.to_csv(os.path.join(directory, "movie_data.csv"), index=False, encoding="utf-8")
+    users.to_csv(os.path.join(directory, "movie_users.csv"), index=False, encoding="cp949")
+    ratings.to_csv(os.path.join(directory, "movie_ratings.csv"), index=False, encoding="utf-8")
+    os.makedirs(os.path.join(directory, "poster_url"), exist_ok=True)
@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+
+from search_index import split_list
+
+CATEGORY_COLUMNS = ["distributor", "director", "genre", "running_state"]
+
+
+def _read_only(array):
+    array.flags.writeable = False
+    return array
+
+
+# 콤마 목록 컬럼을 (어휘, 오프셋, 코드) CSR 형태 정수 배열로 펼침
+# 행 i의 항목 코드는 codes[offsets[i]:offsets[i + 1]]
+def explode_codes(values):
+    vocab, offsets, codes = {}, [0], []
+    for value in values:
+        for item in split_list(value):
+            codes.append(vocab.setdefault(item, len(vocab)))
+        offsets.append(len(codes))
+    return (
+        list(vocab),
+        _read_only(np.asarray(offsets, dtype=np.int64)),
+        _read_only(np.asarray(codes, dtype=np.int32)),
+    )
+
+
+# 영화 목록(movie_data.csv)을 타입이 정해진 읽기 전용 구조로 보관
+# - 반복 값이 많은 컬럼은 category, 개봉일은 datetime, 상영 시간/영화 ID는 정수
+# - 장르/감독/배우는 펼친 코드 배열 (검색 인덱스와 추천 내용 행렬이 콤마 목록을 다시 나누지 않고 사용), 제목 -> 행 번호 맵
+# 프로세스 전체에서 공유되므로 frame과 배열을 수정하지 말 것
+class Catalog:
+    def __init__(self, frame):
+        self.frame = frame
+        self.titles = frame["title"].tolist() if "title" in frame else []
+        self.title_to_row = {}
+        for i, title in enumerate(self.titles):
+            self.title_to_row.setdefault(title, i)
+        empty = [None] * len(frame)
+        self.genre_vocab, self.genre_offsets, self.genre_codes = explode_codes(
+            frame["genre"].tolist() if "genre" in frame else empty
+        )
+        self.director_vocab, self.director_offsets, self.director_codes = explode_codes(
+            frame["director"].tolist() if "director" in frame else empty
+        )
+        self.actor_vocab, self.actor_offsets, self.actor_codes = explode_codes(
+            frame["actor"].tolist() if "actor" in frame else empty
+        )
+
+    def __len__(self):
+        return len(self.frame)
+
+
+# 읽어 들인 영화 목록의 컬럼 타입 정리 (전달한 DataFrame을 바꿈)
+def typed_frame(df):
+    df.columns = df.columns.str.strip().str.lower()
+    if "movie_id" in df:
+        df["movie_id"] = pd.to_numeric(df["movie_id"], errors="coerce").round().astype("Int64")
+    if "running_time" in df:
+        df["running_time"] = pd.to_numeric(df["running_time"], errors="coerce").round().astype("Int32")
+    if "rating" in df:
+        df["rating"] = pd.to_numeric(df["rating"], errors="coerce")
+    if "release_date" in df:
+        df["release_date"] = pd.to_datetime(df["release_date"], errors="coerce")
+    for column in CATEGORY_COLUMNS:
+        if column in df:
+            df[column] = df[column].astype("category")
+    return df
+
+
+def read_catalog(path="movie_data.csv"):
+    return Catalog(typed_frame(pd.read_csv(path, encoding="utf-8")))
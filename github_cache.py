@@ -0,0 +1,69 @@
+import io
+import threading
+import time
+
+import pandas as pd
+
+
+class _Entry:
+    def __init__(self, df, sha, etag, fetched_at):
+        self.df = df
+        self.sha = sha
+        self.etag = etag
+        self.fetched_at = fetched_at
+
+
+# 경로별로 파싱된 DataFrame과 sha/ETag를 기억하는 GitHub CSV 캐시
+# - TTL 안에서는 요청 없이 캐시된 DataFrame을 반환
+# - TTL이 지나면 If-None-Match 조건부 요청을 보내고 304이면 기존 DataFrame 재사용
+# - 목록 조회 등으로 최신 sha를 이미 알면 fetch(path, sha)로 넘겨 같은 sha일 때는 요청하지 않음
+# - 직접 쓴 뒤에는 invalidate()로 캐시를 비움
+# 잠금은 경로별이라 서로 다른 파일은 동시에 받고, 같은 파일은 한 번만 요청
+class GitHubCSVCache:
+    def __init__(self, client, ttl=30, clock=time.monotonic):
+        self.client = client
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = {}
+        self._lock = threading.Lock()  # _entries/_path_locks/stats 보호
+        self._path_locks = {}
+        self.stats = {"hits": 0, "requests": 0, "not_modified": 0, "parses": 0}
+
+    # (DataFrame, sha) 반환, 실패 시 GitHubError
+    def fetch(self, path, sha=None):
+        with self._lock:
+            path_lock = self._path_locks.setdefault(path, threading.Lock())
+        with path_lock:
+            with self._lock:
+                entry = self._entries.get(path)
+                now = self._clock()
+                fresh = entry is not None and (entry.sha == sha if sha is not None else now - entry.fetched_at < self.ttl)
+                if fresh:
+                    self.stats["hits"] += 1
+                    return entry.df, entry.sha
+                self.stats["requests"] += 1
+
+            response = self.client.get_contents(path, etag=entry.etag if entry is not None else None)
+
+            if response.status_code == 304 and entry is not None:
+                with self._lock:
+                    self.stats["not_modified"] += 1
+                    entry.fetched_at = now
+                return entry.df, entry.sha
+
+            body = response.json()
+            content = self.client.file_content(path, body).decode("utf-8")
+            df = pd.read_csv(io.StringIO(content), encoding="utf-8") if content.strip() else pd.DataFrame()
+            entry = _Entry(df, body["sha"], response.headers.get("ETag"), now)
+            with self._lock:
+                self.stats["parses"] += 1
+                self._entries[path] = entry
+            return entry.df, entry.sha
+
+    # 경로의 캐시 무효화 (경로를 생략하면 전체)
+    def invalidate(self, path=None):
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
@@ -0,0 +1,186 @@
+import base64
+import threading
+import time
+from collections import deque
+
+import requests
+from requests.adapters import HTTPAdapter
+
+RETRY_STATUS = {500, 502, 503, 504}
+
+
+# GitHub API 요청 실패 (재시도 후에도 실패한 경우 포함)
+# reset: 1차 rate limit이 소진된 경우 초기화 시각 (epoch 초, X-RateLimit-Reset)
+# message: 상태 코드가 아닌 응답 내용 문제일 때의 설명
+class GitHubError(Exception):
+    def __init__(self, path, status_code, reset=None, message=None):
+        self.path = path
+        self.status_code = status_code
+        self.reset = reset
+        self.message = message
+        super().__init__(f"{path}: {self.detail}")
+
+    # 화면 표시용 설명
+    @property
+    def detail(self):
+        if self.message is not None:
+            return self.message
+        if self.reset is None:
+            return f"상태 코드: {self.status_code}"
+        reset_at = time.strftime("%H:%M:%S", time.localtime(self.reset))
+        return f"상태 코드: {self.status_code} (rate limit 소진, {reset_at}에 초기화)"
+
+
+# 모든 GitHub contents/blobs API 호출이 거쳐가는 공용 클라이언트
+# - Session 기반 커넥션 풀/keep-alive
+# - 요청별 타임아웃
+# - 5xx, 2차 rate limit(403/429)에 대해 지수 백오프로 제한된 횟수만큼 재시도
+# - 1차 rate limit 소진(X-RateLimit-Remaining: 0)은 초기화까지 최대 1시간이라 재시도하지 않고 바로 GitHubError
+# - 지연 시간 및 rate limit 헤더 기록 (on_request(method, path, status, 초) 콜백으로도 전달)
+class GitHubClient:
+    def __init__(self, api_url, token, timeout=(3.05, 10), max_retries=3, backoff=0.5,
+                 max_backoff=10.0, pool_size=10, sleep=time.sleep, on_request=None):
+        self.api_url = api_url.rstrip("/")
+        self.repo_url = self.api_url.rsplit("/contents", 1)[0]  # blobs API 등 저장소 단위 경로
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._sleep = sleep
+        self.on_request = on_request
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"token {token}",
+            "Accept": "application/vnd.github+json",
+        })
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._lock = threading.Lock()
+        self.latencies = deque(maxlen=1000)  # 최근 요청 지연 시간 (초)
+        self.stats = {"requests": 0, "retries": 0, "errors": 0}
+        self.rate_limit = {"limit": None, "remaining": None, "reset": None}
+
+    def _record(self, response, elapsed):
+        with self._lock:
+            self.stats["requests"] += 1
+            self.latencies.append(elapsed)
+            if response is None:
+                self.stats["errors"] += 1
+                return
+            for key in self.rate_limit:
+                value = response.headers.get(f"X-RateLimit-{key.capitalize()}")
+                if value is not None:
+                    self.rate_limit[key] = int(value)
+
+    # 재시도할 응답인지, 그렇다면 몇 초 기다릴지
+    def _retry_delay(self, response, attempt):
+        delay = min(self.backoff * (2 ** attempt), self.max_backoff)
+        if response is None or response.status_code in RETRY_STATUS:
+            return delay
+        if response.status_code in (403, 429):
+            retry_after = response.headers.get("Retry-After")
+            if retry_after is not None:
+                try:
+                    return min(float(retry_after), self.max_backoff)
+                except ValueError:
+                    return delay
+            if "secondary rate limit" in response.text.lower():
+                return delay
+        return None
+
+    # 1차 rate limit 소진 응답이면 초기화 시각, 아니면 None
+    @staticmethod
+    def _primary_limit_reset(response):
+        if response.status_code not in (403, 429) or response.headers.get("X-RateLimit-Remaining") != "0":
+            return None
+        try:
+            return int(response.headers.get("X-RateLimit-Reset"))
+        except (TypeError, ValueError):
+            return 0
+
+    # path는 base(기본은 contents API 주소) 아래 상대 경로
+    def request(self, method, path, base=None, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        url = f"{base or self.api_url}/{path}"
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                response = None
+            elapsed = time.perf_counter() - start
+            self._record(response, elapsed)
+            if self.on_request is not None:
+                self.on_request(method, path, response.status_code if response is not None else None, elapsed)
+
+            delay = self._retry_delay(response, attempt)
+            if delay is None or attempt >= self.max_retries:
+                if response is None:
+                    raise GitHubError(path, None)
+                reset = self._primary_limit_reset(response)
+                if reset is not None and delay is None:
+                    raise GitHubError(path, response.status_code, reset=reset)
+                return response
+            with self._lock:
+                self.stats["retries"] += 1
+            self._sleep(delay)
+            attempt += 1
+
+    # 파일 내용 조회, etag를 주면 조건부 요청 (변경 없으면 304 응답 그대로 반환)
+    def get_contents(self, path, etag=None):
+        headers = {"If-None-Match": etag} if etag else {}
+        response = self.request("GET", path, headers=headers)
+        if response.status_code not in (200, 304):
+            raise GitHubError(path, response.status_code)
+        return response
+
+    # get_contents 응답 본문의 파일 내용 (bytes)
+    # 1MB가 넘는 파일은 contents API가 내용 없이 encoding "none"을 돌려주므로 sha로 blob 원본을 받음
+    def file_content(self, path, body):
+        encoding = body.get("encoding", "base64")
+        if encoding == "base64":
+            return base64.b64decode(body.get("content") or "")
+        if encoding == "none":
+            return self.get_blob(body["sha"])
+        raise GitHubError(path, 200, message=f"지원하지 않는 파일 encoding: {encoding}")
+
+    # blob 원본 내용 (최대 100MB)
+    def get_blob(self, sha):
+        path = f"git/blobs/{sha}"
+        response = self.request("GET", path, base=self.repo_url, headers={"Accept": "application/vnd.github.raw"})
+        if response.status_code != 200:
+            raise GitHubError(path, response.status_code)
+        return response.content
+
+    # 파일 전체를 커밋, 새 sha 반환 (sha가 None이면 새 파일 생성)
+    def put_contents(self, path, text, sha, message):
+        data = {
+            "message": message,
+            "content": base64.b64encode(text.encode("utf-8")).decode("utf-8"),
+        }
+        if sha is not None:
+            data["sha"] = sha
+        response = self.request("PUT", path, json=data)
+        if response.status_code not in (200, 201):
+            raise GitHubError(path, response.status_code)
+        return response.json()["content"]["sha"]
+
+    # 파일 삭제 커밋
+    def delete_contents(self, path, sha, message):
+        response = self.request("DELETE", path, json={"message": message, "sha": sha})
+        if response.status_code != 200:
+            raise GitHubError(path, response.status_code)
+
+    # 최근 요청 지연 시간 요약 (밀리초)
+    def latency_summary(self):
+        with self._lock:
+            samples = sorted(self.latencies)
+        if not samples:
+            return {"count": 0, "p50_ms": None, "p95_ms": None}
+        return {
+            "count": len(samples),
+            "p50_ms": round(samples[len(samples) // 2] * 1000, 2),
+            "p95_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))] * 1000, 2),
+        }
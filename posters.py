@@ -0,0 +1,137 @@
+import argparse
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow가 없으면 원본 파일을 그대로 사용
+    Image = None
+
+POSTER_FOLDER = "poster_url"
+CACHE_FOLDER = os.path.join(".cache", "posters")
+
+
+# 포스터 썸네일 서비스
+# - poster_url 폴더를 한 번 스캔해 파일명 -> (mtime, 크기) 조회 (렌더마다 stat 하지 않음)
+# - width(및 배율) 크기의 썸네일을 디스크 캐시에 생성, 원본 mtime이 바뀌면 키가 달라져 재생성
+# - 인코딩된 썸네일 bytes는 바이트 예산이 있는 메모리 LRU에 보관
+class PosterService:
+    def __init__(self, source_dir=POSTER_FOLDER, cache_dir=CACHE_FOLDER, width=200,
+                 max_memory_bytes=32 * 1024 * 1024, quality=80):
+        self.source_dir = source_dir
+        self.cache_dir = cache_dir
+        self.width = width
+        self.quality = quality
+        self.max_memory_bytes = max_memory_bytes
+        self._lock = threading.Lock()
+        self._lru = OrderedDict()  # 캐시 키 -> bytes
+        self._lru_bytes = 0
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "generated": 0}
+        self.files = {}
+        self.rescan()
+
+    # 원본 폴더 스캔 (파일명 -> (mtime_ns, 크기))
+    def rescan(self):
+        files = {}
+        if os.path.isdir(self.source_dir):
+            with os.scandir(self.source_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and not entry.name.startswith("."):
+                        stat = entry.stat()
+                        files[entry.name] = (stat.st_mtime_ns, stat.st_size)
+        self.files = files
+        return len(files)
+
+    def exists(self, name):
+        return isinstance(name, str) and name in self.files
+
+    # 원본 파일명/mtime/크기/출력 크기로 만든 캐시 키
+    def _key(self, name, scale):
+        mtime, size = self.files[name]
+        raw = f"{name}\0{mtime}\0{size}\0{self.width * scale}\0{self.quality}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _remember(self, key, data):
+        with self._lock:
+            if key in self._lru:
+                return
+            self._lru[key] = data
+            self._lru_bytes += len(data)
+            while self._lru_bytes > self.max_memory_bytes and len(self._lru) > 1:
+                _, evicted = self._lru.popitem(last=False)
+                self._lru_bytes -= len(evicted)
+
+    def _render(self, name, scale):
+        source = os.path.join(self.source_dir, name)
+        if Image is None:
+            with open(source, "rb") as f:
+                return f.read()
+        with Image.open(source) as image:
+            target = self.width * scale
+            if image.width > target:
+                height = max(1, round(image.height * target / image.width))
+                image = image.resize((target, height), Image.LANCZOS)
+            buffer = io.BytesIO()
+            image.save(buffer, format="WEBP", quality=self.quality)
+            return buffer.getvalue()
+
+    # 썸네일 bytes, 포스터가 없으면 None
+    def thumbnail(self, name, scale=1):
+        if not self.exists(name):
+            return None
+        key = self._key(name, scale)
+        with self._lock:
+            data = self._lru.get(key)
+            if data is not None:
+                self._lru.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return data
+
+        path = os.path.join(self.cache_dir, f"{key}.webp")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                data = f.read()
+            self.stats["disk_hits"] += 1
+        else:
+            try:
+                data = self._render(name, scale)
+            except OSError:  # 손상된 이미지
+                return None
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+            self.stats["generated"] += 1
+        self._remember(key, data)
+        return data
+
+    # 폴더 전체 썸네일 미리 생성, 생성/확인한 파일 수 반환 (앱은 1배 크기만 사용, 고해상도용이 필요하면 scales에 2 추가)
+    def warm_up(self, scales=(1,)):
+        count = 0
+        for name in sorted(self.files):
+            for scale in scales:
+                self.thumbnail(name, scale)
+                count += 1
+        return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="포스터 썸네일 캐시 미리 생성")
+    parser.add_argument("--source", default=POSTER_FOLDER)
+    parser.add_argument("--cache", default=CACHE_FOLDER)
+    parser.add_argument("--width", type=int, default=200)
+    parser.add_argument("--scales", type=int, nargs="+", default=[1])
+    args = parser.parse_args()
+
+    service = PosterService(args.source, args.cache, width=args.width)
+    count = service.warm_up(args.scales)
+    print(f"{len(service.files)}개 포스터, {count}개 썸네일 준비 완료 "
+          f"(생성 {service.stats['generated']}, 디스크 캐시 {service.stats['disk_hits']})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+def _percentile(sorted_samples, q):
+    return sorted_samples[min(len(sorted_samples) - 1, int(len(sorted_samples) * q))]
+
+
+# 스크립트 실행(rerun) 단계별 시간 측정
+# - phase(name) 구간의 소요 시간을 이름별로 최근 max_samples개까지 메모리에 보관
+# - trace_path를 주면 rerun마다 단계별 시간을 JSON lines로 기록
+# Streamlit은 세션별 스레드에서 스크립트를 실행하므로 현재 rerun 정보는 스레드 로컬에 둠
+class Profiler:
+    def __init__(self, max_samples=500, trace_path=None):
+        self.max_samples = max_samples
+        self.trace_path = trace_path
+        self._lock = threading.Lock()
+        self._samples = {}  # 단계 이름 -> deque(초)
+        self._counts = {}
+        self._local = threading.local()
+
+    def record(self, name, seconds):
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.max_samples)
+            samples.append(seconds)
+            self._counts[name] = self._counts.get(name, 0) + 1
+        run = getattr(self._local, "run", None)
+        if run is not None:
+            run["phases"][name] = run["phases"].get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    # 현재 rerun 시작부터 지금까지의 시간 기록 (예: 첫 화면 출력 시점)
+    def mark(self, name):
+        run = getattr(self._local, "run", None)
+        if run is not None:
+            self.record(name, time.perf_counter() - run["start"])
+
+    # rerun 시작/끝 (끝날 때 전체 시간을 "run"으로 기록하고 trace 출력)
+    def begin_run(self, session=None):
+        self._local.run = {"session": session, "start": time.perf_counter(), "phases": {}}
+
+    def end_run(self):
+        run = getattr(self._local, "run", None)
+        if run is None:
+            return
+        self._local.run = None
+        total = time.perf_counter() - run["start"]
+        self.record("run", total)
+        if self.trace_path:
+            line = {
+                "ts": time.time(),
+                "session": run["session"],
+                "total_ms": round(total * 1000, 3),
+                "phases": {name: round(seconds * 1000, 3) for name, seconds in run["phases"].items()},
+            }
+            with self._lock, open(self.trace_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(line, ensure_ascii=False) + "\n")
+
+    # 단계별 횟수와 p50/p95 (밀리초)
+    def summary(self):
+        with self._lock:
+            snapshot = {name: (self._counts[name], sorted(samples)) for name, samples in self._samples.items()}
+        rows = []
+        for name, (count, samples) in sorted(snapshot.items()):
+            rows.append({
+                "phase": name,
+                "count": count,
+                "p50_ms": round(_percentile(samples, 0.5) * 1000, 2),
+                "p95_ms": round(_percentile(samples, 0.95) * 1000, 2),
+                "max_ms": round(samples[-1] * 1000, 2),
+            })
+        return rows
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
@@ -0,0 +1,150 @@
+import numpy as np
+import pandas as pd
+
+# 값이 큰 순서로 상위 k개 행 번호 (전체 정렬 대신 부분 정렬)
+# 동점은 행 번호 순 (전체 stable 정렬과 같은 결과), NaN은 맨 뒤
+def top_k(values, k):
+    values = np.nan_to_num(np.asarray(values, dtype=float), nan=-np.inf)
+    n = len(values)
+    k = min(k, n)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < n:
+        kth = np.partition(values, n - k)[n - k]  # k번째로 큰 값
+        above = np.flatnonzero(values > kth)
+        ties = np.flatnonzero(values == kth)[:k - len(above)]
+        rows = np.concatenate([above, ties])
+    else:
+        rows = np.arange(n)
+    return rows[np.lexsort((rows, -values[rows]))]
+
+
+# 영화(카탈로그 행)별 평점 통계 테이블
+# 평점 수/합계/제곱합/리뷰 수를 배열로 들고 평점 추가/수정/삭제 때 델타로 갱신
+# 평균/분산/베이지안 평균은 조회 시 배열 연산으로 계산
+class RatingStats:
+    def __init__(self, catalog, prior_weight=5.0):
+        self.catalog = catalog
+        self.prior_weight = prior_weight
+        n = len(catalog)
+        self.count = np.zeros(n, dtype=np.int64)
+        self.sum = np.zeros(n)
+        self.sumsq = np.zeros(n)
+        self.review_count = np.zeros(n, dtype=np.int64)
+
+    def _row(self, movie):
+        return self.catalog.title_to_row.get(movie)
+
+    def add(self, movie, rating, has_review=False):
+        i = self._row(movie)
+        if i is None:
+            return
+        self.count[i] += 1
+        self.sum[i] += rating
+        self.sumsq[i] += rating * rating
+        if has_review:
+            self.review_count[i] += 1
+
+    def remove(self, movie, rating, has_review=False):
+        i = self._row(movie)
+        if i is None:
+            return
+        self.count[i] -= 1
+        if self.count[i]:
+            self.sum[i] -= rating
+            self.sumsq[i] -= rating * rating
+        else:
+            # 부동소수점 오차가 남지 않도록 마지막 평점 삭제 시 초기화
+            self.sum[i] = self.sumsq[i] = 0.0
+        if has_review:
+            self.review_count[i] -= 1
+
+    # 영화 한 편의 값 (카탈로그에 없는 영화는 평점이 없는 것으로 봄)
+    def movie_count(self, movie):
+        i = self._row(movie)
+        return 0 if i is None else int(self.count[i])
+
+    def movie_review_count(self, movie):
+        i = self._row(movie)
+        return 0 if i is None else int(self.review_count[i])
+
+    # 평균 평점, 평점이 없으면 None
+    def movie_average(self, movie):
+        i = self._row(movie)
+        if i is None or not self.count[i]:
+            return None
+        return float(self.sum[i] / self.count[i])
+
+    # 평점 목록 전체로 다시 계산
+    @classmethod
+    def from_records(cls, catalog, records, prior_weight=5.0):
+        stats = cls(catalog, prior_weight)
+        rows, ratings, reviewed = [], [], []
+        for r in records:
+            i = stats._row(r["movie"])
+            if i is not None:
+                rows.append(i)
+                ratings.append(float(r["rating"]))
+                reviewed.append(r.get("review") is not None)
+        n = len(catalog)
+        rows = np.asarray(rows, dtype=np.int64)
+        ratings = np.asarray(ratings, dtype=float)
+        stats.count = np.bincount(rows, minlength=n).astype(np.int64)
+        stats.sum = np.bincount(rows, weights=ratings, minlength=n)
+        stats.sumsq = np.bincount(rows, weights=ratings ** 2, minlength=n)
+        stats.review_count = np.bincount(rows[np.asarray(reviewed, dtype=bool)], minlength=n).astype(np.int64)
+        return stats
+
+    # 다시 계산한 값과 일치하는지 확인
+    def matches(self, other):
+        return (
+            np.array_equal(self.count, other.count)
+            and np.array_equal(self.review_count, other.review_count)
+            and np.allclose(self.sum, other.sum)
+            and np.allclose(self.sumsq, other.sumsq)
+        )
+
+    # 평균 평점 (평점이 없으면 0)
+    def mean(self):
+        return np.divide(self.sum, self.count, out=np.zeros(len(self.sum)), where=self.count > 0)
+
+    def variance(self):
+        mean = self.mean()
+        variance = np.divide(self.sumsq, self.count, out=np.zeros(len(self.sum)), where=self.count > 0) - mean ** 2
+        return np.maximum(variance, 0.0)
+
+    # 전체 평균 쪽으로 당긴 평균: (합계 + 전체 평균 * w) / (평점 수 + w)
+    def bayesian_mean(self):
+        total = self.count.sum()
+        prior = self.sum.sum() / total if total else 0.0
+        return (self.sum + prior * self.prior_weight) / (self.count + self.prior_weight)
+
+    def column(self, criterion):
+        if criterion == "count":
+            return self.count
+        if criterion == "review_count":
+            return self.review_count
+        if criterion == "mean":
+            return self.mean()
+        if criterion == "bayesian_mean":
+            return self.bayesian_mean()
+        raise ValueError(f"알 수 없는 기준: {criterion}")
+
+    # 기준별 상위 k개 영화 행 번호 (평균 기준은 평점이 있는 영화를 먼저)
+    def top_k(self, criterion, k):
+        values = self.column(criterion).astype(float)
+        if criterion in ("mean", "bayesian_mean"):
+            values = np.where(self.count > 0, values, -np.inf)
+        return top_k(values, k)
+
+    # 관리자 보기용 표 (평점 수 상위 k개, 평점이 있는 영화만)
+    def table(self, k=20):
+        rows = top_k(self.count, min(k, int(np.count_nonzero(self.count))))
+        return pd.DataFrame({
+            "영화 제목": [self.catalog.titles[i] for i in rows],
+            "평점 수": self.count[rows],
+            "리뷰 수": self.review_count[rows],
+            "평균": self.mean()[rows].round(2),
+            "표준편차": np.sqrt(self.variance()[rows]).round(2),
+            "베이지안 평균": self.bayesian_mean()[rows].round(2),
+        })
@@ -0,0 +1,313 @@
+import hashlib
+import json
+import threading
+import time
+import uuid
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from github_client import GitHubError
+from write_queue import CONFLICT_STATUS, KEY_COLUMNS, apply_mutations
+
+ORDER_COLUMN = "logged_at"  # 행이 처음 기록된 순서 (조각 파일에만 저장, load() 결과에는 없음)
+
+
+def segment_name(now=None):
+    now = time.time() if now is None else now
+    return f"{int(now * 1000):013d}-{uuid.uuid4().hex[:8]}.jsonl"
+
+
+def encode_segment(mutations):
+    return "".join(json.dumps({"op": op, "row": row}, ensure_ascii=False) + "\n" for op, row in mutations)
+
+
+def decode_segment(text):
+    return [(item["op"], item["row"]) for item in map(json.loads, text.splitlines()) if item]
+
+
+# 세그먼트의 추가/수정 행에 기록 순서(세그먼트 이름의 ms 시각 * 1000 + 세그먼트 안 위치)를 붙임
+# 조각은 사용자명 기준으로 나뉘어 있어 이어 붙인 순서가 기록 순서가 아니므로 이 값으로 다시 정렬
+def stamp_segment(name, mutations):
+    base = int(name.split("-", 1)[0]) * 1000
+    return [
+        (op, dict(row, **{ORDER_COLUMN: base + i}) if op == "upsert" else dict(row))
+        for i, (op, row) in enumerate(mutations)
+    ]
+
+
+def shard_name(shard):
+    return f"part-{shard:02d}.csv"
+
+
+# 사용자명으로 정하는 스냅샷 조각 번호 (프로세스/실행과 무관하게 같은 값)
+def shard_of(username, shards):
+    return zlib.crc32(str(username).encode("utf-8")) % shards
+
+
+# 디렉터리 목록 조회 상태 (이름 -> sha, ETag, 조회 시각)
+class _Listing:
+    def __init__(self, directory, suffix):
+        self.directory = directory
+        self.suffix = suffix
+        self.items = {}
+        self.etag = None
+        self.listed_at = None
+
+
+# 평점 변경 로그: 압축된 스냅샷 + 추가 전용 세그먼트 파일(ratings_log/*.jsonl)
+# - 스냅샷은 사용자명 해시로 나눈 조각 파일(ratings_snapshot/part-XX.csv), 조각이 모두 있기 전까지는 기존 movie_ratings.csv
+#   (파일 하나가 계속 커지면 압축 때마다 전체를 다시 올려야 하고 contents API로 1MB 넘게 읽을 수 없음)
+# - 쓰기는 변경 묶음 하나를 새 세그먼트 파일로 PUT (파일 전체를 다시 올리지 않음)
+# - 읽기는 세그먼트 목록 -> 세그먼트 내용 -> 스냅샷 순으로 받아 이름(시간) 순으로 병합
+# - 조각 파일의 행에는 처음 기록된 순서(logged_at)를 함께 저장하고 load()는 그 순서로 정렬 (레코드 id 순서 = 최신순)
+# - compact()는 세그먼트를 변경된 조각에만 합친 뒤 오래된 것부터 삭제 (처음에는 movie_ratings.csv를 나눠 모든 조각 생성)
+# 변경은 (username, movie) 키 기준 upsert/delete라 이미 스냅샷에 합쳐진 세그먼트를
+# 다시 적용해도 결과가 같음 (압축 도중에 읽어도 안전)
+class GitHubRatingsLog:
+    def __init__(self, client, cache, snapshot_path="movie_ratings.csv", log_dir="ratings_log",
+                 snapshot_dir="ratings_snapshot", shards=16,
+                 ttl=30, compact_every=50, max_conflict_retries=5, clock=time.monotonic):
+        self.client = client
+        self.cache = cache
+        self.snapshot_path = snapshot_path
+        self.log_dir = log_dir
+        self.snapshot_dir = snapshot_dir
+        self.shards = shards
+        self.key_columns = KEY_COLUMNS[snapshot_path]
+        self.ttl = ttl
+        self.compact_every = compact_every
+        self.max_conflict_retries = max_conflict_retries
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._log = _Listing(log_dir, ".jsonl")  # 세그먼트 이름 -> sha
+        self._parts = _Listing(snapshot_dir, ".csv")  # 스냅샷 조각 이름 -> sha
+        self._segments = {}  # 세그먼트 이름 -> 변경 목록 (세그먼트는 바뀌지 않으므로 계속 보관)
+        self._merged = None  # (version, DataFrame)
+        self.last_error = None
+        self.stats = {"segments_written": 0, "segments_read": 0, "compactions": 0, "shards_written": 0}
+
+    def _path(self, name):
+        return f"{self.log_dir}/{name}"
+
+    def _shard_path(self, shard):
+        return f"{self.snapshot_dir}/{shard_name(shard)}"
+
+    # 디렉터리의 파일 목록 {이름: sha}, TTL 안에서는 요청하지 않음
+    def _list(self, listing, force=False):
+        with self._lock:
+            if not force and listing.listed_at is not None and self._clock() - listing.listed_at < self.ttl:
+                return dict(listing.items)
+            etag = listing.etag
+        try:
+            response = self.client.get_contents(listing.directory, etag=etag)
+        except GitHubError as e:
+            if e.status_code != 404:
+                raise
+            items, etag = {}, None  # 아직 파일이 없음
+        else:
+            if response.status_code == 304:
+                with self._lock:
+                    listing.listed_at = self._clock()
+                    return dict(listing.items)
+            items = {
+                item["name"]: item["sha"] for item in response.json()
+                if item.get("type") == "file" and item["name"].endswith(listing.suffix)
+            }
+            etag = response.headers.get("ETag")
+        with self._lock:
+            vanished = set(listing.items) - set(items)
+            listing.items = items
+            listing.etag = etag
+            listing.listed_at = self._clock()
+            if listing is self._log and vanished:
+                # 알고 있던 세그먼트가 사라졌으면 압축된 것이므로 스냅샷도 다시 확인
+                self._parts.listed_at = None
+                self.cache.invalidate(self.snapshot_path)
+            return dict(items)
+
+    # 세그먼트 목록 (이름 순), TTL 안에서는 요청하지 않음
+    def list_segments(self, force=False):
+        return sorted(self._list(self._log, force))
+
+    # 조각이 모두 있으면 {조각 번호: sha}, 아니면 None (기존 movie_ratings.csv 사용)
+    def list_shards(self, force=False):
+        items = self._list(self._parts, force)
+        shas = {shard: items.get(shard_name(shard)) for shard in range(self.shards)}
+        return shas if all(shas.values()) else None
+
+    # 마지막으로 받은 조각 목록 {이름: sha} (요청하지 않음)
+    def _known_shards(self):
+        with self._lock:
+            return dict(self._parts.items)
+
+    # 세그먼트 내용, 이미 삭제(압축)된 세그먼트면 None
+    def _read_segment(self, name):
+        with self._lock:
+            if name in self._segments:
+                return self._segments[name]
+        try:
+            response = self.client.get_contents(self._path(name))
+        except GitHubError as e:
+            if e.status_code != 404:
+                raise
+            return None
+        mutations = stamp_segment(
+            name, decode_segment(self.client.file_content(self._path(name), response.json()).decode("utf-8"))
+        )
+        with self._lock:
+            self._segments[name] = mutations
+            self.stats["segments_read"] += 1
+        return mutations
+
+    # 스냅샷 (DataFrame, 버전 문자열): 조각이 모두 있으면 조각을 이어 붙이고, 아니면 movie_ratings.csv
+    def _read_snapshot(self, force=False):
+        shas = self.list_shards(force)
+        if shas is None:
+            return self.cache.fetch(self.snapshot_path)
+        frames = [self.cache.fetch(self._shard_path(shard), sha)[0] for shard, sha in sorted(shas.items())]
+        frames = [df for df in frames if len(df.columns)]
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        return df, ",".join(sha for _, sha in sorted(shas.items()))
+
+    # 변경 적용, 이미 있는 행은 처음 기록된 순서를 유지 (수정해도 최신순 위치가 바뀌지 않음)
+    def _merge(self, df, mutations):
+        return apply_mutations(df, self.key_columns, mutations, keep=(ORDER_COLUMN,)) if mutations else df
+
+    # 스냅샷 + 세그먼트를 병합한 (DataFrame, 버전) 반환, 버전은 스냅샷 sha와 세그먼트 이름으로 만듦
+    def load(self):
+        names = self.list_segments()
+        mutations, missing = [], False
+        for name in names:
+            segment = self._read_segment(name)
+            if segment is None:
+                missing = True
+            else:
+                mutations.extend(segment)
+        if missing:
+            # 목록을 받은 뒤 압축됨: 새 스냅샷에 포함되어 있음
+            self.cache.invalidate(self.snapshot_path)
+        base, sha = self._read_snapshot(force=missing)
+        version = hashlib.sha1("\n".join([sha or ""] + names).encode("utf-8")).hexdigest()
+        with self._lock:
+            if self._merged is not None and self._merged[0] == version:
+                return self._merged[1], version
+        df = self._merge(base, mutations)
+        if ORDER_COLUMN in df.columns:
+            # 기록 순서로 정렬 (기존 movie_ratings.csv의 행은 값이 없으므로 파일 순서대로 앞쪽)
+            df = df.sort_values(ORDER_COLUMN, kind="stable", na_position="first")
+            df = df.drop(columns=ORDER_COLUMN).reset_index(drop=True)
+        with self._lock:
+            self._merged = (version, df)
+        return df, version
+
+    # 변경 묶음을 새 세그먼트로 기록, 세그먼트가 compact_every개 이상 쌓이면 압축
+    def append(self, mutations):
+        name = segment_name()
+        sha = self.client.put_contents(
+            self._path(name), encode_segment(mutations), None, f"Append {len(mutations)} rating changes"
+        )
+        with self._lock:
+            self._log.items[name] = sha
+            self._segments[name] = stamp_segment(name, mutations)
+            self.stats["segments_written"] += 1
+            count = len(self._log.items)
+        if self.compact_every and count >= self.compact_every:
+            try:
+                self.compact()
+            except GitHubError as e:
+                # 세그먼트는 이미 기록됨, 압축은 다음 기회에
+                self.last_error = e
+        return name
+
+    # 조각 하나에 변경을 합쳐 커밋 (없는 조각은 base 행으로 새로 만듦), sha 충돌 시 최신 조각에 다시 병합
+    def _write_shard(self, shard, mutations, base, folded):
+        path = self._shard_path(shard)
+        for _ in range(self.max_conflict_retries + 1):
+            sha = self._known_shards().get(shard_name(shard))
+            if sha is None:
+                df = base
+            else:
+                self.cache.invalidate(path)
+                df, sha = self.cache.fetch(path)
+            df = self._merge(df, mutations)
+            try:
+                new_sha = self.client.put_contents(
+                    path, df.to_csv(index=False, encoding="utf-8"), sha,
+                    f"Compact {len(folded)} rating log segments into {shard_name(shard)}",
+                )
+            except GitHubError as e:
+                if e.status_code not in CONFLICT_STATUS:
+                    raise
+                # 다른 프로세스가 먼저 썼음: 목록을 다시 받아 최신 조각에 다시 병합
+                self._list(self._parts, force=True)
+                continue
+            with self._lock:
+                self._parts.items[shard_name(shard)] = new_sha
+                self.stats["shards_written"] += 1
+            return
+        raise GitHubError(path, 409)
+
+    # 세그먼트를 스냅샷 조각에 합치고 삭제, 합친 세그먼트 수 반환
+    def compact(self):
+        with self._compact_lock:
+            names = self.list_segments(force=True)
+            mutations, folded = [], []
+            for name in names:
+                segment = self._read_segment(name)
+                if segment is not None:
+                    mutations.extend(segment)
+                    folded.append(name)
+            if not folded:
+                return 0
+
+            by_shard = {}
+            for op, row in mutations:
+                by_shard.setdefault(shard_of(row["username"], self.shards), []).append((op, row))
+            self._list(self._parts, force=True)
+            existing = self._known_shards()
+            missing = [shard for shard in range(self.shards) if shard_name(shard) not in existing]
+            bases = {}
+            if missing:
+                # 처음 나눌 때: 기존 movie_ratings.csv를 사용자명 기준으로 나눠 없는 조각의 바탕으로 사용
+                self.cache.invalidate(self.snapshot_path)
+                legacy, _ = self.cache.fetch(self.snapshot_path)
+                # 기존 파일 순서를 기록 순서로 보존 (세그먼트의 값보다 항상 작음)
+                legacy = legacy.assign(**{ORDER_COLUMN: np.arange(len(legacy), dtype=np.int64)})
+                codes = np.fromiter(
+                    (shard_of(username, self.shards) for username in legacy.get("username", [])),
+                    dtype=np.int64, count=len(legacy) if "username" in legacy else 0,
+                )
+                for shard in missing:
+                    bases[shard] = legacy[codes == shard].reset_index(drop=True) if len(codes) else legacy
+            for shard in sorted(set(by_shard) | set(missing)):
+                self._write_shard(shard, by_shard.get(shard, []), bases.get(shard), folded)
+
+            # 오래된 세그먼트부터 삭제 (남은 세그먼트가 항상 최신 쪽 연속 구간이 되도록)
+            with self._lock:
+                shas = dict(self._log.items)
+            for name in folded:
+                try:
+                    self.client.delete_contents(self._path(name), shas[name], f"Remove compacted segment {name}")
+                except GitHubError as e:
+                    if e.status_code != 404 and e.status_code not in CONFLICT_STATUS:
+                        raise
+                with self._lock:
+                    self._log.items.pop(name, None)
+                    self._segments.pop(name, None)
+            with self._lock:
+                self.stats["compactions"] += 1
+            return len(folded)
+
+    # 다음 load()에서 세그먼트/조각 목록과 스냅샷을 다시 확인
+    def invalidate(self):
+        with self._lock:
+            self._log.listed_at = None
+            self._parts.listed_at = None
+        self.cache.invalidate(self.snapshot_path)
+
+    def segment_count(self):
+        with self._lock:
+            return len(self._log.items)
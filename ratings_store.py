@@ -0,0 +1,127 @@
+import math
+import threading
+from collections import defaultdict
+from itertools import islice
+
+
+# 리뷰 값 정규화 (CSV에서 빈 리뷰는 NaN으로 읽힘)
+def normalize_review(review):
+    if review is None:
+        return None
+    if isinstance(review, float) and math.isnan(review):
+        return None
+    review = str(review)
+    return review if review else None
+
+
+# 사용자별 인덱스를 유지하는 평점 저장소
+# 영화별 집계는 stats(RatingStats), 영화별 리뷰 목록은 reviews(ReviewIndex, 선택)에 평점 추가/수정/삭제를 함께 반영
+# 여러 세션이 함께 읽으므로 변경과 목록 조회는 잠금 안에서 처리
+class RatingsStore:
+    def __init__(self, records=None, *, stats, reviews=None):
+        self.stats = stats
+        self.reviews = reviews
+        self._lock = threading.RLock()
+        self._rows = {}  # rid -> 평점 레코드
+        self._next_id = 0
+        self._by_user = defaultdict(dict)  # 사용자명 -> {rid: None} (삽입 순서 유지)
+        self._pairs = defaultdict(int)  # (사용자명, 영화 제목) -> 레코드 수
+        for record in records or []:
+            self._append(record['username'], record['movie'], record['rating'], record.get('review'))
+
+    def __len__(self):
+        return len(self._rows)
+
+    # 인덱스 및 집계에 레코드 반영
+    def _index(self, rid, row):
+        movie, username = row['movie'], row['username']
+        self._by_user[username][rid] = None
+        self._pairs[(username, movie)] += 1
+        self.stats.add(movie, row['rating'], row['review'] is not None)
+        if self.reviews is not None and row['review'] is not None:
+            self.reviews.add(rid, row)
+
+    # 인덱스 및 집계에서 레코드 제거
+    def _unindex(self, rid, row):
+        movie, username = row['movie'], row['username']
+        del self._by_user[username][rid]
+        if not self._by_user[username]:
+            del self._by_user[username]
+        self._pairs[(username, movie)] -= 1
+        if not self._pairs[(username, movie)]:
+            del self._pairs[(username, movie)]
+        self.stats.remove(movie, row['rating'], row['review'] is not None)
+        if self.reviews is not None and row['review'] is not None:
+            self.reviews.remove(rid, row)
+
+    def _append(self, username, movie, rating, review):
+        rid = self._next_id
+        self._next_id += 1
+        row = {
+            'username': username,
+            'movie': movie,
+            'rating': float(rating),
+            'review': normalize_review(review),
+        }
+        self._rows[rid] = row
+        self._index(rid, row)
+        return rid
+
+    # 평점 추가, 새 레코드의 id 반환
+    def append(self, username, movie, rating, review=None):
+        with self._lock:
+            return self._append(username, movie, rating, review)
+
+    # 평점/리뷰 수정
+    def edit(self, rid, rating, review=None):
+        with self._lock:
+            row = self._rows[rid]
+            self._unindex(rid, row)
+            row['rating'] = float(rating)
+            row['review'] = normalize_review(review)
+            self._index(rid, row)
+
+    # 평점 삭제
+    def delete(self, rid):
+        with self._lock:
+            row = self._rows.pop(rid)
+            self._unindex(rid, row)
+            return row
+
+    def get(self, rid):
+        return self._rows[rid]
+
+    # 사용자/영화 쌍의 첫 레코드 id, 없으면 None
+    def find(self, username, movie):
+        with self._lock:
+            if (username, movie) not in self._pairs:
+                return None
+            return next(rid for rid in self._by_user[username] if self._rows[rid]['movie'] == movie)
+
+    # (rid, 레코드) 목록, 삽입 순서의 offset부터 limit개 (전체를 복사하지 않음)
+    def items(self, offset=0, limit=None):
+        with self._lock:
+            return list(islice(self._rows.items(), offset, None if limit is None else offset + limit))
+
+    # CSV/DataFrame 저장용 레코드 목록
+    def to_records(self):
+        with self._lock:
+            return [dict(row) for row in self._rows.values()]
+
+    def has_rated(self, username, movie):
+        return (username, movie) in self._pairs
+
+    def movie_count(self, movie):
+        return self.stats.movie_count(movie)
+
+    def movie_review_count(self, movie):
+        return self.stats.movie_review_count(movie)
+
+    # 영화 평균 평점, 평점이 없으면 None
+    def movie_average(self, movie):
+        return self.stats.movie_average(movie)
+
+    # 사용자가 남긴 레코드 목록
+    def user_ratings(self, username):
+        with self._lock:
+            return [self._rows[rid] for rid in self._by_user.get(username, ())]
@@ -0,0 +1,199 @@
+import threading
+
+import numpy as np
+import scipy.sparse as sp
+
+
+def _normalize_rows(matrix):
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sp.diags(1.0 / norms) @ matrix
+
+
+# 영화 추천 엔진
+# - 사용자 x 영화 희소 평점 행렬(movie_ratings.csv)로 아이템-아이템 코사인 유사도 기반 개인화 추천
+#   (유사도 행렬을 만들지 않고 X^T X r_u 를 희소 행렬-벡터 곱 두 번으로 계산)
+# - 평점이 적은 사용자는 장르/감독/배우(movie_data.csv) 내용 유사도를 함께 사용
+# - 새 평점은 델타 행렬에 쌓았다가 일정 크기가 되면 기본 행렬에 합침
+class Recommender:
+    def __init__(self, catalog, cold_start_threshold=3, content_weight=0.5, merge_threshold=10000):
+        self.n_items = len(catalog.titles)
+        self.item_index = catalog.title_to_row  # 공유 Catalog의 맵 (읽기만 함)
+        self.cold_start_threshold = cold_start_threshold
+        self.content_weight = content_weight
+        self.merge_threshold = merge_threshold
+        self.version = None
+        self._lock = threading.Lock()
+        self._content = self._content_matrix(catalog)
+        self._reset()
+
+    # 영화 x (장르/감독/배우) 특징 행렬, 행 단위 정규화 (Catalog의 펼친 코드 배열을 열 구간별로 이어 붙임)
+    def _content_matrix(self, catalog):
+        rows, cols, width = [], [], 0
+        for vocab, offsets, codes in (
+            (catalog.genre_vocab, catalog.genre_offsets, catalog.genre_codes),
+            (catalog.director_vocab, catalog.director_offsets, catalog.director_codes),
+            (catalog.actor_vocab, catalog.actor_offsets, catalog.actor_codes),
+        ):
+            rows.append(np.repeat(np.arange(len(offsets) - 1), np.diff(offsets)))
+            cols.append(codes.astype(np.int64) + width)
+            width += len(vocab)
+        rows, cols = np.concatenate(rows), np.concatenate(cols)
+        matrix = sp.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(self.n_items, max(1, width))
+        )
+        matrix.data[:] = 1.0  # 같은 토큰이 중복돼도 1
+        return _normalize_rows(matrix).tocsr()
+
+    def _reset(self):
+        self.user_index = {}
+        self.user_ratings = []  # 사용자 번호 -> {영화 번호: 평점}
+        self._base = sp.csr_matrix((0, self.n_items))
+        self._delta_rows, self._delta_cols, self._delta_vals = [], [], []
+        self._delta = None
+        self._norm_sq = np.zeros(self.n_items)
+        self._counts = np.zeros(self.n_items)
+        self._sums = np.zeros(self.n_items)
+
+    def _user(self, username, create=False):
+        u = self.user_index.get(username)
+        if u is None and create:
+            u = self.user_index[username] = len(self.user_ratings)
+            self.user_ratings.append({})
+        return u
+
+    # 평점 목록 전체로 모델 재구성
+    def fit(self, records, version=None):
+        with self._lock:
+            self._reset()
+            for r in records:
+                j = self.item_index.get(r["movie"])
+                if j is None:
+                    continue
+                u = self._user(r["username"], create=True)
+                self.user_ratings[u][j] = float(r["rating"])
+            rows, cols, vals = [], [], []
+            for u, items in enumerate(self.user_ratings):
+                for j, rating in items.items():
+                    rows.append(u)
+                    cols.append(j)
+                    vals.append(rating)
+            vals = np.asarray(vals, dtype=float)
+            cols = np.asarray(cols, dtype=np.int64)
+            self._base = sp.csr_matrix((vals, (rows, cols)), shape=(len(self.user_ratings), self.n_items))
+            self._norm_sq = np.bincount(cols, weights=vals ** 2, minlength=self.n_items).astype(float)
+            self._counts = np.bincount(cols, minlength=self.n_items).astype(float)
+            self._sums = np.bincount(cols, weights=vals, minlength=self.n_items).astype(float)
+            self.version = version
+
+    def _add_delta(self, u, j, value):
+        self._delta_rows.append(u)
+        self._delta_cols.append(j)
+        self._delta_vals.append(value)
+        self._delta = None
+        if len(self._delta_vals) >= self.merge_threshold:
+            self._merge()
+
+    def _delta_matrix(self):
+        if self._delta is None:
+            self._delta = sp.csr_matrix(
+                (self._delta_vals, (self._delta_rows, self._delta_cols)),
+                shape=(len(self.user_ratings), self.n_items),
+            )
+        return self._delta
+
+    def _merge(self):
+        delta = self._delta_matrix()
+        base = self._base
+        if base.shape[0] < delta.shape[0]:
+            base = sp.vstack([base, sp.csr_matrix((delta.shape[0] - base.shape[0], self.n_items))])
+        self._base = (base + delta).tocsr()
+        self._base.eliminate_zeros()
+        self._delta_rows, self._delta_cols, self._delta_vals = [], [], []
+        self._delta = None
+
+    # 평점 추가/수정 반영 (모델 전체를 다시 만들지 않음)
+    def set_rating(self, username, movie, rating):
+        j = self.item_index.get(movie)
+        if j is None:
+            return
+        rating = float(rating)
+        with self._lock:
+            u = self._user(username, create=True)
+            old = self.user_ratings[u].get(j)
+            self.user_ratings[u][j] = rating
+            self._add_delta(u, j, rating - (old or 0.0))
+            self._norm_sq[j] += rating ** 2 - (old or 0.0) ** 2
+            self._sums[j] += rating - (old or 0.0)
+            if old is None:
+                self._counts[j] += 1
+
+    # 평점 삭제 반영
+    def remove_rating(self, username, movie):
+        j = self.item_index.get(movie)
+        with self._lock:
+            u = self._user(username)
+            if j is None or u is None or j not in self.user_ratings[u]:
+                return
+            old = self.user_ratings[u].pop(j)
+            self._add_delta(u, j, -old)
+            self._norm_sq[j] = max(0.0, self._norm_sq[j] - old ** 2)
+            self._sums[j] -= old
+            self._counts[j] -= 1
+
+    # X^T X w (X = 기본 행렬 + 델타 행렬)
+    def _gram_product(self, w):
+        base = self._base
+        t = self._delta_matrix() @ w if self._delta_vals else np.zeros(len(self.user_ratings))
+        t[:base.shape[0]] += base @ w
+        s = base.T @ t[:base.shape[0]]
+        if self._delta_vals:
+            s += self._delta_matrix().T @ t
+        return s
+
+    def _collaborative_scores(self, items):
+        norms = np.sqrt(self._norm_sq)
+        norms[norms == 0] = np.inf
+        r = np.zeros(self.n_items)
+        for j, rating in items.items():
+            r[j] = rating
+        return self._gram_product(r / norms) / norms
+
+    def _content_scores(self, items):
+        if items:
+            profile = np.zeros(self.n_items)
+            for j, rating in items.items():
+                profile[j] = rating
+        else:
+            # 평점이 하나도 없으면 많이, 높게 평가된 영화를 기준으로 삼음
+            profile = self._popularity_scores()
+        scores = self._content @ (self._content.T @ profile)
+        total = scores.max(initial=0)
+        return scores / total if total > 0 else scores
+
+    # 베이지안 평균 x log(평점 수) 인기 점수
+    def _popularity_scores(self, prior_weight=5.0):
+        total = self._counts.sum()
+        prior = self._sums.sum() / total if total else 0.0
+        mean = (self._sums + prior * prior_weight) / (self._counts + prior_weight)
+        return mean * np.log1p(self._counts)
+
+    # 사용자 맞춤 추천 (영화 행 번호 목록, 점수 순)
+    def recommend(self, username, n=5, exclude_rated=True):
+        with self._lock:
+            u = self._user(username)
+            items = dict(self.user_ratings[u]) if u is not None else {}
+            scores = self._collaborative_scores(items) if items else np.zeros(self.n_items)
+            if scores.max(initial=0) > 0:
+                scores /= scores.max()
+            if len(items) < self.cold_start_threshold or not scores.any():
+                scores = scores + self.content_weight * self._content_scores(items)
+            # 동점이면 인기 순
+            scores = scores + 1e-9 * self._popularity_scores()
+        if exclude_rated and items:
+            scores[list(items)] = -np.inf
+        n = min(n, self.n_items - (len(items) if exclude_rated else 0))
+        if n <= 0:
+            return []
+        top = np.argpartition(-scores, n - 1)[:n]
+        return top[np.argsort(-scores[top], kind="stable")].tolist()
@@ -0,0 +1,71 @@
+import math
+
+import pandas as pd
+import streamlit as st
+
+
+# 페이지 수와 현재 페이지의 (시작, 끝) 인덱스
+def page_bounds(total, page_size, page):
+    total_pages = max(1, math.ceil(total / page_size))
+    page = min(max(1, page), total_pages)
+    start = (page - 1) * page_size
+    return start, min(start + page_size, total), total_pages
+
+
+# 페이지 번호 입력을 그리고 현재 페이지의 (시작, 끝) 반환
+def paginate(total, page_size, key, label="페이지 번호"):
+    total_pages = max(1, math.ceil(total / page_size))
+    # 검색 조건이 바뀌어 페이지 수가 줄었으면 마지막 페이지로
+    if st.session_state.get(key, 1) > total_pages:
+        st.session_state[key] = total_pages
+    page = st.number_input(label, min_value=1, max_value=total_pages, key=key)
+    start, end, _ = page_bounds(total, page_size, page)
+    st.caption(f"{page} / {total_pages} 페이지 (총 {total}건)")
+    return start, end
+
+
+# 현재 페이지 행만 레코드로 변환 (iterrows 대신)
+def page_records(df, start, end):
+    return df.iloc[start:end].to_dict("records")
+
+
+def format_value(value, default="정보 없음"):
+    if value is None or value is pd.NA or value is pd.NaT:
+        return default
+    if isinstance(value, float) and math.isnan(value):
+        return default
+    if isinstance(value, pd.Timestamp):
+        return value.strftime("%Y-%m-%d")
+    return value
+
+
+def format_running_time(value):
+    try:
+        return f"{int(value)}분"
+    except (TypeError, ValueError):
+        return "정보 없음"
+
+
+# 한 줄짜리 마크다운 (줄바꿈이 목록/강조를 깨지 않도록)
+def inline(text):
+    return " ".join(str(text).split())
+
+
+# 영화 카드: (라벨, 값) 목록을 하나의 마크다운 블록으로
+def movie_card(fields):
+    return "  \n".join(f"**{label}**: {inline(format_value(value))}" for label, value in fields)
+
+
+# 리뷰 목록 마크다운 블록
+def review_list(lines, empty="아직 리뷰가 없습니다."):
+    if not lines:
+        return empty
+    return "리뷰:\n\n" + "\n".join(f"- {inline(line)}" for line in lines)
+
+
+# 사이트 평점 표시 문자열
+def star_rating(avg_rating):
+    if avg_rating is None or pd.isna(avg_rating):
+        return "아직 평점이 없습니다."
+    avg_rating = round(avg_rating, 2)
+    return f"사이트 평점: {'⭐' * int(avg_rating)} ({avg_rating}/10)"
@@ -0,0 +1,161 @@
+import bisect
+import heapq
+import re
+import threading
+import unicodedata
+
+WORD = re.compile(r"\w+")
+
+
+# 리뷰/질의 정규화: 유니코드 정규화(NFC), 소문자
+def normalize_text(text):
+    return unicodedata.normalize("NFC", text).lower() if isinstance(text, str) else ""
+
+
+# 단어(한글 음절/영문/숫자 연속) 목록
+def tokenize(text):
+    return WORD.findall(normalize_text(text))
+
+
+# 단어 안의 2글자 조각 ("재밌어요" -> 재밌, 밌어, 어요), 한 글자 단어는 그대로
+# 띄어쓰기 없이 붙여 쓰는 한글 리뷰도 형태소 분석 없이 부분 일치로 찾을 수 있음
+def bigrams(token):
+    if len(token) < 2:
+        return {token}
+    return {token[i:i + 2] for i in range(len(token) - 1)}
+
+
+# 리뷰 역색인과 영화별 리뷰 목록 (RatingsStore의 레코드 id로 식별)
+# - 리뷰 텍스트의 단어별 2-gram -> 레코드 id 집합
+# - 영화별 최신순(레코드 id 순)/평점순 목록, 평점순은 처음 구성할 때는 모아서 조회 시 한 번 정렬하고 그 뒤로는 제자리 삽입
+# - RatingsStore(reviews=...)로 연결하면 평점 추가/수정/삭제 때 함께 갱신
+class ReviewIndex:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rows = {}  # rid -> 평점 레코드 (저장소의 레코드를 그대로 참조)
+        self._postings = {}  # 2-gram -> {rid}
+        self._char_grams = {}  # 글자 -> 그 글자를 포함하는 2-gram 집합 (한 글자 질의용)
+        self._recent = {}  # 영화 제목 -> 정렬된 rid 목록
+        self._by_rating = {}  # 영화 제목 -> (-평점, -rid) 목록
+        self._unsorted = set()  # 평점순 목록을 아직 정렬하지 않은 영화
+        self._last_rid = -1  # 지금까지 색인한 가장 큰 rid
+
+    def __len__(self):
+        return len(self._rows)
+
+    def add(self, rid, row):
+        movie = row['movie']
+        with self._lock:
+            self._rows[rid] = row
+            self._last_rid = max(self._last_rid, rid)
+            for gram in {g for token in tokenize(row['review']) for g in bigrams(token)}:
+                ids = self._postings.get(gram)
+                if ids is None:
+                    ids = self._postings[gram] = set()
+                    for ch in gram:
+                        self._char_grams.setdefault(ch, set()).add(gram)
+                ids.add(rid)
+            recent = self._recent.setdefault(movie, [])
+            if recent and recent[-1] > rid:
+                bisect.insort(recent, rid)
+            else:
+                recent.append(rid)
+            key = (-row['rating'], -rid)
+            by_rating = self._by_rating.get(movie)
+            if by_rating is None:
+                self._by_rating[movie] = [key]
+                self._unsorted.add(movie)
+            elif movie in self._unsorted:
+                by_rating.append(key)
+            else:
+                bisect.insort(by_rating, key)
+
+    # 레코드가 바뀌기 전에 호출 (색인할 때와 같은 리뷰/평점으로 제거)
+    def remove(self, rid, row):
+        movie = row['movie']
+        with self._lock:
+            del self._rows[rid]
+            for gram in {g for token in tokenize(row['review']) for g in bigrams(token)}:
+                ids = self._postings[gram]
+                ids.discard(rid)
+                if not ids:
+                    del self._postings[gram]
+                    for ch in gram:
+                        self._char_grams[ch].discard(gram)
+            recent = self._recent[movie]
+            del recent[bisect.bisect_left(recent, rid)]
+            by_rating = self._sorted_by_rating(movie)
+            del by_rating[bisect.bisect_left(by_rating, (-row['rating'], -rid))]
+            if not recent:
+                del self._recent[movie]
+                del self._by_rating[movie]
+                self._unsorted.discard(movie)
+
+    def _sorted_by_rating(self, movie):
+        by_rating = self._by_rating[movie]
+        if movie in self._unsorted:
+            by_rating.sort()
+            self._unsorted.discard(movie)
+        return by_rating
+
+    def movie_count(self, movie):
+        with self._lock:
+            return len(self._recent.get(movie, ()))
+
+    # 영화의 리뷰 레코드 한 페이지, order는 "recent"(최신순) 또는 "rating"(평점 높은 순, 같으면 최신순)
+    def movie_reviews(self, movie, order="recent", offset=0, limit=None):
+        end = None if limit is None else offset + limit
+        with self._lock:
+            if movie not in self._recent:
+                return []
+            if order == "recent":
+                # 오름차순 목록의 뒤쪽부터 잘라 뒤집음 (전체를 뒤집지 않음)
+                recent, n = self._recent[movie], len(self._recent[movie])
+                start = 0 if end is None else max(n - end, 0)
+                rids = recent[start:max(n - offset, 0)][::-1]
+            elif order == "rating":
+                rids = [-rid for _, rid in self._sorted_by_rating(movie)[offset:end]]
+            else:
+                raise ValueError(f"알 수 없는 정렬: {order}")
+            return [self._rows[rid] for rid in rids]
+
+    # 단어가 들어 있을 수 있는 리뷰의 rid 집합들 (2-gram별 목록, 한 글자 단어는 그 글자를 포함한 목록의 합집합)
+    def _candidates(self, token):
+        if len(token) == 1:
+            return [set().union(*(self._postings[gram] for gram in self._char_grams.get(token, ())))]
+        return [self._postings.get(gram, set()) for gram in bigrams(token)]
+
+    # 질의의 모든 단어를 부분 문자열로 포함하는 리뷰의 rid 집합
+    def search(self, query):
+        tokens = set(tokenize(query))
+        if not tokens:
+            return set()
+        with self._lock:
+            groups = sorted((ids for token in tokens for ids in self._candidates(token)), key=len)
+            result = groups[0].intersection(*groups[1:])  # 작은 집합부터 교집합 (항상 새 집합)
+            # 3글자 이상 단어는 2-gram이 모두 있어도 이어져 있지 않을 수 있으므로 원문으로 확인
+            long_tokens = [token for token in tokens if len(token) > 2]
+            if long_tokens and result:
+                result = {
+                    rid for rid in result
+                    if all(token in normalize_text(self._rows[rid]['review']) for token in long_tokens)
+                }
+        return result
+
+    # rid 집합의 최신순 offset부터 limit개 (rid, 레코드), 전체를 정렬하지 않음
+    def page(self, rids, offset=0, limit=None):
+        if limit is None:
+            ordered = sorted(rids, reverse=True)[offset:]
+        elif len(rids) * 4 >= len(self._rows):
+            # 대부분의 리뷰가 일치하면 최신 rid부터 내려가며 확인하는 편이 빠름
+            ordered = []
+            for rid in range(self._last_rid, -1, -1):
+                if rid in rids:
+                    ordered.append(rid)
+                    if len(ordered) == offset + limit:
+                        break
+            ordered = ordered[offset:]
+        else:
+            ordered = heapq.nlargest(offset + limit, rids)[offset:]
+        with self._lock:
+            return [(rid, self._rows[rid]) for rid in ordered if rid in self._rows]
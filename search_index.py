@@ -0,0 +1,173 @@
+import unicodedata
+
+import numpy as np
+
+# 한글 음절 분해용 호환 자모 표
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+JUNGSEONG = [
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ", "ㅗㅣ", "ㅛ", "ㅜ",
+    "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ",
+]
+JONGSEONG = [
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ",
+    "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ",
+]
+# 입력 중 겹모음/겹받침이 한 글자로 들어오는 경우
+COMPOUND_JAMO = {
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+    "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+}
+SYLLABLE_BASE, SYLLABLE_END = 0xAC00, 0xD7A3
+
+
+def is_syllable(ch):
+    return SYLLABLE_BASE <= ord(ch) <= SYLLABLE_END
+
+
+def is_jamo(ch):
+    return 0x3131 <= ord(ch) <= 0x318E
+
+
+# 검색용 정규화: 유니코드 정규화, 소문자, 공백 제거
+def normalize(text):
+    if not isinstance(text, str):
+        return ""
+    return "".join(unicodedata.normalize("NFC", text).lower().split())
+
+
+# 한글 음절을 호환 자모열로 분해 ("외계" -> "ㅇㅗㅣㄱㅖ")
+def to_jamo(text):
+    out = []
+    for ch in text:
+        if is_syllable(ch):
+            code = ord(ch) - SYLLABLE_BASE
+            out.append(CHOSEONG[code // 588])
+            out.append(JUNGSEONG[(code % 588) // 28])
+            out.append(JONGSEONG[code % 28])
+        else:
+            out.append(COMPOUND_JAMO.get(ch, ch))
+    return "".join(out)
+
+
+# 초성열 ("외계인" -> "ㅇㄱㅇ"), 한글이 아닌 글자는 그대로
+def to_choseong(text):
+    return "".join(CHOSEONG[(ord(ch) - SYLLABLE_BASE) // 588] if is_syllable(ch) else ch for ch in text)
+
+
+def _grams(text):
+    if len(text) < 2:
+        return {text} if text else set()
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+# 콤마로 구분된 목록 파싱 ("액션, 드라마" -> ["액션", "드라마"])
+def split_list(value):
+    if not isinstance(value, str):
+        return []
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+# 짧은 문자열들에 대한 부분 문자열 검색 인덱스
+# 정규화된 문자열의 1/2-gram 역색인으로 후보를 좁힌 뒤 자모열 포함 여부로 확인
+# 초성만 입력한 경우("ㅇㄱㅇ")는 초성열에서 검색
+class _TextIndex:
+    def __init__(self, texts):
+        self._jamo = []
+        self._choseong = []
+        self._grams = {}
+        self._cho_grams = {}
+        for i, text in enumerate(texts):
+            norm = normalize(text)
+            cho = to_choseong(norm)
+            self._jamo.append(to_jamo(norm))
+            self._choseong.append(cho)
+            for gram in _grams(norm) | set(norm):
+                self._grams.setdefault(gram, set()).add(i)
+            for gram in _grams(cho) | set(cho):
+                self._cho_grams.setdefault(gram, set()).add(i)
+
+    def __len__(self):
+        return len(self._jamo)
+
+    @staticmethod
+    def _lookup(postings, key):
+        result = None
+        for gram in sorted(_grams(key), key=lambda g: len(postings.get(g, ()))):
+            ids = postings.get(gram)
+            if not ids:
+                return set()
+            result = set(ids) if result is None else result & ids
+            if not result:
+                break
+        return result
+
+    # 질의를 포함하는 항목 번호 집합
+    def match(self, query):
+        q = normalize(query)
+        if not q:
+            return set(range(len(self._jamo)))
+
+        if any(ch in CHOSEONG for ch in q) and all(ch in CHOSEONG or not (is_syllable(ch) or is_jamo(ch)) for ch in q):
+            candidates = self._lookup(self._cho_grams, q)
+            return {i for i in candidates if q in self._choseong[i]}
+
+        # 마지막 글자는 입력 중일 수 있으므로 후보 조회에서 제외하고 자모열로 확인
+        key = q[:-1] if is_syllable(q[-1]) or is_jamo(q[-1]) else q
+        key = "".join(ch for ch in key if not is_jamo(ch))
+        candidates = self._lookup(self._grams, key) if key else range(len(self._jamo))
+        q_jamo = to_jamo(q)
+        return {i for i in candidates if q_jamo in self._jamo[i]}
+
+
+# 영화 목록 검색 인덱스: 제목, 장르/감독/배우 역색인 (Catalog의 펼친 코드 배열로 구성)
+class SearchIndex:
+    def __init__(self, catalog):
+        self.size = len(catalog)
+        self._titles = _TextIndex(catalog.titles)
+        self.genres = self._invert(catalog.genre_vocab, catalog.genre_offsets, catalog.genre_codes)
+        self.directors = self._invert(catalog.director_vocab, catalog.director_offsets, catalog.director_codes)
+        self.actors = self._invert(catalog.actor_vocab, catalog.actor_offsets, catalog.actor_codes)
+        self._director_names = list(self.directors)
+        self._actor_names = list(self.actors)
+        self._director_index = _TextIndex(self._director_names)
+        self._actor_index = _TextIndex(self._actor_names)
+
+    # 항목 -> 행 번호 집합 (코드 순으로 정렬해 항목별 구간을 잘라냄)
+    @staticmethod
+    def _invert(vocab, offsets, codes):
+        order = np.argsort(codes, kind="stable")
+        rows = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))[order].tolist()
+        bounds = np.searchsorted(codes[order], np.arange(len(vocab) + 1)).tolist()
+        return {item: set(rows[bounds[c]:bounds[c + 1]]) for c, item in enumerate(vocab)}
+
+    # 장르 선택지 (개별 장르, 가나다순)
+    def genre_options(self):
+        return sorted(self.genres)
+
+    def _people(self, text_index, names, inverted, query):
+        ids = set()
+        for i in text_index.match(query):
+            ids |= inverted[names[i]]
+        return ids
+
+    # 조건에 맞는 행 번호 목록 (원래 순서 유지)
+    def search(self, title="", genre=None, director="", actor=""):
+        sets = []
+        if genre:
+            sets.append(self.genres.get(genre, set()))
+        if director:
+            sets.append(self._people(self._director_index, self._director_names, self.directors, director))
+        if actor:
+            sets.append(self._people(self._actor_index, self._actor_names, self.actors, actor))
+        if normalize(title):
+            sets.append(self._titles.match(title))
+        if not sets:
+            return list(range(self.size))
+        sets.sort(key=len)
+        result = set(sets[0])
+        for ids in sets[1:]:
+            result &= ids
+            if not result:
+                break
+        return sorted(result)
@@ -0,0 +1,148 @@
+import threading
+
+from rating_stats import RatingStats
+from ratings_store import RatingsStore, normalize_review
+from review_index import ReviewIndex
+
+
+# 프로세스 전체가 공유하는 평점 저장소와 영화별 통계/리뷰 색인 (세션마다 평점을 받아 인덱스를 만들지 않음)
+# - refresh()는 fetch()로 받은 (DataFrame, 버전)의 버전이나 영화 목록이 바뀐 경우에만 새 저장소를 만들어 교체
+# - 백그라운드 스레드가 interval 초마다 refresh() 호출 (fetch는 TTL/ETag 조건부 요청이라 바뀐 게 없으면 가벼움)
+# - 세션은 rerun마다 store를 읽기만 하고, 교체되면 다음 rerun에서 새 저장소를 봄
+# - append/edit/delete는 잠금 안에서 on_change(로컬 저장 + GitHub 반영 접수, 변경 번호 반환)와 메모리 변경을 함께 처리
+# - 새 저장소로 교체할 때 커밋이 확인되지 않은 이 프로세스의 변경(대기 중, 실패)은 다시 적용
+# - recommender(catalog)를 주면 추천 모델도 교체할 때 새로 학습해 함께 교체 (세션 스크립트 스레드에서 학습하지 않음)
+class SharedRatings:
+    def __init__(self, fetch, catalog, on_change=None, committed=None, interval=30.0, recommender=None):
+        self._fetch = fetch
+        self._catalog = catalog  # 현재 영화 목록(Catalog)을 돌려주는 함수
+        self.on_change = on_change
+        self._committed = committed  # 변경 번호가 GitHub에 커밋됐는지 돌려주는 함수 (없으면 바로 커밋된 것으로 봄)
+        self.interval = interval
+        self._recommender = recommender  # 영화 목록으로 추천 모델을 만드는 함수 (fit/set_rating/remove_rating)
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._local = []  # 마지막으로 받은 GitHub 내용에 없을 수 있는 변경 (변경 번호, op, row)
+        self.catalog = catalog()
+        self.store = RatingsStore(stats=RatingStats(self.catalog), reviews=ReviewIndex())
+        self.recommender = recommender(self.catalog) if recommender is not None else None
+        self.version = None
+        self.last_error = None
+        self.stats = {"refreshes": 0, "rebuilds": 0, "errors": 0}
+        self._stop = threading.Event()
+        self._thread = None
+
+    # GitHub 내용을 다시 확인하고 바뀌었으면 저장소 교체, 교체했으면 True
+    # fetch를 주면 그 함수로 읽음 (GitHub을 읽지 못할 때 로컬 저장소로 구성하는 경우)
+    def refresh(self, fetch=None):
+        with self._refresh_lock:
+            with self._lock:
+                # 받아 오기 전에 커밋이 확인된 변경은 이번에 받을 내용에 들어 있음
+                committed = {
+                    seq for seq, _, _ in self._local if self._committed is None or self._committed(seq)
+                }
+            df, version = (fetch or self._fetch)()
+            catalog = self._catalog()
+            self.stats["refreshes"] += 1
+            if version == self.version and catalog is self.catalog:
+                return False
+            records = df.to_dict('records') if not df.empty else []
+            store = RatingsStore(records, stats=RatingStats(catalog), reviews=ReviewIndex())
+            recommender = None
+            if self._recommender is not None:
+                recommender = self._recommender(catalog)
+                recommender.fit(records, version=version)
+            with self._lock:
+                self._local = _unacknowledged(self._local, committed)
+                for _, op, row in self._local:
+                    _apply(store, op, row, recommender)
+                self.catalog = catalog
+                self.store = store
+                self.recommender = recommender
+                self.version = version
+                self.stats["rebuilds"] += 1
+            return True
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="ratings-refresher", daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.refresh()
+            except Exception as e:  # 다음 주기에 다시 시도
+                self.last_error = e
+                self.stats["errors"] += 1
+
+    def _change(self, op, row):
+        seq = self.on_change(op, dict(row)) if self.on_change is not None else None
+        self._local.append((seq, op, dict(row)))
+
+    # 평점 추가, 저장한 레코드 반환 (GitHub 쪽과 같이 같은 사용자/영화 쌍이 이미 있으면 수정)
+    def append(self, username, movie, rating, review=None):
+        row = {'username': username, 'movie': movie, 'rating': float(rating), 'review': normalize_review(review)}
+        with self._lock:
+            self._change("upsert", row)
+            _apply(self.store, "upsert", row, self.recommender)
+        return row
+
+    # 사용자/영화 쌍의 평점/리뷰 수정, 없으면 None
+    def edit(self, username, movie, rating, review=None):
+        row = {'username': username, 'movie': movie, 'rating': float(rating), 'review': normalize_review(review)}
+        with self._lock:
+            rid = self.store.find(username, movie)
+            if rid is None:
+                return None
+            self._change("upsert", row)
+            self.store.edit(rid, row['rating'], row['review'])
+            if self.recommender is not None:
+                self.recommender.set_rating(username, movie, row['rating'])
+        return row
+
+    # 사용자/영화 쌍의 평점 삭제, 삭제한 레코드 반환 (없으면 None)
+    def delete(self, username, movie):
+        with self._lock:
+            rid = self.store.find(username, movie)
+            if rid is None:
+                return None
+            row = dict(self.store.get(rid))
+            self._change("delete", row)
+            self.store.delete(rid)
+            if self.recommender is not None:
+                self.recommender.remove_rating(username, movie)
+        return row
+
+
+# 키(사용자, 영화)별로 마지막으로 커밋이 확인된 변경까지 제거한 나머지
+# 그보다 앞의 변경은 커밋됐거나, 실패했어도 뒤의 커밋으로 덮어써졌으므로 다시 적용하지 않음 (쓰기 큐는 순서대로 커밋)
+def _unacknowledged(local, committed):
+    last = {}
+    for i, (seq, _, row) in enumerate(local):
+        if seq in committed:
+            last[(row['username'], row['movie'])] = i
+    return [
+        entry for i, entry in enumerate(local)
+        if i > last.get((entry[2]['username'], entry[2]['movie']), -1)
+    ]
+
+
+# 키(사용자, 영화) 기준 변경을 저장소(와 추천 모델)에 적용 (이미 반영된 변경을 다시 적용해도 결과가 같음)
+def _apply(store, op, row, recommender=None):
+    rid = store.find(row['username'], row['movie'])
+    if op == "upsert":
+        if rid is None:
+            store.append(row['username'], row['movie'], row['rating'], row.get('review'))
+        else:
+            store.edit(rid, row['rating'], row.get('review'))
+        if recommender is not None:
+            recommender.set_rating(row['username'], row['movie'], row['rating'])
+    elif op == "delete" and rid is not None:
+        store.delete(rid)
+        if recommender is not None:
+            recommender.remove_rating(row['username'], row['movie'])
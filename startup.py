@@ -0,0 +1,20 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+# 시작 시 GitHub 읽기(네트워크 대기)를 스레드 풀에서 동시에 시작
+# 작업 스레드는 여러 세션이 함께 쓰므로 ScriptRunContext를 붙이지 않음 (작업 안에서 st.* 출력 금지, 오류는 future로 받아 스크립트 스레드에서 표시)
+# max_workers=0이면 submit 시점에 호출한 스레드에서 바로 실행 (순차 로드)
+class StartupLoader:
+    def __init__(self, max_workers=4):
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix="startup") if max_workers > 0 else None
+
+    def submit(self, fn, *args):
+        if self._pool is None:
+            future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        return self._pool.submit(fn, *args)
@@ -0,0 +1,228 @@
+import abc
+import argparse
+import os
+import sqlite3
+import threading
+import time
+
+import pandas as pd
+
+from ratings_store import normalize_review
+
+USER_COLUMNS = ["username", "password", "role"]
+RATING_COLUMNS = ["username", "movie", "rating", "review"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    password TEXT NOT NULL,
+    role TEXT NOT NULL DEFAULT 'user'
+);
+CREATE TABLE IF NOT EXISTS ratings (
+    username TEXT NOT NULL,
+    movie TEXT NOT NULL,
+    rating REAL NOT NULL,
+    review TEXT,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (username, movie)
+);
+CREATE INDEX IF NOT EXISTS ratings_movie ON ratings (movie);
+"""
+
+
+def _user_row(user):
+    return (user["username"], user["password"], user.get("role") or "user")
+
+
+def _rating_row(rating):
+    return (rating["username"], rating["movie"], float(rating["rating"]), normalize_review(rating.get("review")))
+
+
+# 사용자명이 비어 있는 행 등은 건너뜀
+def _valid_users(users):
+    return [u for u in users if isinstance(u.get("username"), str) and isinstance(u.get("password"), str)]
+
+
+def _valid_ratings(ratings):
+    return [
+        r for r in ratings
+        if isinstance(r.get("username"), str) and isinstance(r.get("movie"), str) and pd.notna(r.get("rating"))
+    ]
+
+
+# 사용자/평점 저장소 인터페이스
+# 전체 읽기/쓰기(load_*/save_*)와 한 행 단위 변경(upsert_*/delete_*)을 제공
+class StorageBackend(abc.ABC):
+    @abc.abstractmethod
+    def load_users(self):
+        pass
+
+    @abc.abstractmethod
+    def save_users(self, users):
+        pass
+
+    @abc.abstractmethod
+    def upsert_user(self, user):
+        pass
+
+    @abc.abstractmethod
+    def load_ratings(self):
+        pass
+
+    @abc.abstractmethod
+    def save_ratings(self, ratings):
+        pass
+
+    @abc.abstractmethod
+    def upsert_rating(self, rating):
+        pass
+
+    @abc.abstractmethod
+    def delete_rating(self, username, movie):
+        pass
+
+    # CSV 내보내기 (GitHub 동기화용 파일과 같은 형식)
+    def export_csv(self, users_path, ratings_path):
+        pd.DataFrame(self.load_users(), columns=USER_COLUMNS).to_csv(users_path, index=False, encoding="cp949")
+        pd.DataFrame(self.load_ratings(), columns=RATING_COLUMNS).to_csv(ratings_path, index=False, encoding="utf-8")
+
+    # CSV 가져오기 (기존 데이터 교체)
+    def import_csv(self, users_path, ratings_path):
+        if os.path.exists(users_path):
+            self.save_users(pd.read_csv(users_path, encoding="cp949").to_dict("records"))
+        if os.path.exists(ratings_path):
+            self.save_ratings(pd.read_csv(ratings_path, encoding="utf-8").to_dict("records"))
+
+
+# 기존 방식: 변경할 때마다 CSV 파일 전체를 다시 씀
+class CSVStorage(StorageBackend):
+    def __init__(self, users_path="movie_users.csv", ratings_path="movie_ratings.csv"):
+        self.users_path = users_path
+        self.ratings_path = ratings_path
+
+    def load_users(self):
+        if os.path.exists(self.users_path):
+            return pd.read_csv(self.users_path, encoding="cp949").to_dict("records")
+        return []
+
+    def save_users(self, users):
+        pd.DataFrame(users).to_csv(self.users_path, index=False, encoding="cp949")
+
+    def upsert_user(self, user):
+        users = [u for u in self.load_users() if u.get("username") != user["username"]]
+        self.save_users(users + [dict(user)])
+
+    def load_ratings(self):
+        if os.path.exists(self.ratings_path):
+            return pd.read_csv(self.ratings_path, encoding="utf-8").to_dict("records")
+        return []
+
+    def save_ratings(self, ratings):
+        pd.DataFrame(ratings).to_csv(self.ratings_path, index=False, encoding="utf-8")
+
+    def upsert_rating(self, rating):
+        key = (rating["username"], rating["movie"])
+        ratings = [r for r in self.load_ratings() if (r["username"], r["movie"]) != key]
+        self.save_ratings(ratings + [dict(rating)])
+
+    def delete_rating(self, username, movie):
+        self.save_ratings([r for r in self.load_ratings() if (r["username"], r["movie"]) != (username, movie)])
+
+
+# SQLite(WAL 모드) 저장소: (username, movie) 고유 키로 한 행씩 upsert/delete
+class SQLiteStorage(StorageBackend):
+    def __init__(self, path="movie.db"):
+        self.path = path
+        self._local = threading.local()  # 스레드(세션)별 연결
+        with self._connect() as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def is_empty(self):
+        conn = self._connect()
+        users = conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+        ratings = conn.execute("SELECT COUNT(*) FROM ratings").fetchone()[0]
+        return users == 0 and ratings == 0
+
+    def load_users(self):
+        rows = self._connect().execute("SELECT username, password, role FROM users ORDER BY rowid")
+        return [dict(row) for row in rows]
+
+    def save_users(self, users):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM users")
+            conn.executemany(
+                "INSERT OR REPLACE INTO users (username, password, role) VALUES (?, ?, ?)",
+                [_user_row(u) for u in _valid_users(users)],
+            )
+
+    def upsert_user(self, user):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO users (username, password, role) VALUES (?, ?, ?) "
+                "ON CONFLICT (username) DO UPDATE SET password = excluded.password, role = excluded.role",
+                _user_row(user),
+            )
+
+    def load_ratings(self):
+        rows = self._connect().execute("SELECT username, movie, rating, review FROM ratings ORDER BY rowid")
+        return [dict(row) for row in rows]
+
+    def save_ratings(self, ratings):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("DELETE FROM ratings")
+            conn.executemany(
+                "INSERT OR REPLACE INTO ratings (username, movie, rating, review, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [_rating_row(r) + (now,) for r in _valid_ratings(ratings)],
+            )
+
+    def upsert_rating(self, rating):
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO ratings (username, movie, rating, review, updated_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (username, movie) DO UPDATE SET "
+                "rating = excluded.rating, review = excluded.review, updated_at = excluded.updated_at",
+                _rating_row(rating) + (time.time(),),
+            )
+
+    def delete_rating(self, username, movie):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM ratings WHERE username = ? AND movie = ?", (username, movie))
+
+
+# 기존 CSV를 SQLite로 옮김 (DB가 비어 있을 때만)
+def migrate_csv_to_sqlite(db_path="movie.db", users_path="movie_users.csv", ratings_path="movie_ratings.csv"):
+    storage = SQLiteStorage(db_path)
+    if storage.is_empty():
+        storage.import_csv(users_path, ratings_path)
+    return storage
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CSV <-> SQLite 저장소 변환")
+    parser.add_argument("command", choices=["migrate", "export"])
+    parser.add_argument("--db", default="movie.db")
+    parser.add_argument("--users", default="movie_users.csv")
+    parser.add_argument("--ratings", default="movie_ratings.csv")
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        storage = migrate_csv_to_sqlite(args.db, args.users, args.ratings)
+    else:
+        storage = SQLiteStorage(args.db)
+        storage.export_csv(args.users, args.ratings)
+    print(f"사용자 {len(storage.load_users())}명, 평점 {len(storage.load_ratings())}건")
+
+
+if __name__ == "__main__":
+    main()
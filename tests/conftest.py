@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.fake_github import FakeGitHub  # noqa: E402
+
+
+# 로컬 가짜 GitHub contents API (테스트마다 새 서버)
+@pytest.fixture
+def fake_github():
+    with FakeGitHub() as server:
+        yield server
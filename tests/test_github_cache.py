@@ -0,0 +1,84 @@
+import pytest
+
+from benchmarks.fake_github import CONTENT_LIMIT
+from github_cache import GitHubCSVCache
+from github_client import GitHubClient, GitHubError
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def client(fake_github):
+    return GitHubClient(fake_github.api_url, "test", max_retries=0)
+
+
+def test_fetch_reuses_parsed_frame(fake_github, client):
+    fake_github.files["movie_users.csv"] = b"username,password,role\nalice,x,user\n"
+    clock = Clock()
+    cache = GitHubCSVCache(client, ttl=30, clock=clock)
+
+    df, sha = cache.fetch("movie_users.csv")
+    assert df["username"].tolist() == ["alice"]
+    # TTL 안에서는 요청 없이 같은 DataFrame
+    assert cache.fetch("movie_users.csv")[0] is df
+    # TTL이 지나면 조건부 요청, 바뀌지 않았으면 다시 파싱하지 않음
+    clock.now = 31
+    assert cache.fetch("movie_users.csv") == (df, sha)
+    assert cache.stats == {"hits": 1, "requests": 2, "not_modified": 1, "parses": 1}
+    assert fake_github.counts["GET"] == 2 and fake_github.counts["304"] == 1
+
+
+def test_fetch_sees_own_write_after_invalidate(fake_github, client):
+    fake_github.files["movie_users.csv"] = b"username,password,role\nalice,x,user\n"
+    cache = GitHubCSVCache(client, ttl=30)
+    _, sha = cache.fetch("movie_users.csv")
+
+    new_sha = client.put_contents("movie_users.csv", "username,password,role\nbob,y,admin\n", sha, "update")
+    assert cache.fetch("movie_users.csv")[1] == sha  # TTL 안이라 아직 이전 내용
+    cache.invalidate("movie_users.csv")
+    df, fetched_sha = cache.fetch("movie_users.csv")
+    assert fetched_sha == new_sha
+    assert df.to_dict("records") == [{"username": "bob", "password": "y", "role": "admin"}]
+    assert cache.stats["parses"] == 2
+
+
+def test_known_sha_skips_request(fake_github, client):
+    fake_github.files["a.csv"] = b"x\n1\n"
+    cache = GitHubCSVCache(client, ttl=0)
+    _, sha = cache.fetch("a.csv")
+    cache.fetch("a.csv", sha)
+    assert fake_github.counts["GET"] == 1
+
+
+def test_large_file_is_read_from_blob(fake_github, client):
+    rows = "".join(f"user{i},movie{i},{i % 10}.5,리뷰 {i}\n" for i in range(40_000))
+    data = ("username,movie,rating,review\n" + rows).encode("utf-8")
+    assert len(data) > CONTENT_LIMIT
+    fake_github.files["movie_ratings.csv"] = data
+
+    df, _ = GitHubCSVCache(client).fetch("movie_ratings.csv")
+    assert len(df) == 40_000
+    assert fake_github.counts["BLOB"] == 1
+
+
+def test_empty_file_is_empty_frame(fake_github, client):
+    fake_github.files["empty.csv"] = b""
+    df, _ = GitHubCSVCache(client).fetch("empty.csv")
+    assert df.empty
+
+
+def test_unknown_encoding_is_github_error(client):
+    with pytest.raises(GitHubError):
+        client.file_content("movie_ratings.csv", {"sha": "0", "encoding": "utf-16", "content": ""})
+
+
+def test_missing_file_is_github_error(client):
+    with pytest.raises(GitHubError) as e:
+        GitHubCSVCache(client).fetch("missing.csv")
+    assert e.value.status_code == 404
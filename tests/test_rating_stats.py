@@ -0,0 +1,81 @@
+import random
+
+import numpy as np
+import pandas as pd
+
+from catalog import Catalog
+from rating_stats import RatingStats, top_k
+from ratings_store import RatingsStore
+from review_index import ReviewIndex
+
+
+def make_catalog(n):
+    return Catalog(pd.DataFrame({"title": [f"movie{i}" for i in range(n)]}))
+
+
+def test_top_k_matches_stable_sort():
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 5, 200).astype(float)
+    values[::17] = np.nan
+    expected = np.argsort(-np.nan_to_num(values, nan=-np.inf), kind="stable")
+    for k in (0, 1, 10, 200, 500):
+        assert top_k(values, k).tolist() == expected[:k].tolist()
+
+
+# 평점 추가/수정/삭제를 델타로 반영한 통계가 처음부터 다시 계산한 값과 같아야 함
+def test_delta_updates_match_recompute():
+    rng = random.Random(0)
+    catalog = make_catalog(30)
+    records = [
+        {"username": f"user{i % 40}", "movie": f"movie{rng.randrange(35)}", "rating": rng.uniform(0, 10),
+         "review": "리뷰" if i % 3 else None}
+        for i in range(500)
+    ]
+    store = RatingsStore(records, stats=RatingStats(catalog), reviews=ReviewIndex())
+    rids = [rid for rid, _ in store.items()]
+    for i in range(2000):
+        op = rng.random()
+        if op < 0.4 or not rids:
+            rids.append(store.append(f"new{i}", f"movie{rng.randrange(35)}", rng.uniform(0, 10), None if i % 2 else "새 리뷰"))
+        elif op < 0.8:
+            store.edit(rng.choice(rids), rng.uniform(0, 10), None if i % 5 else "수정")
+        else:
+            rid = rids.pop(rng.randrange(len(rids)))
+            store.delete(rid)
+
+    recomputed = RatingStats.from_records(catalog, store.to_records())
+    assert store.stats.matches(recomputed)
+    for title in catalog.titles:
+        rows = [r for r in store.to_records() if r["movie"] == title]
+        assert store.movie_count(title) == len(rows)
+        assert store.movie_review_count(title) == sum(r["review"] is not None for r in rows)
+        if rows:
+            assert np.isclose(store.movie_average(title), sum(r["rating"] for r in rows) / len(rows))
+        else:
+            assert store.movie_average(title) is None
+    # 카탈로그에 없는 영화는 평점이 없는 것으로 봄
+    assert store.movie_count("movie34") == 0 and store.movie_average("movie34") is None
+
+
+def test_removing_last_rating_resets_sums():
+    catalog = make_catalog(1)
+    store = RatingsStore(stats=RatingStats(catalog))
+    rid = store.append("alice", "movie0", 0.1)
+    store.edit(rid, 0.7)
+    store.delete(rid)
+    assert store.stats.sum[0] == 0.0 and store.stats.sumsq[0] == 0.0
+    assert store.movie_average("movie0") is None
+
+
+# 관리자 목록 페이지: 삭제로 rid가 비어 있어도 삽입 순서로 잘라 냄
+def test_items_pages_in_insertion_order():
+    store = RatingsStore([
+        {"username": f"user{i}", "movie": "movie0", "rating": 5.0} for i in range(10)
+    ], stats=RatingStats(make_catalog(1)))
+    store.delete(2)
+    store.delete(5)
+    everything = store.items()
+    assert [rid for rid, _ in everything] == [0, 1, 3, 4, 6, 7, 8, 9]
+    assert store.items(0, 3) == everything[:3]
+    assert store.items(3, 3) == everything[3:6]
+    assert store.items(6, 20) == everything[6:]
@@ -0,0 +1,123 @@
+import io
+import time
+
+import pandas as pd
+import pytest
+
+from benchmarks.fake_github import CONTENT_LIMIT
+from github_cache import GitHubCSVCache
+from github_client import GitHubClient
+from ratings_log import GitHubRatingsLog, shard_name
+from write_queue import KEY_COLUMNS, apply_mutations
+
+PATH = "movie_ratings.csv"
+KEYS = KEY_COLUMNS[PATH]
+
+
+def seed_csv(rows):
+    return "username,movie,rating,review\n" + "".join(
+        f"seed{i % 3000},movie{i % 2000},{i % 10}.5,review {i} {'긴 리뷰 ' * 3}\n" for i in range(rows)
+    )
+
+
+def mutation(i):
+    if i % 5 == 4:
+        return "delete", {"username": f"seed{i % 3000}", "movie": f"movie{i % 2000}"}
+    return "upsert", {"username": f"user{i}", "movie": f"movie{i % 50}", "rating": 7.5, "review": f"리뷰 {i}"}
+
+
+def canonical(df):
+    df = df[["username", "movie", "rating", "review"]].copy()
+    df["rating"] = df["rating"].astype(float)
+    return df.sort_values(["username", "movie"]).reset_index(drop=True)
+
+
+def make_log(server, ttl=0, shards=4):
+    client = GitHubClient(server.api_url, "test", max_retries=0)
+    return GitHubRatingsLog(client, GitHubCSVCache(client, ttl=ttl), ttl=ttl, shards=shards, compact_every=0)
+
+
+def server_shards(server):
+    return pd.concat(
+        [pd.read_csv(io.BytesIO(server.files[f"ratings_snapshot/{item['name']}"]))
+         for item in server.listing("ratings_snapshot")],
+        ignore_index=True,
+    )
+
+
+@pytest.fixture
+def seeded(fake_github):
+    seed = seed_csv(25_000)
+    assert len(seed.encode("utf-8")) > CONTENT_LIMIT  # contents API로는 내용을 받을 수 없는 크기
+    fake_github.files[PATH] = seed.encode("utf-8")
+    return fake_github, pd.read_csv(io.StringIO(seed))
+
+
+def test_load_merges_segments_over_large_snapshot(seeded):
+    server, base = seeded
+    log = make_log(server)
+    changes = [mutation(i) for i in range(12)]
+    for i in range(0, 12, 3):
+        log.append(changes[i:i + 3])
+
+    reader = make_log(server)
+    df, version = reader.load()
+    assert canonical(df).equals(canonical(apply_mutations(base, KEYS, changes)))
+    assert server.counts["BLOB"] >= 1
+    assert reader.load()[1] == version
+
+
+def test_compaction_shards_snapshot_and_only_rewrites_touched_shards(seeded):
+    server, base = seeded
+    log = make_log(server)
+    changes = [mutation(i) for i in range(20)]
+    log.append(changes)
+
+    # 목록만 받아 둔 다른 프로세스 (압축 뒤에 세그먼트가 사라져도 결과가 같아야 함)
+    stale = make_log(server, ttl=3600)
+    stale.load()
+
+    assert log.compact() == 1
+    expected = apply_mutations(base, KEYS, changes)
+    assert sorted(item["name"] for item in server.listing("ratings_snapshot")) == [shard_name(i) for i in range(4)]
+    assert server.listing("ratings_log") == []
+    assert canonical(server_shards(server)).equals(canonical(expected))
+    assert canonical(stale.load()[0]).equals(canonical(expected))
+    assert canonical(make_log(server).load()[0]).equals(canonical(expected))
+
+    # 한 사용자의 변경만 압축하면 조각 하나만 다시 올림
+    before = log.stats["shards_written"]
+    change = ("upsert", {"username": "late", "movie": "movie1", "rating": 1.0, "review": None})
+    log.append([change])
+    log.compact()
+    assert log.stats["shards_written"] == before + 1
+    assert canonical(make_log(server).load()[0]).equals(canonical(apply_mutations(expected, KEYS, [change])))
+
+
+def test_partial_shards_fall_back_to_legacy_snapshot(seeded):
+    server, base = seeded
+    server.files[f"ratings_snapshot/{shard_name(0)}"] = b"username,movie,rating,review\n"
+    df, _ = make_log(server).load()
+    assert canonical(df).equals(canonical(base))
+
+
+def test_load_keeps_write_order_across_compaction(fake_github):
+    fake_github.files[PATH] = seed_csv(40).encode("utf-8")
+    log = make_log(fake_github)
+    first = [mutation(i) for i in range(0, 8) if i % 5 != 4]
+    second = [("upsert", {"username": f"user{i}", "movie": "movie1", "rating": 5.0, "review": None}) for i in range(8, 14)]
+    log.append(first)
+    time.sleep(0.002)  # 세그먼트 이름(ms 시각)이 겹치지 않게
+    log.append(second)
+    expected = make_log(fake_github).load()[0]
+    # 조각을 이어 붙인 순서(사용자명 해시)가 아니라 기록 순서: 기존 파일 행, 첫 세그먼트, 둘째 세그먼트
+    assert list(expected["username"][-len(first) - len(second):]) == [row["username"] for _, row in first + second]
+
+    log.compact()
+    edit = ("upsert", {"username": "user1", "movie": "movie1", "rating": 2.0, "review": "수정"})
+    log.append([edit])
+    log.compact()
+    df = make_log(fake_github).load()[0]
+    assert list(df["username"]) == list(expected["username"])
+    assert list(df["movie"]) == list(expected["movie"])
+    assert df.loc[(df["username"] == "user1") & (df["movie"] == "movie1"), "review"].tolist() == ["수정"]
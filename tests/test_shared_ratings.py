@@ -0,0 +1,108 @@
+import pandas as pd
+
+from catalog import Catalog
+from recommender import Recommender
+from shared_ratings import SharedRatings
+from write_queue import apply_mutations
+
+KEYS = ("username", "movie")
+
+CATALOG = Catalog(pd.DataFrame({"title": [f"movie{i}" for i in range(10)]}))
+
+
+# GitHub 평점 흉내: 접수한 변경은 commit() 때 반영, fail()이면 최종 실패로 처리
+class FakeSource:
+    def __init__(self, records=()):
+        self.df = pd.DataFrame(list(records), columns=["username", "movie", "rating", "review"])
+        self.version = 0
+        self.seq = 0
+        self.pending = {}
+        self.done = set()
+
+    def fetch(self):
+        return self.df, str(self.version)
+
+    def submit(self, op, row):
+        self.seq += 1
+        self.pending[self.seq] = (op, row)
+        return self.seq
+
+    def committed(self, seq):
+        return seq in self.done
+
+    def commit(self, seq):
+        op, row = self.pending.pop(seq)
+        self.df = apply_mutations(self.df, KEYS, [(op, row)])
+        self.version += 1
+        self.done.add(seq)
+
+    def fail(self, seq):
+        self.pending.pop(seq)
+
+
+def rating(username, movie, value):
+    return {"username": username, "movie": movie, "rating": value, "review": None}
+
+
+def make_shared(source, **kwargs):
+    shared = SharedRatings(source.fetch, lambda: CATALOG, on_change=source.submit, committed=source.committed,
+                           **kwargs)
+    shared.refresh()
+    return shared
+
+
+# 새 저장소와 함께 학습한 추천 모델로 교체 (대기 중인 이 프로세스의 변경도 반영)
+def test_refresh_swaps_refitted_recommender():
+    source = FakeSource([rating("alice", "movie1", 9.0)])
+    shared = make_shared(source, recommender=Recommender)
+    first = shared.recommender
+    assert first.version == "0"
+    assert first.user_ratings[first.user_index["alice"]] == {1: 9.0}
+
+    shared.append("bob", "movie2", 8.0)
+    source.version += 1  # 다른 프로세스가 기록함
+    assert shared.refresh()
+    assert shared.recommender is not first and shared.recommender.version == "1"
+    assert shared.recommender.user_ratings[shared.recommender.user_index["bob"]] == {2: 8.0}
+
+
+def ratings_of(shared):
+    return {(row["username"], row["movie"]): row["rating"] for _, row in shared.store.items()}
+
+
+# 최종 실패한 변경은 GitHub 내용에 없어도 교체 뒤에 계속 보임
+def test_failed_change_stays_visible():
+    source = FakeSource([rating("alice", "movie1", 5.0)])
+    shared = make_shared(source)
+    shared.append("bob", "movie2", 7.0)
+    source.fail(1)
+    source.version += 1
+    assert shared.refresh()
+    assert ratings_of(shared) == {("alice", "movie1"): 5.0, ("bob", "movie2"): 7.0}
+    assert len(shared._local) == 1
+
+
+# 실패한 변경도 같은 키의 뒤 변경이 커밋되면 제거 (뒤 변경이 GitHub 내용에 들어 있음)
+def test_failed_change_is_dropped_once_superseded():
+    source = FakeSource()
+    shared = make_shared(source)
+    shared.append("bob", "movie2", 7.0)
+    source.fail(1)
+    shared.edit("bob", "movie2", 3.0)
+    source.commit(2)
+    assert shared.refresh()
+    assert ratings_of(shared) == {("bob", "movie2"): 3.0}
+    assert shared._local == []
+
+
+# 쓰기 큐가 계속 바빠도 커밋이 확인된 변경은 하나씩 제거 (뒤에 대기 중인 변경이 있어도)
+def test_local_changes_are_trimmed_while_queue_is_busy():
+    source = FakeSource()
+    shared = make_shared(source)
+    for i in range(5):
+        shared.append(f"user{i}", "movie1", float(i))
+        if i:
+            source.commit(i)  # 가장 최근 변경은 항상 대기 중
+        assert shared.refresh() == bool(i)
+        assert [row["username"] for _, _, row in shared._local] == [f"user{i}"]
+        assert ratings_of(shared) == {(f"user{j}", "movie1"): float(j) for j in range(i + 1)}
@@ -0,0 +1,42 @@
+import io
+
+import pandas as pd
+
+from github_cache import GitHubCSVCache
+from github_client import GitHubClient
+from write_queue import GitHubWriteQueue
+
+USERS = "movie_users.csv"
+
+
+def make_queue(server, **kwargs):
+    client = GitHubClient(server.api_url, "test", max_retries=0)
+    return GitHubWriteQueue(client, GitHubCSVCache(client, ttl=0), window=0, **kwargs)
+
+
+def test_batches_are_committed_and_acknowledged(fake_github):
+    fake_github.files[USERS] = b"username,password,role\nalice,x,user\n"
+    queue = make_queue(fake_github)
+    seqs = [queue.submit(USERS, "upsert", {"username": f"user{i}", "password": "p", "role": "user"}) for i in range(5)]
+    assert queue.flush(timeout=10)
+    assert all(queue.committed(seq) for seq in seqs)
+    df = pd.read_csv(io.BytesIO(fake_github.files[USERS]))
+    assert df["username"].tolist() == ["alice"] + [f"user{i}" for i in range(5)]
+
+
+def test_unexpected_error_is_retried_then_failed(fake_github):
+    class BrokenLog:
+        def append(self, mutations):
+            raise ValueError("broken")
+
+    queue = make_queue(fake_github, max_attempts=2, logs={"movie_ratings.csv": BrokenLog()})
+    seq = queue.submit("movie_ratings.csv", "upsert", {"username": "alice", "movie": "m"})
+    assert queue.flush(timeout=10)
+    assert queue.pending_count() == 0
+    assert not queue.committed(seq)
+    assert len(queue.failed) == 1 and isinstance(queue.last_error, ValueError)
+
+    # 작업 스레드는 계속 살아 있음
+    fake_github.files[USERS] = b"username,password,role\n"
+    seq = queue.submit(USERS, "upsert", {"username": "bob", "password": "p", "role": "user"})
+    assert queue.flush(timeout=10) and queue.committed(seq)
@@ -0,0 +1,131 @@
+import hashlib
+import hmac
+import os
+import threading
+
+SCRYPT_N, SCRYPT_R, SCRYPT_P = 2 ** 14, 8, 1
+
+
+# 솔트를 붙인 scrypt 해시 ("scrypt$n$r$p$솔트$해시")
+def hash_password(password, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P):
+    salt = os.urandom(16)
+    digest = hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p)
+    return f"scrypt${n}${r}${p}${salt.hex()}${digest.hex()}"
+
+
+# 비밀번호 확인, (일치 여부, 새 형식으로 다시 해시해야 하는지) 반환
+# 예전 형식(솔트 없는 sha256 hex)도 확인하고 일치하면 다시 해시하도록 알림
+def verify_password(password, stored):
+    if not isinstance(stored, str):
+        return False, False
+    if stored.startswith("scrypt$"):
+        try:
+            _, n, r, p, salt, digest = stored.split("$")
+            computed = hashlib.scrypt(password.encode(), salt=bytes.fromhex(salt), n=int(n), r=int(r), p=int(p))
+        except ValueError:
+            return False, False
+        return hmac.compare_digest(computed.hex(), digest), False
+    legacy = hashlib.sha256(password.encode()).hexdigest()
+    ok = hmac.compare_digest(legacy, stored)
+    return ok, ok
+
+
+def _normalize(record):
+    username, password = record.get("username"), record.get("password")
+    if not isinstance(password, str) or username is None or username != username:  # NaN 제외
+        return None
+    role = record.get("role")
+    return {"username": str(username), "password": password, "role": role if isinstance(role, str) else "user"}
+
+
+# 사용자명 -> 사용자 레코드 딕셔너리 (프로세스 전체 공유)
+# - add/set_password는 잠금 안에서 메모리 변경과 on_change(로컬 저장 + GitHub 반영 접수)를 함께 처리
+# - refresh()로 GitHub 목록을 다시 반영할 때, 아직 GitHub에 보이지 않는 이 프로세스의 변경은 유지
+# - 비밀번호 해시(scrypt)는 호출한 스레드에서 바로 계산 (GIL을 놓으므로 다른 세션의 rerun을 막지 않음)
+class UserDirectory:
+    def __init__(self, records=None, on_change=None):
+        self.on_change = on_change
+        self.version = None
+        self._lock = threading.Lock()
+        self._users = {}
+        self._local = {}  # GitHub 목록에 아직 반영되지 않은 변경: 사용자명 -> 레코드
+        self._dummy_hash = hash_password("")  # 없는 사용자도 같은 시간이 걸리도록
+        if records is not None:
+            self.refresh(records)
+
+    def refresh(self, records, version=None):
+        users = {}
+        for record in records:
+            user = _normalize(record)
+            if user is not None:
+                users[user["username"]] = user
+        with self._lock:
+            for username, user in list(self._local.items()):
+                if users.get(username) == user:
+                    del self._local[username]  # GitHub에 반영됨
+                else:
+                    users[username] = dict(user)
+            self._users = users
+            self.version = version
+
+    def __len__(self):
+        return len(self._users)
+
+    def __contains__(self, username):
+        return username in self._users
+
+    def get(self, username):
+        user = self._users.get(username)
+        return dict(user) if user is not None else None
+
+    # 관리자 보기용 사용자 목록
+    def records(self):
+        with self._lock:
+            return [dict(user) for user in self._users.values()]
+
+    def _commit(self, user, previous):
+        self._users[user["username"]] = user
+        self._local[user["username"]] = user
+        if self.on_change is None:
+            return
+        try:
+            self.on_change(dict(user))
+        except Exception:
+            if previous is None:
+                del self._users[user["username"]]
+            else:
+                self._users[user["username"]] = previous
+            self._local.pop(user["username"], None)
+            raise
+
+    # 새 사용자 추가, 이미 있으면 None
+    def add(self, username, password_hash, role="user"):
+        user = {"username": username, "password": password_hash, "role": role}
+        with self._lock:
+            if username in self._users:
+                return None
+            self._commit(user, None)
+        return dict(user)
+
+    def set_password(self, username, password_hash):
+        with self._lock:
+            previous = self._users.get(username)
+            if previous is None:
+                return None
+            user = dict(previous, password=password_hash)
+            self._commit(user, previous)
+        return dict(user)
+
+    def hash_password(self, password):
+        return hash_password(password)
+
+    # 로그인 확인, 성공하면 사용자 레코드 (예전 형식 해시는 새 형식으로 교체)
+    def authenticate(self, username, password):
+        user = self.get(username)
+        stored = user["password"] if user is not None else self._dummy_hash
+        ok, upgrade = verify_password(password, stored)
+        if not ok or user is None:
+            return None
+        if upgrade:
+            self.set_password(username, self.hash_password(password))
+        return user
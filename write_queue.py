@@ -0,0 +1,166 @@
+import threading
+import time
+
+import pandas as pd
+
+from github_client import GitHubError
+
+CONFLICT_STATUS = {409, 422}  # sha가 최신이 아닐 때 GitHub이 돌려주는 상태 코드
+
+# 파일별 행 식별 키
+KEY_COLUMNS = {
+    "movie_ratings.csv": ("username", "movie"),
+    "movie_users.csv": ("username",),
+}
+
+
+# 변경 내용(upsert/delete)을 기준 DataFrame에 적용, keep 컬럼은 이미 있는 행이면 덮어쓰지 않음
+def apply_mutations(df, key_columns, mutations, keep=()):
+    records = df.to_dict("records")
+    positions = {tuple(r.get(c) for c in key_columns): i for i, r in enumerate(records)}
+    columns = list(df.columns)
+    for op, row in mutations:
+        key = tuple(row.get(c) for c in key_columns)
+        pos = positions.get(key)
+        if op == "upsert":
+            for column in row:
+                if column not in columns:
+                    columns.append(column)
+            if pos is None:
+                positions[key] = len(records)
+                records.append(dict(row))
+            elif keep:
+                records[pos].update((column, value) for column, value in row.items() if column not in keep)
+            else:
+                records[pos].update(row)
+        elif op == "delete" and pos is not None:
+            records[pos] = None
+            del positions[key]
+    return pd.DataFrame([r for r in records if r is not None], columns=columns)
+
+
+# 평점/사용자 변경을 모아 짧은 간격마다 한 번의 커밋으로 GitHub에 쓰는 백그라운드 큐
+# - submit()은 바로 반환 (UI에는 즉시 접수 응답)
+# - window 초 동안 들어온 변경을 파일별로 하나의 커밋으로 합침
+# - sha 충돌 시 최신 파일을 다시 받아 변경을 다시 적용한 뒤 재시도
+# - logs에 등록된 경로(평점)는 파일 전체 대신 변경 로그 세그먼트로 기록
+# - submit()이 돌려주는 번호로 그 변경이 커밋됐는지 committed(seq)로 확인
+class GitHubWriteQueue:
+    def __init__(self, client, cache, window=2.0, max_conflict_retries=5, max_attempts=3, logs=None):
+        self.client = client
+        self.cache = cache
+        self.logs = logs or {}
+        self.window = window
+        self.max_conflict_retries = max_conflict_retries
+        self.max_attempts = max_attempts
+        self._pending = []  # (seq, path, op, row, attempts)
+        self._cond = threading.Condition()
+        self._busy = False
+        self._seq = 0
+        self._outstanding = set()  # 아직 커밋되지 않은 변경 번호
+        self._failed_seqs = set()  # 최종 실패한 변경 번호
+        self._thread = None
+        self.failed = []  # 최종 실패한 (path, op, row)
+        self.last_error = None
+        self.stats = {"submitted": 0, "commits": 0, "conflicts": 0, "failures": 0}
+
+    def _ensure_worker(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="github-write-queue", daemon=True)
+            self._thread.start()
+
+    # 변경 접수: op는 "upsert" 또는 "delete", row에는 최소한 키 컬럼이 있어야 함, 변경 번호 반환
+    def submit(self, path, op, row):
+        with self._cond:
+            self._seq += 1
+            self._pending.append((self._seq, path, op, dict(row), 0))
+            self._outstanding.add(self._seq)
+            self.stats["submitted"] += 1
+            self._ensure_worker()
+            self._cond.notify_all()
+            return self._seq
+
+    # 변경이 GitHub에 커밋됐는지 (대기 중이거나 최종 실패했으면 False)
+    def committed(self, seq):
+        with self._cond:
+            return seq not in self._outstanding and seq not in self._failed_seqs
+
+    def pending_count(self):
+        with self._cond:
+            return len(self._pending) + (1 if self._busy else 0)
+
+    # 대기 중인 변경이 모두 커밋될 때까지 대기, 제때 끝나면 True
+    def flush(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._pending or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.notify_all()
+                self._cond.wait(remaining)
+        return True
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+            # 변경을 모으는 시간
+            time.sleep(self.window)
+            with self._cond:
+                batch, self._pending = self._pending, []
+                self._busy = True
+            retry, done, failed = [], [], []
+            try:
+                by_path = {}
+                for seq, path, op, row, attempts in batch:
+                    by_path.setdefault(path, []).append((seq, op, row, attempts))
+                for path, items in by_path.items():
+                    try:
+                        self._commit(path, [(op, row) for _, op, row, _ in items])
+                    except Exception as e:  # GitHubError 외의 예외(CSV 파싱 오류 등)도 재시도/실패로 처리해 작업 스레드를 살려 둠
+                        self.last_error = e
+                        for seq, op, row, attempts in items:
+                            if attempts + 1 < self.max_attempts:
+                                retry.append((seq, path, op, row, attempts + 1))
+                            else:
+                                self.failed.append((path, op, row))
+                                failed.append(seq)
+                                self.stats["failures"] += 1
+                    else:
+                        done.extend(seq for seq, _, _, _ in items)
+            finally:
+                with self._cond:
+                    self._outstanding.difference_update(done)
+                    self._outstanding.difference_update(failed)
+                    self._failed_seqs.update(failed)
+                    self._pending = retry + self._pending
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _commit(self, path, mutations):
+        if path in self.logs:
+            self.logs[path].append(mutations)
+            self.stats["commits"] += 1
+            return
+        key_columns = KEY_COLUMNS[path]
+        for _ in range(self.max_conflict_retries + 1):
+            base, sha = self.cache.fetch(path)
+            df = apply_mutations(base, key_columns, mutations)
+            try:
+                self.client.put_contents(
+                    path, df.to_csv(index=False, encoding="utf-8"), sha,
+                    f"Update {path} ({len(mutations)} changes)",
+                )
+            except GitHubError as e:
+                if e.status_code not in CONFLICT_STATUS:
+                    raise
+                # 다른 writer가 먼저 커밋함: 최신 파일로 다시 병합
+                self.stats["conflicts"] += 1
+                self.cache.invalidate(path)
+                continue
+            self.cache.invalidate(path)
+            self.stats["commits"] += 1
+            return
+        raise GitHubError(path, 409)